@@ -0,0 +1,250 @@
+"""Microbenchmarks for the data layer: LogData, the log archive and config.
+
+Runs without the UI. Each corpus size is benchmarked in a fresh subprocess so
+that its peak RSS is not inflated by the sizes before it. Results are written
+as JSON and can be compared against a stored baseline:
+
+    uv run python benchmarks/bench_data.py --output baseline.json
+    uv run python benchmarks/bench_data.py --baseline baseline.json
+
+The second command exits with status 1 when any median latency or peak
+allocation regressed by more than --threshold. Pass --full to include a
+1M-log corpus; it takes several minutes and a few GB of memory.
+"""
+
+import argparse
+import dataclasses
+import itertools
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from corpus import make_corpus
+from harness import (
+    compare,
+    environment,
+    format_table,
+    load_report,
+    peak_rss_bytes,
+    time_calls,
+    trace_allocations,
+    write_report,
+)
+
+import wastelandhub.data.config as config_module
+from wastelandhub.data.archive import write_archive
+from wastelandhub.data.config import (
+    WastelandConfig,
+    get_config,
+    reset_config,
+    write_config_file,
+)
+from wastelandhub.data.log_data import ARCHIVE_NAME, LogData
+from wastelandhub.data.search_index import SearchIndex
+
+DEFAULT_SIZES = (10, 1_000, 100_000)
+FULL_SIZES = (*DEFAULT_SIZES, 1_000_000)
+QUERIES = ("reactor", "sec", "water filtration")
+
+
+def isolate(root: Path) -> None:
+    """Point config and data directories at root, away from the user's files."""
+    config_module.xdg_config_home = lambda: root / "config"
+    config_module.xdg_data_home = lambda: root / "data"
+    reset_config()
+    LogData.load_default.cache_clear()
+
+
+def bench(name: str, size: int, fn, samples: int, allocations: bool = True) -> dict:
+    result = {"name": name, "size": size}
+    result.update(time_calls(fn, samples=samples))
+    if allocations:
+        result.update(trace_allocations(fn))
+    return result
+
+
+def bench_config(root: Path, samples: int) -> list[dict]:
+    """Config file load/save and the get_config() hot path."""
+    isolate(root)
+    config = dataclasses.replace(WastelandConfig(), typewriter_cps=250)
+    path = config_module.config_path()
+    write_config_file(config, path)
+
+    def cold_get_config():
+        reset_config()
+        return get_config()
+
+    results = [
+        bench("config.from_file", 0, lambda: WastelandConfig.from_file(path), samples),
+        bench("config.load", 0, WastelandConfig.load, samples),
+        bench("config.save", 0, config.save, min(samples, 50)),
+        bench("config.get_config.cold", 0, cold_get_config, samples),
+        bench("config.get_config.warm", 0, get_config, samples),
+    ]
+    return results
+
+
+def bench_logs(size: int, root: Path, samples: int) -> list[dict]:
+    """LogData construction and lookups over a corpus of size logs."""
+    isolate(root)
+    logs = make_corpus(size)
+    archive_path = config_module.xdg_data_home() / "wastelandhub" / ARCHIVE_NAME
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    heavy = max(3, min(samples, 1_000_000 // size))
+
+    compressed_path = archive_path.with_name("compressed.whla")
+
+    def write_compressed():
+        write_archive(compressed_path, logs, compress=True)
+
+    results = [
+        bench("archive.write", size, lambda: write_archive(archive_path, logs), heavy),
+        bench("archive.write.compressed", size, write_compressed, min(heavy, 5)),
+    ]
+
+    def cold_load_default():
+        LogData.load_default.cache_clear()
+        return LogData.load_default()
+
+    results += [
+        bench("log_data.load_default.cold", size, cold_load_default, heavy),
+        bench("log_data.load_default.warm", size, LogData.load_default, samples),
+    ]
+
+    backends = {
+        "dict": LogData(logs=logs),
+        "archive": LogData.from_archive(archive_path),
+        "compressed": LogData.from_archive(compressed_path),
+    }
+    keys = list(itertools.islice(itertools.cycle(logs), 4096))
+    for backend, data in backends.items():
+        lookups = itertools.cycle(keys)
+        results += [
+            bench(
+                f"log_data.get_log.{backend}",
+                size,
+                lambda data=data: data.get_log(next(lookups)),
+                samples,
+                allocations=False,
+            ),
+            bench(
+                f"log_data.get_log.{backend}.missing",
+                size,
+                lambda data=data: data.get_log("NO_SUCH_LOG"),
+                samples,
+                allocations=False,
+            ),
+            bench(f"log_data.get_log_keys.{backend}", size, data.get_log_keys, heavy),
+        ]
+
+    index = SearchIndex.build(logs)
+    results.append(
+        bench(
+            "search_index.build", size, lambda: SearchIndex.build(logs), min(heavy, 5)
+        )
+    )
+    for query in QUERIES:
+        results.append(
+            bench(
+                f"search_index.search[{query}]",
+                size,
+                lambda q=query: index.search(q),
+                heavy,
+            )
+        )
+
+    backends["archive"].logs.close()
+    return results
+
+
+def run_worker(size: int, samples: int) -> dict:
+    """Benchmark one corpus size (0 means config) in this process."""
+    with tempfile.TemporaryDirectory(prefix="wastelandhub-bench-") as tmp:
+        if size == 0:
+            results = bench_config(Path(tmp), samples)
+        else:
+            results = bench_logs(size, Path(tmp), samples)
+    return {"size": size, "results": results, "peak_rss_bytes": peak_rss_bytes()}
+
+
+def run_subprocess(size: int, samples: int) -> dict:
+    command = [
+        sys.executable,
+        __file__,
+        "--worker",
+        str(size),
+        "--samples",
+        str(samples),
+    ]
+    output = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=list(DEFAULT_SIZES),
+        help="comma-separated corpus sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help=f"benchmark sizes {list(FULL_SIZES)}"
+    )
+    parser.add_argument(
+        "--samples", type=int, default=200, help="samples per benchmark"
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--baseline", type=Path, help="compare against this report")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown before a metric counts as a regression",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run every size in this process (peak RSS becomes cumulative)",
+    )
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(run_worker(args.worker, args.samples)))
+        return 0
+
+    sizes = list(FULL_SIZES) if args.full else args.sizes
+    run = run_worker if args.in_process else run_subprocess
+    report = {
+        "suite": "data",
+        "environment": environment(),
+        "results": [],
+        "peak_rss_bytes": {},
+    }
+    for size in [0, *sizes]:
+        print(
+            f"benchmarking {'config' if size == 0 else f'{size:,} logs'}...",
+            file=sys.stderr,
+        )
+        worker = run(size, args.samples)
+        report["results"] += worker["results"]
+        report["peak_rss_bytes"][str(size)] = worker["peak_rss_bytes"]
+
+    print(format_table(report["results"]), file=sys.stderr)
+    write_report(report, args.output)
+
+    if args.baseline is not None:
+        regressions = compare(report, load_report(args.baseline), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("no regressions against baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
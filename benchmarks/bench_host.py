@@ -0,0 +1,185 @@
+"""Memory per session of ``wastelandhub host`` against a standalone app.
+
+Starts one standalone app on a pseudo-terminal and a host with --sessions
+telnet clients, drives every app to the same state (logs menu, first log
+open) and reads each process's memory from /proc/<pid>/smaps_rollup:
+
+- uss: private pages, i.e. what the process costs on its own
+- pss: private pages plus its share of pages shared with other processes
+
+Logs come from a synthetic archive of --size entries (Linux only):
+
+    uv run python benchmarks/bench_host.py --sessions 8 --size 10000
+"""
+
+import argparse
+import os
+import pty
+import re
+import select
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import make_corpus
+from harness import environment, write_report
+
+from wastelandhub.data.archive import write_archive
+from wastelandhub.data.log_data import ARCHIVE_NAME
+from wastelandhub.host import IAC, NAWS, SB, SE, WILL, set_window_size
+
+TERMINAL_SIZE = (120, 40)
+KEYS = [b"\r", b"\r"]
+"""Enter on LOGS, then Enter on the first log."""
+SETTLE = 2.0
+"""Seconds to let each app draw after a key."""
+
+
+def memory(pid: int) -> dict[str, int]:
+    """RSS, PSS and USS of a process in bytes."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                fields[name] = int(value.split()[0]) * 1024
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def drain(fds: list, seconds: float) -> None:
+    """Read and discard output from sockets or fds for a while."""
+    end = time.monotonic() + seconds
+    while (left := end - time.monotonic()) > 0:
+        ready, _, _ = select.select(fds, [], [], left)
+        for fd in ready:
+            try:
+                if isinstance(fd, socket.socket):
+                    data = fd.recv(65536)
+                else:
+                    data = os.read(fd, 65536)
+            except OSError:
+                data = b""
+            if not data:
+                fds.remove(fd)
+        if not fds:
+            return
+
+
+def measure_standalone(env: dict[str, str]) -> dict[str, int]:
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.execvpe(sys.executable, [sys.executable, "-m", "wastelandhub.main"], env)
+    try:
+        set_window_size(fd, *TERMINAL_SIZE)
+        drain([fd], SETTLE * 2)
+        for key in KEYS:
+            os.write(fd, key)
+            drain([fd], SETTLE)
+        return memory(pid)
+    finally:
+        os.kill(pid, 9)
+        os.waitpid(pid, 0)
+        os.close(fd)
+
+
+def measure_host(env: dict[str, str], sessions: int) -> tuple[dict, list[dict]]:
+    host = subprocess.Popen(
+        [sys.executable, "-m", "wastelandhub.cli", "host", "--listen", "127.0.0.1:0"],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        for line in host.stderr:
+            match = re.search(r"on \('127.0.0.1', (\d+)\)", line)
+            if match:
+                port = int(match.group(1))
+                break
+        else:
+            raise RuntimeError("host did not start")
+
+        columns, rows = TERMINAL_SIZE
+        naws = bytes([IAC, WILL, NAWS, IAC, SB, NAWS])
+        naws += struct.pack(">HH", columns, rows) + bytes([IAC, SE])
+        clients = []
+        for _ in range(sessions):
+            client = socket.create_connection(("127.0.0.1", port))
+            client.sendall(naws)
+            clients.append(client)
+        drain(list(clients), SETTLE * 2)
+        for key in KEYS:
+            for client in clients:
+                client.sendall(key)
+            drain(list(clients), SETTLE)
+
+        with open(f"/proc/{host.pid}/task/{host.pid}/children") as f:
+            children = [int(pid) for pid in f.read().split()]
+        result = memory(host.pid), [memory(pid) for pid in children]
+        for client in clients:
+            client.close()
+        return result
+    finally:
+        host.terminate()
+        host.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8, help="concurrent sessions")
+    parser.add_argument("--size", type=int, default=10_000, help="logs in the archive")
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="wastelandhub-bench-") as tmp:
+        root = Path(tmp)
+        write_archive(
+            root / "data" / "wastelandhub" / ARCHIVE_NAME, make_corpus(args.size)
+        )
+        env = {
+            **os.environ,
+            "HOME": str(root),
+            "XDG_DATA_HOME": str(root / "data"),
+            "XDG_CONFIG_HOME": str(root / "config"),
+            "PYTHONPATH": os.pathsep.join(sys.path),
+            "TERM": "xterm-256color",
+        }
+        print("measuring a standalone app...", file=sys.stderr)
+        standalone = measure_standalone(env)
+        print(f"measuring {args.sessions} hosted sessions...", file=sys.stderr)
+        host, sessions = measure_host(env, args.sessions)
+
+    mib = 1024 * 1024
+    uss = sum(session["uss"] for session in sessions) / len(sessions)
+    pss = sum(session["pss"] for session in sessions) / len(sessions)
+    print(
+        f"standalone app       rss {standalone['rss'] / mib:7.1f} MiB"
+        f"  uss {standalone['uss'] / mib:7.1f} MiB\n"
+        f"host process         rss {host['rss'] / mib:7.1f} MiB"
+        f"  uss {host['uss'] / mib:7.1f} MiB\n"
+        f"per hosted session   pss {pss / mib:7.1f} MiB"
+        f"  uss {uss / mib:7.1f} MiB"
+        f"  ({uss / standalone['uss']:.0%} of a standalone app)",
+        file=sys.stderr,
+    )
+    report = {
+        "suite": "host",
+        "environment": environment(),
+        "size": args.size,
+        "standalone": standalone,
+        "host": host,
+        "sessions": sessions,
+    }
+    write_report(report, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
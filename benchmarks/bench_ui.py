@@ -0,0 +1,248 @@
+"""End-to-end UI latency replay for WastelandHubApp.
+
+Drives the app headlessly through run_test() and replays scripted key
+sequences as fast as the app accepts them (or at --rate keys per second).
+Keys are posted the way the terminal driver posts them rather than through
+Pilot.press(), which waits for the whole process to go idle and so would
+measure the typewriter and puzzle pool instead of the input path.
+For every key it records the time until the next completed screen render,
+and a probe task measures how late the event loop wakes up while the script
+runs. Logs come from a synthetic archive of --sizes entries each:
+
+    uv run python benchmarks/bench_ui.py --sizes 100,10000 --output ui.json
+    uv run python benchmarks/bench_ui.py --baseline ui.json
+
+Reports share the format of bench_data.py and are compared the same way.
+"""
+
+import argparse
+import asyncio
+import bisect
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from corpus import make_corpus
+from harness import (
+    compare,
+    environment,
+    format_table,
+    load_report,
+    summarize,
+    write_report,
+)
+from textual import events
+
+import wastelandhub.data.config as config_module
+from wastelandhub.data.archive import write_archive
+from wastelandhub.data.config import get_config, reset_config
+from wastelandhub.data.log_data import ARCHIVE_NAME, LogData
+from wastelandhub.data.log_store import get_log_store
+from wastelandhub.main import WastelandHubApp
+
+DEFAULT_SIZES = (100, 10_000)
+TERMINAL_SIZE = (120, 40)
+RENDER_TIMEOUT = 0.5
+"""Seconds to wait for a render before counting a key as having none."""
+LAG_PROBE_INTERVAL = 0.005
+KEY_CHARACTERS = {"enter": "\r", "tab": "\t", "escape": "\x1b", "slash": "/"}
+
+
+def logs_script(rows: int) -> list[str]:
+    """Open the logs menu, open each of the first rows logs in turn, go back."""
+    return ["enter", *["enter", "down"] * rows, "escape"]
+
+
+def search_script(rows: int) -> list[str]:
+    """Filter the sidebar by typing a query, open the first hit, go back."""
+    return ["enter", "slash", *"reactor", "enter", "enter", "escape"]
+
+
+def hacking_script(rows: int) -> list[str]:
+    """Open a terminal, cycle through the words guessing each, go back."""
+    return ["tab", "enter", *["right", "enter"] * 4, "n", "escape"]
+
+
+SCRIPTS: dict[str, Callable[[int], list[str]]] = {
+    "logs": logs_script,
+    "search": search_script,
+    "hacking": hacking_script,
+}
+
+
+def install_corpus(root: Path, size: int) -> None:
+    """Serve a synthetic archive of size logs from a private data directory."""
+    config_module.xdg_config_home = lambda: root / "config"
+    config_module.xdg_data_home = lambda: root / "data"
+    reset_config()
+    archive_path = get_config().data_dir / ARCHIVE_NAME
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    write_archive(archive_path, make_corpus(size))
+    LogData.load_default.cache_clear()
+    get_log_store().clear()
+
+
+class RenderProbe:
+    """Records when the app hands a rendered update to its driver."""
+
+    def __init__(self, app: WastelandHubApp) -> None:
+        self.renders: list[float] = []
+        self._rendered = asyncio.Event()
+        display = app._display
+
+        def record(screen, renderable) -> None:
+            display(screen, renderable)
+            if renderable is not None:
+                self.renders.append(time.perf_counter())
+                self._rendered.set()
+
+        app._display = record
+
+    async def next_render_after(self, start: float, timeout: float) -> float | None:
+        """Seconds from start to the first render after it, or None."""
+        deadline = start + timeout
+        while True:
+            index = bisect.bisect_left(self.renders, start)
+            if index < len(self.renders):
+                return self.renders[index] - start
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+            self._rendered.clear()
+            try:
+                await asyncio.wait_for(self._rendered.wait(), remaining)
+            except TimeoutError:
+                return None
+
+
+async def measure_loop_lag(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late each short sleep wakes up until stop is set."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - LAG_PROBE_INTERVAL)
+
+
+def key_event(app: WastelandHubApp, key: str) -> events.Key:
+    """Build the Key event a terminal would send for key."""
+    character = KEY_CHARACTERS.get(key, key if len(key) == 1 else None)
+    event = events.Key(key, character)
+    event.set_sender(app)
+    return event
+
+
+async def replay(keys: list[str], repeat: int, rate: float) -> dict:
+    """Replay keys repeat times and return per-key latencies and loop lag."""
+    app = WastelandHubApp()
+    latencies: list[float] = []
+    lags: list[float] = []
+    missed = 0
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        await pilot.pause()
+        probe = RenderProbe(app)
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(measure_loop_lag(lags, stop))
+        interval = 1 / rate if rate > 0 else 0.0
+        for _ in range(repeat):
+            for key in keys:
+                start = time.perf_counter()
+                app.post_message(key_event(app, key))
+                # Let the screen finish handling the key so the next one goes
+                # to the widget the script expects
+                await pilot._wait_for_screen()
+                latency = await probe.next_render_after(start, RENDER_TIMEOUT)
+                if latency is None:
+                    missed += 1
+                else:
+                    latencies.append(latency)
+                idle = interval - (time.perf_counter() - start)
+                if idle > 0:
+                    await asyncio.sleep(idle)
+        stop.set()
+        await lag_task
+    return {"latencies": latencies, "lags": lags, "missed": missed}
+
+
+def run_scenario(
+    name: str, size: int, rows: int, repeat: int, rate: float
+) -> list[dict]:
+    keys = SCRIPTS[name](min(rows, size))
+    started = time.perf_counter()
+    outcome = asyncio.run(replay(keys, repeat, rate))
+    elapsed = time.perf_counter() - started
+
+    to_ns = [seconds * 1e9 for seconds in outcome["latencies"]] or [0.0]
+    latency = {"name": f"ui.{name}.input_to_render", "size": size}
+    latency.update(summarize(to_ns))
+    latency["inputs"] = len(keys) * repeat
+    latency["no_render"] = outcome["missed"]
+    latency["inputs_per_second"] = latency["inputs"] / elapsed
+
+    lag = {"name": f"ui.{name}.loop_lag", "size": size}
+    lag.update(summarize([seconds * 1e9 for seconds in outcome["lags"]] or [0.0]))
+    return [latency, lag]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=list(DEFAULT_SIZES),
+        help="comma-separated log corpus sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: value.split(","),
+        default=list(SCRIPTS),
+        help="comma-separated scripts to replay (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=50, help="logs opened per pass of 'logs'"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="passes per script")
+    parser.add_argument(
+        "--rate", type=float, default=0, help="keys per second (0: as fast as possible)"
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    parser.add_argument("--baseline", type=Path, help="compare against this report")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown before a metric counts as a regression",
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCRIPTS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = {"suite": "ui", "environment": environment(), "results": []}
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="wastelandhub-bench-") as tmp:
+            install_corpus(Path(tmp), size)
+            for name in args.scenarios:
+                print(f"replaying {name} with {size:,} logs...", file=sys.stderr)
+                report["results"] += run_scenario(
+                    name, size, args.rows, args.repeat, args.rate
+                )
+            LogData.load_default().logs.close()
+
+    print(format_table(report["results"]), file=sys.stderr)
+    write_report(report, args.output)
+
+    if args.baseline is not None:
+        regressions = compare(report, load_report(args.baseline), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("no regressions against baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,44 @@
+"""Synthetic terminal log corpora for benchmarks."""
+
+import random
+
+SENDERS = ["jcurtis", "overseer", "maintenance", "security", "research", "admin"]
+PRIORITIES = ["LOW", "NORMAL", "HIGH", "URGENT"]
+SUBJECTS = [
+    "FUSION CELL STOCK",
+    "REACTOR STATUS",
+    "DOOR CONTROL SYSTEM",
+    "SECURITY ALERT LOG",
+    "SYSTEM DIAGNOSTIC REPORT",
+    "PROJECT PURITY - STATUS UPDATE",
+]
+WORDS = (
+    "reactor power sector vault radiation water filtration door access "
+    "terminal security breach ghoul mutant supply stock caps maintenance "
+    "protocol override emergency broadcast simulation settlement trial"
+).split()
+
+
+def make_log(rng: random.Random, index: int, body_lines: int = 6) -> str:
+    """Build one log in the style of LogData's built-in logs."""
+    sender = rng.choice(SENDERS)
+    hour, minute, second = rng.randrange(24), rng.randrange(60), rng.randrange(60)
+    lines = [
+        f">> RE: {rng.choice(SUBJECTS)} #{index}",
+        f"FROM: {sender.upper()} <{sender}@robco.net>",
+        "TO: MaintenanceTeam <maintenance@robco.net>",
+        f"PRIORITY: {rng.choice(PRIORITIES)}",
+        f"Time: {hour:02d}:{minute:02d}:{second:02d}",
+        "",
+    ]
+    for _ in range(body_lines):
+        words = rng.choices(WORDS, k=rng.randrange(6, 14))
+        lines.append(" ".join(words).capitalize() + ".")
+    lines.append(f"- {sender[:2].upper()}")
+    return "\n".join(lines)
+
+
+def make_corpus(size: int, seed: int = 0, body_lines: int = 6) -> dict[str, str]:
+    """Return ``size`` synthetic logs keyed LOG_0000000, LOG_0000001, ..."""
+    rng = random.Random(seed)
+    return {f"LOG_{i:07d}": make_log(rng, i, body_lines) for i in range(size)}
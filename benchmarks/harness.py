@@ -0,0 +1,168 @@
+"""Shared helpers for the benchmark scripts: timing, statistics and baselines."""
+
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples_ns: Sequence[float]) -> dict[str, float]:
+    """Latency distribution of per-call samples, in nanoseconds."""
+    values = sorted(samples_ns)
+    return {
+        "samples": len(values),
+        "min_ns": values[0],
+        "p50_ns": percentile(values, 0.50),
+        "p95_ns": percentile(values, 0.95),
+        "p99_ns": percentile(values, 0.99),
+        "max_ns": values[-1],
+        "mean_ns": sum(values) / len(values),
+    }
+
+
+def time_calls(
+    fn: Callable[[], object],
+    samples: int = 200,
+    min_sample_ns: int = 20_000,
+    max_total_ns: int = 2_000_000_000,
+) -> dict[str, float]:
+    """Time fn and return the distribution of its per-call latency.
+
+    Calls that are faster than ``min_sample_ns`` are batched so the timer's
+    own overhead does not dominate; each sample is then the mean of a batch.
+    Sampling stops early once ``max_total_ns`` has been spent.
+    """
+    # Calibrate the batch size, timeit-style
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= min_sample_ns or number >= 1 << 20:
+            break
+        number *= 2
+
+    values = []
+    deadline = time.perf_counter_ns() + max_total_ns
+    for _ in range(samples):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        end = time.perf_counter_ns()
+        values.append((end - start) / number)
+        if end > deadline:
+            break
+    result = summarize(values)
+    result["batch"] = number
+    return result
+
+
+def trace_allocations(fn: Callable[[], object]) -> dict[str, int]:
+    """Peak and retained bytes allocated by a single call of fn."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"alloc_peak_bytes": peak - before, "alloc_retained_bytes": current - before}
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def environment() -> dict[str, str]:
+    """Describe the machine so results from different hosts can be told apart."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+# --- Baselines ---
+
+COMPARED_METRICS = ("p50_ns", "alloc_peak_bytes")
+
+
+def result_key(result: dict) -> tuple[str, int]:
+    return result["name"], result.get("size", 0)
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return a line per metric that regressed by more than threshold.
+
+    Both arguments are benchmark reports as written by write_report; results
+    present in only one of them are ignored.
+    """
+    previous = {result_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in result or not old.get(metric):
+                continue
+            ratio = result[metric] / old[metric]
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{result['name']} [{result.get('size', '-')}] {metric}: "
+                    f"{old[metric]:,.0f} -> {result[metric]:,.0f} ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def load_report(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_report(report: dict, path: Path | None) -> None:
+    """Write a report as JSON to path, or to stdout when path is None."""
+    data = json.dumps(report, indent=2)
+    if path is None:
+        print(data)
+    else:
+        Path(path).write_text(data + "\n", encoding="utf-8")
+
+
+def format_table(results: Sequence[dict]) -> str:
+    """Human-readable summary of benchmark results."""
+    lines = [f"{'benchmark':<40} {'size':>9} {'p50':>11} {'p95':>11} {'p99':>11}"]
+    for result in results:
+        lines.append(
+            f"{result['name']:<40} {result.get('size', 0):>9,} "
+            f"{_format_ns(result['p50_ns']):>11} {_format_ns(result['p95_ns']):>11} "
+            f"{_format_ns(result['p99_ns']):>11}"
+        )
+    return "\n".join(lines)
+
+
+def _format_ns(value: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f} {unit}"
+    return f"{value:.0f} ns"
@@ -0,0 +1,351 @@
+"""Command line entry point for WastelandHub.
+
+Without a subcommand this starts the terminal UI. The ``logs`` subcommands
+read the log store and write to stdout without importing Textual, so they
+start quickly and can be used from scripts:
+
+    wastelandhub logs list [--search QUERY]
+    wastelandhub logs show KEY
+    wastelandhub logs export [--format jsonl]
+    wastelandhub logs build-archive [--input FEED.jsonl] [--compress]
+
+``wastelandhub import DIR`` packs a directory of log files into the archive,
+and ``wastelandhub host`` serves one terminal session per telnet connection.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+EXPORT_FORMATS = ("jsonl",)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser for the application and its subcommands."""
+    parser = argparse.ArgumentParser(prog="wastelandhub")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="report a timed breakdown of application startup and exit",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    logs = commands.add_parser("logs", help="read logs without starting the UI")
+    logs_commands = logs.add_subparsers(dest="logs_command", metavar="ACTION")
+    logs_commands.required = True
+
+    list_parser = logs_commands.add_parser("list", help="print every log key")
+    list_parser.add_argument(
+        "--search", metavar="QUERY", help="only keys of logs matching QUERY"
+    )
+    list_parser.set_defaults(handler=list_logs)
+
+    show_parser = logs_commands.add_parser("show", help="print one log")
+    show_parser.add_argument("key", help="key of the log to print")
+    show_parser.set_defaults(handler=show_log)
+
+    export_parser = logs_commands.add_parser("export", help="print every log")
+    export_parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="jsonl",
+        help="output format (default: %(default)s)",
+    )
+    export_parser.set_defaults(handler=export_logs)
+
+    archive_parser = logs_commands.add_parser(
+        "build-archive", help="pack logs into an archive and report its size"
+    )
+    archive_parser.add_argument(
+        "--input",
+        type=Path,
+        metavar="FEED",
+        help="JSONL file of {key, text} records (default: the current logs)",
+    )
+    archive_parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="PATH",
+        help="archive to write (default: the archive in the data directory)",
+    )
+    archive_parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="deflate each log against a dictionary trained on the logs",
+    )
+    archive_parser.set_defaults(handler=build_archive)
+
+    import_parser = commands.add_parser(
+        "import", help="import a directory of log files into the log archive"
+    )
+    import_parser.add_argument(
+        "source",
+        type=Path,
+        metavar="DIR",
+        help="directory of *.log and *.txt files, searched recursively",
+    )
+    import_parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="PATH",
+        help="archive to merge into (default: the archive in the data directory)",
+    )
+    import_parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="worker processes (default: one per CPU)",
+    )
+    import_parser.add_argument(
+        "--compress",
+        action=argparse.BooleanOptionalAction,
+        help="deflate logs (default: as the existing archive, or compressed)",
+    )
+    import_parser.set_defaults(handler=import_logs)
+
+    host = commands.add_parser(
+        "host", help="serve one terminal session per telnet connection"
+    )
+    host.add_argument(
+        "--listen",
+        default="127.0.0.1:2323",
+        metavar="ADDRESS",
+        help='"HOST:PORT", or a path for a Unix socket (default: %(default)s)',
+    )
+    host.add_argument(
+        "--max-sessions",
+        type=int,
+        default=32,
+        help="refuse connections beyond this many sessions (default: %(default)s)",
+    )
+    host.add_argument(
+        "--size",
+        type=_terminal_size,
+        default="80x24",
+        metavar="COLSxROWS",
+        help="terminal size until the client reports its own (default: 80x24)",
+    )
+    host.add_argument(
+        "--allow-remote",
+        action="store_true",
+        help="allow a --listen address other machines can reach (telnet is"
+        " unencrypted)",
+    )
+    host.add_argument(
+        "--no-index",
+        action="store_true",
+        help="do not build the shared search index before the first session",
+    )
+    host.set_defaults(handler=run_host)
+    return parser
+
+
+def _terminal_size(value: str) -> tuple[int, int]:
+    columns, _, rows = value.partition("x")
+    try:
+        return int(columns), int(rows)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected COLSxROWS, got {value!r}")
+
+
+def run_host(args: argparse.Namespace) -> int:
+    """Host terminal sessions until interrupted."""
+    from wastelandhub.host import serve
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    try:
+        serve(
+            args.listen,
+            args.max_sessions,
+            args.size,
+            not args.no_index,
+            args.allow_remote,
+        )
+    except ValueError as e:
+        print(f"wastelandhub: {e}; pass --allow-remote to serve it", file=sys.stderr)
+        return 1
+    return 0
+
+
+def import_logs(args: argparse.Namespace) -> int:
+    """Import a directory of log files and report throughput."""
+    from wastelandhub.data.bulk_import import import_directory
+
+    try:
+        result = import_directory(
+            args.source, args.output, args.workers, args.compress
+        )
+    except (OSError, ValueError) as e:
+        print(f"wastelandhub: cannot import {args.source}: {e}", file=sys.stderr)
+        return 1
+    for path, reason in result.failed:
+        print(f"wastelandhub: skipped {path}: {reason}", file=sys.stderr)
+    _write_lines(
+        [
+            f"Imported {result.imported} logs ({result.replaced} replaced)"
+            f" into {result.archive}, {result.total} logs in total",
+            f"  read       {_format_bytes(result.raw_bytes)}"
+            f" with {result.workers} worker{'s' if result.workers > 1 else ''}"
+            f"{', compressed' if result.compressed else ''}",
+            f"  time       {result.seconds:.2f} s,"
+            f" {result.records_per_second:,.0f} records/s,"
+            f" {result.raw_bytes / max(result.seconds, 1e-9) / 1e6:.1f} MB/s",
+        ]
+    )
+    return 0 if not result.failed else 1
+
+
+# --- logs subcommands ---
+
+
+def list_logs(args: argparse.Namespace) -> int:
+    """Print log keys, one per line."""
+    from wastelandhub.data.log_store import get_log_store
+
+    store = get_log_store()
+    keys = store.iter_keys() if args.search is None else store.search(args.search)
+    _write_lines(keys)
+    return 0
+
+
+def show_log(args: argparse.Namespace) -> int:
+    """Print the text of one log."""
+    from wastelandhub.data.log_store import get_log_store
+
+    store = get_log_store()
+    if args.key not in store:
+        print(f"wastelandhub: no log with key {args.key!r}", file=sys.stderr)
+        return 1
+    _write_lines([store.get_log(args.key)])
+    return 0
+
+
+def export_logs(args: argparse.Namespace) -> int:
+    """Print every log as one JSON object per line, in store order."""
+    from wastelandhub.data.log_store import get_log_store
+
+    records = (
+        json.dumps({"key": key, "text": text}, ensure_ascii=False)
+        for key, text in get_log_store().iter_logs()
+    )
+    _write_lines(records)
+    return 0
+
+
+def build_archive(args: argparse.Namespace) -> int:
+    """Write an archive, then report its compression ratio and decode speed."""
+    from wastelandhub.data.archive import LogArchive, sample_logs, write_archive
+    from wastelandhub.data.config import get_config
+    from wastelandhub.data.log_data import ARCHIVE_NAME
+
+    if args.input is None:
+        from wastelandhub.data.log_store import get_log_store
+
+        logs = dict(get_log_store().iter_logs())
+    else:
+        try:
+            logs = _read_jsonl(args.input)
+        except (OSError, ValueError) as e:
+            print(f"wastelandhub: cannot read {args.input}: {e}", file=sys.stderr)
+            return 1
+    output = args.output or get_config().data_dir / ARCHIVE_NAME
+
+    start = time.perf_counter()
+    try:
+        write_archive(output, logs, compress=args.compress)
+    except ValueError as e:
+        print(f"wastelandhub: cannot write {output}: {e}", file=sys.stderr)
+        return 1
+    write_seconds = time.perf_counter() - start
+    raw_bytes = sum(len(text.encode("utf-8")) for text in logs.values())
+
+    with LogArchive(output) as archive:
+        start = time.perf_counter()
+        decoded = [len(text.encode("utf-8")) for text in sample_logs(archive, 10_000)]
+        decode_seconds = max(time.perf_counter() - start, 1e-9)
+        dict_bytes = len(archive.zdict or b"")
+    archive_bytes = output.stat().st_size
+
+    _write_lines(
+        [
+            f"Wrote {len(logs)} logs to {output} in {write_seconds:.2f} s",
+            f"  raw        {_format_bytes(raw_bytes)}",
+            f"  archive    {_format_bytes(archive_bytes)}"
+            f" (ratio {raw_bytes / max(archive_bytes, 1):.2f}x,"
+            f" dictionary {_format_bytes(dict_bytes)})",
+            f"  decode     {sum(decoded) / decode_seconds / 1e6:.1f} MB/s,"
+            f" {len(decoded) / decode_seconds:,.0f} logs/s",
+        ]
+    )
+    return 0
+
+
+def _read_jsonl(path: Path) -> dict[str, str]:
+    """Read {key, text} records; later records with the same key win."""
+    from wastelandhub.data.ingest import parse_record
+
+    logs: dict[str, str] = {}
+    with open(path, "rb") as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                try:
+                    key, text = parse_record(line)
+                except ValueError as e:
+                    raise ValueError(f"line {number}: {e}") from e
+                logs[key] = text
+    return logs
+
+
+def _format_bytes(size: float) -> str:
+    if size < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        size /= 1024
+        if size < 1024 or unit == "GiB":
+            break
+    return f"{size:.1f} {unit}"
+
+
+def _write_lines(lines: Iterable[str]) -> None:
+    """Stream lines to stdout without holding them all in memory."""
+    write = sys.stdout.write
+    for line in lines:
+        write(line)
+        write("\n")
+    sys.stdout.flush()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the UI or a subcommand and return the exit status."""
+    args = build_parser().parse_args(argv)
+
+    if args.command in ("host", "import"):
+        return args.handler(args)
+
+    if args.command == "logs":
+        try:
+            return args.handler(args)
+        except BrokenPipeError:
+            # The reader went away (e.g. `| head`); silence the flush at exit
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return 1
+
+    if args.profile_startup:
+        from wastelandhub.profiling import profile_startup_in_subprocess
+
+        return profile_startup_in_subprocess()
+
+    from wastelandhub.main import WastelandHubApp
+
+    WastelandHubApp().run()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,8 @@
 """Data management module for WastelandHub."""
 
+from .archive import LogArchive
 from .config import WastelandConfig
 from .log_data import LogData
+from .log_store import LogStore
 
-__all__ = ["WastelandConfig", "LogData"]
+__all__ = ["WastelandConfig", "LogArchive", "LogData", "LogStore"]
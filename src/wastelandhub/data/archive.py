@@ -0,0 +1,288 @@
+"""Packed, memory-mapped on-disk log archive.
+
+Layout (all integers little-endian)::
+
+    header   magic "WHLA" | version u16 | flags u16 | count u32 | index_offset u64
+    zdict    dict_len u32 | preset dictionary          (FLAG_DEFLATE only)
+    bodies   record bodies, back to back
+    index    count x (key_len u16 | key UTF-8 | offset u64 | length u32)
+
+Bodies are UTF-8, or with FLAG_DEFLATE each body is a raw deflate stream
+compressed on its own against the shared preset dictionary, so any record can
+still be decoded without touching the others. Compressed archives are written
+as version 2; plain archives stay version 1.
+
+The index is read once when the archive is opened. Record bodies stay on disk
+and are paged in by the OS only when a log is actually read.
+"""
+
+import mmap
+import os
+import re
+import struct
+import zlib
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import islice
+from pathlib import Path
+
+MAGIC = b"WHLA"
+VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+
+FLAG_DEFLATE = 0x1
+"""Bodies are raw deflate streams compressed with the archive's dictionary."""
+
+DICTIONARY_SIZE = 32 * 1024
+"""Largest useful preset dictionary: the size of the deflate window."""
+
+MAX_KEY_BYTES = 0xFFFF
+"""Longest key the index can hold, in UTF-8 bytes (its length is a u16)."""
+
+_HEADER = struct.Struct("<4sHHIQ")
+_DICT_LEN = struct.Struct("<I")
+_KEY_LEN = struct.Struct("<H")
+_LOCATION = struct.Struct("<QI")
+_WBITS = -15  # Raw deflate: no zlib header or checksum per record
+_WORD = re.compile(rb"[A-Za-z]{4,}[^A-Za-z]?")
+_MAX_PREFIX = 24
+
+
+def train_dictionary(samples: Iterable[str], size: int = DICTIONARY_SIZE) -> bytes:
+    """Build a preset deflate dictionary from sample log bodies.
+
+    Whole lines, ``Header: `` prefixes and words are scored by the number of
+    samples they appear in times their length; the best-scoring ones that fit
+    in ``size`` bytes are kept, most valuable last since deflate reaches the
+    end of the dictionary with the shortest distances.
+    """
+    counts: Counter[bytes] = Counter()
+    for text in samples:
+        data = text.encode("utf-8")
+        seen: set[bytes] = set()
+        for line in data.splitlines(keepends=True):
+            seen.add(line)
+            head, sep, _ = line.partition(b": ")
+            if sep and len(head) <= _MAX_PREFIX:
+                seen.add(head + sep)
+        seen.update(_WORD.findall(data))
+        counts.update(seen)
+
+    candidates = sorted(
+        ((count * len(piece), piece) for piece, count in counts.items() if count > 1),
+        reverse=True,
+    )
+    chosen: list[bytes] = []
+    total = 0
+    for _, piece in candidates:
+        if total + len(piece) <= size:
+            chosen.append(piece)
+            total += len(piece)
+    chosen.reverse()
+    return b"".join(chosen)
+
+
+def sample_logs(logs: Mapping[str, str], limit: int = 2000) -> Iterator[str]:
+    """Yield up to ``limit`` bodies spread evenly across logs."""
+    step = max(1, len(logs) // limit)
+    for key in islice(logs, 0, None, step):
+        yield logs[key]
+
+
+def body_encoder(zdict: bytes | None, level: int = 9) -> Callable[[str], bytes]:
+    """Return a function encoding a log body as stored in an archive.
+
+    Bodies are deflated against ``zdict``, or stored as plain UTF-8 if it is
+    None.
+    """
+    if zdict is None:
+        return lambda body: body.encode("utf-8")
+    primed = zlib.compressobj(level, zlib.DEFLATED, _WBITS, zdict=zdict)
+
+    def encode(body: str) -> bytes:
+        compressor = primed.copy()  # Cheaper than loading zdict again
+        return compressor.compress(body.encode("utf-8")) + compressor.flush()
+
+    return encode
+
+
+def _encode_key(key: str) -> bytes:
+    """UTF-8 bytes of key, which must fit the index's u16 length field."""
+    encoded = key.encode("utf-8")
+    if len(encoded) > MAX_KEY_BYTES:
+        raise ValueError(
+            f"Log key {key[:40]!r}... is {len(encoded)} bytes; archive keys"
+            f" are limited to {MAX_KEY_BYTES}"
+        )
+    return encoded
+
+
+def write_archive(
+    path: Path,
+    logs: Mapping[str, str],
+    compress: bool = False,
+    zdict: bytes | None = None,
+    level: int = 9,
+) -> None:
+    """Write logs to a packed archive at path, replacing any existing file.
+
+    With ``compress``, each body is deflated against a preset dictionary,
+    trained from a sample of logs unless ``zdict`` is given.
+
+    Raises:
+        ValueError: If a key is longer than MAX_KEY_BYTES, before anything
+            is written.
+    """
+    for key in logs:
+        _encode_key(key)
+    if compress:
+        if zdict is None:
+            zdict = train_dictionary(sample_logs(logs))
+    else:
+        zdict = None
+    encode = body_encoder(zdict, level)
+    write_encoded_archive(
+        path, ((key, encode(body)) for key, body in logs.items()), zdict
+    )
+
+
+def write_encoded_archive(
+    path: Path, records: Iterable[tuple[str, bytes]], zdict: bytes | None = None
+) -> int:
+    """Write (key, encoded body) records to an archive at path.
+
+    Bodies must already be encoded with body_encoder(zdict). The archive is
+    written to a temporary file and renamed over path once complete. Returns
+    the number of records written.
+
+    Raises:
+        ValueError: If a key is longer than MAX_KEY_BYTES; path is left as
+            it was.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    if zdict is None:
+        version, flags = 1, 0
+    else:
+        version, flags = VERSION, FLAG_DEFLATE
+
+    index = bytearray()
+    count = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, version, flags, 0, 0))
+            offset = _HEADER.size
+            if zdict is not None:
+                f.write(_DICT_LEN.pack(len(zdict)))
+                f.write(zdict)
+                offset += _DICT_LEN.size + len(zdict)
+            for key, data in records:
+                encoded_key = _encode_key(key)
+                f.write(data)
+                index += _KEY_LEN.pack(len(encoded_key))
+                index += encoded_key
+                index += _LOCATION.pack(offset, len(data))
+                offset += len(data)
+                count += 1
+            f.write(index)
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, version, flags, count, offset))
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+    return count
+
+
+class LogArchive(Mapping[str, str]):
+    """Read-only mapping of log key to body, backed by a memory-mapped archive.
+
+    Compressed bodies are decoded one record at a time, on access.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.zdict: bytes | None = None
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._index = self._read_index()
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def _read_index(self) -> dict[str, tuple[int, int]]:
+        """Parse the header and index into a key -> (offset, length) dict."""
+        buf = self._mmap
+        if len(buf) < _HEADER.size:
+            raise ValueError(f"{self.path} is too small to be a log archive")
+        magic, version, flags, count, index_offset = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a log archive")
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported log archive version {version}")
+        if flags & FLAG_DEFLATE:
+            try:
+                (dict_len,) = _DICT_LEN.unpack_from(buf, _HEADER.size)
+            except struct.error as e:
+                raise ValueError(f"{self.path} has a truncated dictionary") from e
+            start = _HEADER.size + _DICT_LEN.size
+            self.zdict = bytes(buf[start : start + dict_len])
+
+        index: dict[str, tuple[int, int]] = {}
+        pos = index_offset
+        try:
+            for _ in range(count):
+                (key_len,) = _KEY_LEN.unpack_from(buf, pos)
+                pos += _KEY_LEN.size
+                key = buf[pos : pos + key_len].decode("utf-8")
+                pos += key_len
+                index[key] = _LOCATION.unpack_from(buf, pos)
+                pos += _LOCATION.size
+        except struct.error as e:
+            raise ValueError(f"{self.path} has a truncated index") from e
+        return index
+
+    @property
+    def compressed(self) -> bool:
+        """True if bodies are deflated against a preset dictionary."""
+        return self.zdict is not None
+
+    def __getitem__(self, key: str) -> str:
+        offset, length = self._index[key]
+        data = self._mmap[offset : offset + length]
+        if self.zdict is not None:
+            decompressor = zlib.decompressobj(_WBITS, zdict=self.zdict)
+            data = decompressor.decompress(data) + decompressor.flush()
+        return data.decode("utf-8")
+
+    def encoded(self, key: str) -> bytes:
+        """The body of a log as stored, without decoding it."""
+        offset, length = self._index[key]
+        return self._mmap[offset : offset + length]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self) -> Iterable[str]:
+        """Return a view of the archived log keys without touching any bodies."""
+        return self._index.keys()
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._mmap.close()
+
+    def __enter__(self) -> "LogArchive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
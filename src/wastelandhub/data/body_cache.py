@@ -0,0 +1,12 @@
+"""LRU cache of decoded log bodies, kept within a byte budget."""
+
+import sys
+
+from .lru import ByteBudgetLRU
+
+
+class BodyCache(ByteBudgetLRU[str, str]):
+    """Decoded log bodies keyed by log key, sized by the memory of the strings."""
+
+    def sizeof(self, value: str) -> int:
+        return sys.getsizeof(value)
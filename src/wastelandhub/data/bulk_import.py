@@ -0,0 +1,269 @@
+"""Parallel bulk import of a directory of log files into the log archive.
+
+Reading, normalizing and compressing each file is independent of every other
+file, so the files are split into batches and handed to a process pool. The
+parent only trains the compression dictionary (from a sample of files),
+collects the encoded bodies and writes the merged archive once at the end.
+The log store is then reset so it, and its indexes, reload from the new
+archive.
+"""
+
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+
+from .archive import (
+    LogArchive,
+    body_encoder,
+    train_dictionary,
+    write_encoded_archive,
+)
+from .config import get_config
+from .log_data import ARCHIVE_NAME, LogData
+from .log_store import get_log_store
+
+SUFFIXES = (".log", ".txt")
+"""File types imported from a directory."""
+
+DICTIONARY_SAMPLES = 500
+"""Files read to train the compression dictionary of a new archive."""
+
+_BOM = "\ufeff"
+
+# Encoder of the current worker process, set up by _init_worker
+_encode = None
+
+
+@dataclass(frozen=True)
+class ImportResult:
+    """What an import wrote and how long it took."""
+
+    imported: int
+    """Logs read from files (new or replacing a log with the same key)."""
+    replaced: int
+    """Imported logs whose key was already in the archive."""
+    total: int
+    """Logs in the archive after the import."""
+    failed: list[tuple[Path, str]]
+    """Files that could not be read or were skipped, with the reason."""
+    raw_bytes: int
+    """Size of the imported logs after normalization, in UTF-8."""
+    seconds: float
+    workers: int
+    archive: Path
+    compressed: bool
+
+    @property
+    def records_per_second(self) -> float:
+        return self.imported / max(self.seconds, 1e-9)
+
+
+def find_log_files(source: Path) -> list[tuple[str, Path]]:
+    """(key, path) of every log file under source, sorted by key then path.
+
+    The key is the path relative to source without its suffix, so files that
+    differ only by suffix share a key (see unique_keys). Hidden files and
+    directories are skipped.
+    """
+    files = []
+    for directory, subdirectories, names in os.walk(source):
+        subdirectories[:] = [
+            name for name in subdirectories if not name.startswith(".")
+        ]
+        for name in names:
+            if name.startswith(".") or not name.endswith(SUFFIXES):
+                continue
+            path = Path(directory, name)
+            key = path.relative_to(source).with_suffix("").as_posix()
+            files.append((key, path))
+    files.sort()
+    return files
+
+
+def unique_keys(
+    files: list[tuple[str, Path]],
+) -> tuple[list[tuple[str, Path]], list[tuple[Path, str]]]:
+    """Keep the first file of each key, as sorted by find_log_files().
+
+    Returns the files to import and (path, reason) for every file skipped
+    because an earlier one has the same key.
+    """
+    unique: list[tuple[str, Path]] = []
+    skipped: list[tuple[Path, str]] = []
+    for key, path in files:
+        if unique and unique[-1][0] == key:
+            skipped.append((path, f"same key {key!r} as {unique[-1][1]}"))
+        else:
+            unique.append((key, path))
+    return unique, skipped
+
+
+def normalize(data: bytes) -> str:
+    """Decode a log file and normalize its text.
+
+    Invalid UTF-8 is replaced rather than rejected, a byte order mark is
+    dropped, line endings become "\\n" and trailing whitespace is removed from
+    every line and from the end of the log.
+    """
+    text = data.decode("utf-8", errors="replace").removeprefix(_BOM)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).rstrip()
+
+
+def _init_worker(zdict: bytes | None) -> None:
+    global _encode
+    _encode = body_encoder(zdict)
+
+
+def _import_batch(
+    batch: list[tuple[str, Path]],
+) -> list[tuple[str, bytes | None, int | str]]:
+    """Read, normalize and encode a batch of files in a worker process.
+
+    Returns (key, encoded body, raw size) per file, or (key, None, error).
+    """
+    results = []
+    for key, path in batch:
+        try:
+            text = normalize(Path(path).read_bytes())
+        except OSError as e:
+            results.append((key, None, str(e)))
+            continue
+        results.append((key, _encode(text), len(text.encode("utf-8"))))
+    return results
+
+
+def _batches(
+    files: list[tuple[str, Path]], workers: int
+) -> Iterator[list[tuple[str, Path]]]:
+    # Several batches per worker keep them all busy until the end
+    size = max(1, min(512, len(files) // (workers * 8)))
+    it = iter(files)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _run_batches(
+    files: list[tuple[str, Path]], zdict: bytes | None, workers: int
+) -> Iterator[list[tuple[str, bytes | None, int | str]]]:
+    """Import batches of files on a pool of worker processes, in order."""
+    batches = _batches(files, workers)
+    if workers == 1:
+        _init_worker(zdict)
+        yield from map(_import_batch, batches)
+        return
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(zdict,)
+    ) as pool:
+        yield from pool.map(_import_batch, batches)
+
+
+def _train(files: list[tuple[str, Path]]) -> bytes:
+    """Train a compression dictionary on files spread evenly across the import."""
+    step = max(1, len(files) // DICTIONARY_SAMPLES)
+    samples = []
+    for _, path in files[::step]:
+        try:
+            samples.append(normalize(path.read_bytes()))
+        except OSError:
+            pass
+    return train_dictionary(samples)
+
+
+def import_directory(
+    source: Path,
+    archive_path: Path | None = None,
+    workers: int | None = None,
+    compress: bool | None = None,
+) -> ImportResult:
+    """Import every log file under source into the archive at archive_path.
+
+    Logs already in the archive (or the built-in logs, if there is no
+    archive yet) are kept, and imported logs with the same key replace them.
+    ``compress`` defaults to the existing archive's format, or to compressed
+    for a new archive. ``workers`` defaults to the number of CPUs.
+    """
+    start = time.perf_counter()
+    source = Path(source)
+    if not source.is_dir():
+        raise NotADirectoryError(f"{source} is not a directory")
+    archive_path = Path(archive_path or get_config().data_dir / ARCHIVE_NAME)
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    existing = LogArchive(archive_path) if archive_path.exists() else None
+    try:
+        if compress is None:
+            compress = existing is None or existing.compressed
+        files, failed = unique_keys(find_log_files(source))
+        if not compress:
+            zdict = None
+        elif existing is not None and existing.compressed:
+            zdict = existing.zdict  # Existing bodies are copied as they are
+        else:
+            zdict = _train(files)
+
+        imported: dict[str, bytes] = {}
+        raw_bytes = 0
+        paths = dict(files)
+        for batch in _run_batches(files, zdict, workers):
+            for key, data, size in batch:
+                if data is None:
+                    failed.append((paths[key], size))
+                else:
+                    imported[key] = data
+                    raw_bytes += size
+
+        base = existing if existing is not None else LogData.builtin().logs
+        count = len(imported)
+        replaced = sum(1 for key in imported if key in base)
+        # One write of the whole merged archive, replacing the old one
+        total = write_encoded_archive(
+            archive_path, _merge(base, imported, zdict), zdict
+        )
+    finally:
+        if existing is not None:
+            existing.close()
+
+    # The store and its indexes reload from the new archive on next use
+    LogData.load_default.cache_clear()
+    get_log_store().clear()
+    return ImportResult(
+        imported=count,
+        replaced=replaced,
+        total=total,
+        failed=failed,
+        raw_bytes=raw_bytes,
+        seconds=time.perf_counter() - start,
+        workers=workers,
+        archive=archive_path,
+        compressed=zdict is not None,
+    )
+
+
+def _merge(
+    base: LogArchive | dict[str, str],
+    imported: dict[str, bytes],
+    zdict: bytes | None,
+) -> Iterator[tuple[str, bytes]]:
+    """Existing logs in their order (imported ones in their place), then new ones.
+
+    Existing bodies already encoded with zdict are copied without decoding.
+    Consumes ``imported``.
+    """
+    if isinstance(base, LogArchive) and base.zdict == zdict:
+        existing = base.encoded
+    else:
+        encode = body_encoder(zdict)
+
+        def existing(key: str) -> bytes:
+            return encode(base[key])
+
+    for key in base.keys():
+        data = imported.pop(key, None)
+        yield key, existing(key) if data is None else data
+    yield from imported.items()
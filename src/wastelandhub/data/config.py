@@ -1,8 +1,13 @@
 """Configuration management for WastelandHub."""
 
 import json
-from dataclasses import dataclass
-from functools import lru_cache
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
 
 try:
@@ -16,40 +21,122 @@ except ImportError:
         return Path.home() / ".local" / "share"
 
 
-@dataclass
+log = logging.getLogger(__name__)
+
+
+def config_path() -> Path:
+    """Get the path of the configuration file."""
+    return xdg_config_home() / "wastelandhub" / "config.json"
+
+
+def write_config_file(config: "WastelandConfig", path: Path | None = None) -> None:
+    """Atomically write config to path.
+
+    The JSON is written to a temporary file in the same directory, fsynced and
+    renamed over the target, so a crash leaves either the old or the new file
+    and never a truncated one.
+    """
+    path = config_path() if path is None else Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(asdict(config), indent=2)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    # Persist the rename itself
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+@dataclass(frozen=True)
 class WastelandConfig:
-    """Configuration for WastelandHub application."""
+    """Configuration for WastelandHub application.
+
+    Instances are immutable snapshots; to change a setting, build a new
+    instance (e.g. with dataclasses.replace) and save or publish it.
+    """
     typewriter_cps: int = 100
     terminal_difficulty: int = 50
     default_user: str = "guest"
     theme: str = "robco_green"
     enable_sound: bool = False
     auto_save_logs: bool = True
+    ingest_path: str = ""
+    """Spool directory or JSONL file to stream new logs from ("" disables)."""
+    crt_effects: bool = False
+    """Draw CRT scanlines and the phosphor glow of freshly typed text."""
+    crt_flicker: bool = False
+    """Make the screen brightness flicker (repaints several times a second)."""
+    body_cache_bytes: int = 16 * 1024 * 1024
+    """Memory for recently read logs decoded from the archive (0 disables)."""
+
+    def __post_init__(self) -> None:
+        for field in fields(self):
+            value = getattr(self, field.name)
+            expected = type(field.default)
+            # bool is an int subclass, so compare exact types
+            if type(value) is not expected:
+                raise ValueError(
+                    f"{field.name} must be {expected.__name__}, got {value!r}"
+                )
+        if self.typewriter_cps <= 0:
+            raise ValueError("typewriter_cps must be positive")
+        if self.body_cache_bytes < 0:
+            raise ValueError("body_cache_bytes must not be negative")
+
+    @classmethod
+    def from_file(cls, path: Path) -> "WastelandConfig":
+        """Read and validate a configuration file.
+
+        Unknown keys are ignored and missing keys take their defaults.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not valid JSON or a value is invalid.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("Configuration must be a JSON object")
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
     @classmethod
     def load(cls) -> "WastelandConfig":
         """Load configuration from file."""
-        config_path = xdg_config_home() / "wastelandhub" / "config.json"
-        if config_path.exists():
+        path = config_path()
+        if path.exists():
             try:
-                with open(config_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                    return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
-            except (json.JSONDecodeError, TypeError):
+                return cls.from_file(path)
+            except (OSError, ValueError):
                 # Return default config if file is corrupted
                 pass
         return cls()
 
     def save(self) -> None:
-        """Save configuration to file and invalidate cache."""
-        config_path = xdg_config_home() / "wastelandhub" / "config.json"
-        config_path.parent.mkdir(parents=True, exist_ok=True)
+        """Save configuration to file and publish it as the current config.
+
+        This blocks on disk I/O; UI code should use ConfigPersister instead.
+        """
+        write_config_file(self)
 
-        with open(config_path, 'w', encoding="utf-8") as f:
-            json.dump(self.__dict__, f, indent=2)
-        
-        # Invalidate cache so next get_config() reads fresh data
-        get_config.cache_clear()
+        # Next get_config() returns this snapshot without reading the disk
+        publish_config(self)
 
     @property
     def config_dir(self) -> Path:
@@ -62,10 +149,162 @@ class WastelandConfig:
         return xdg_data_home() / "wastelandhub"
 
 
-@lru_cache(maxsize=1)
+ConfigCallback = Callable[[WastelandConfig], None]
+
+
+class ConfigStore:
+    """Holds the current configuration snapshot.
+
+    Reading the snapshot only dereferences an attribute. Publishing swaps the
+    reference in one assignment (atomic under the GIL) and then notifies
+    subscribers on the publishing thread.
+    """
+
+    def __init__(self) -> None:
+        self._config: WastelandConfig | None = None
+        self._lock = threading.Lock()
+        self._subscribers: list[ConfigCallback] = []
+
+    def get(self) -> WastelandConfig:
+        """Return the current snapshot, loading it on first use."""
+        config = self._config
+        if config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = WastelandConfig.load()
+                config = self._config
+        return config
+
+    def publish(self, config: WastelandConfig) -> None:
+        """Make config the current snapshot and notify subscribers if it changed."""
+        with self._lock:
+            previous, self._config = self._config, config
+            subscribers = list(self._subscribers)
+        if config != previous:
+            for callback in subscribers:
+                callback(config)
+
+    def subscribe(self, callback: ConfigCallback) -> Callable[[], None]:
+        """Call callback with each new snapshot. Returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def clear(self) -> None:
+        """Forget the snapshot so the next get() reloads from disk."""
+        self._config = None
+
+
+_store = ConfigStore()
+
+
 def get_config() -> WastelandConfig:
-    """Get the global configuration instance (cached for performance).
-    
-    Note: Cache is automatically invalidated when save() is called.
+    """Get the current configuration snapshot.
+
+    This never touches the disk once loaded; changes arrive through save(),
+    publish_config() or a running ConfigWatcher.
     """
-    return WastelandConfig.load()
+    return _store.get()
+
+
+def reset_config() -> None:
+    """Forget the current snapshot so the next get_config() reloads from disk."""
+    _store.clear()
+
+
+def publish_config(config: WastelandConfig) -> None:
+    """Replace the current configuration snapshot."""
+    _store.publish(config)
+
+
+def subscribe_config(callback: ConfigCallback) -> Callable[[], None]:
+    """Subscribe to configuration changes. Returns an unsubscribe function."""
+    return _store.subscribe(callback)
+
+
+class ConfigPersister:
+    """Write-behind persistence for configuration changes.
+
+    save() publishes the new snapshot immediately and hands the write to a
+    background thread, which waits ``delay`` seconds so that a burst of
+    saves is coalesced into a single write of the latest config.
+    """
+
+    def __init__(self, path: Path | None = None, delay: float = 0.25) -> None:
+        self.path = path
+        self.delay = delay
+        self.writes = 0
+        """Number of files written, for tests and diagnostics."""
+        self._pending: WastelandConfig | None = None
+        self._condition = threading.Condition()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def save(self, config: WastelandConfig) -> None:
+        """Publish config and schedule it to be written. Never blocks on I/O."""
+        publish_config(config)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("ConfigPersister is closed")
+            self._pending = config
+            self._idle.clear()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="config-persister", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every scheduled save is on disk. Returns False on timeout."""
+        return self._idle.wait(timeout)
+
+    async def flush(self) -> None:
+        """Wait for pending saves without blocking the event loop."""
+        if not self._idle.is_set():
+            import asyncio  # Only needed from the UI; keeps the CLI import cheap
+
+            await asyncio.to_thread(self._idle.wait)
+
+    def close(self) -> None:
+        """Write any pending save and stop the background thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                # Give rapid successive saves a chance to replace this one
+                deadline = time.monotonic() + self.delay
+                while not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                config, self._pending = self._pending, None
+
+            try:
+                write_config_file(config, self.path)
+                self.writes += 1
+            except OSError:
+                log.exception("Failed to save configuration")
+
+            with self._condition:
+                if self._pending is None:
+                    self._idle.set()
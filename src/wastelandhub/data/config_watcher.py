@@ -0,0 +1,180 @@
+"""Hot-reloading of the configuration file."""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+
+from .config import WastelandConfig, config_path, publish_config
+
+log = logging.getLogger(__name__)
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _open_inotify(directory: Path) -> int | None:
+    """Return an inotify fd watching directory, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class ConfigWatcher:
+    """Reload the configuration file in the background whenever it changes.
+
+    Uses inotify on the config directory where available (so atomic
+    rename-over writes are seen) and falls back to polling the file's stat.
+    If the directory does not exist yet, it is polled for until it appears
+    and then watched with inotify.
+    Valid files are published as the new snapshot via publish_config();
+    invalid ones are logged and the previous snapshot is kept.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        self.path = Path(path) if path is not None else config_path()
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._stop = threading.Event()
+        self._wake_r, self._wake_w = -1, -1
+        self._thread: threading.Thread | None = None
+        self._signature = self._stat_signature()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run, name="config-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and wait for the thread to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        os.write(self._wake_w, b"\0")
+        self._thread.join()
+        self._thread = None
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def check(self) -> bool:
+        """Reload if the file changed since the last check. Returns True if reloaded."""
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        self._reload()
+        return True
+
+    def _stat_signature(self) -> tuple[int, int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _reload(self) -> None:
+        if not self.path.exists():
+            publish_config(WastelandConfig())
+            return
+        try:
+            config = WastelandConfig.from_file(self.path)
+        except (OSError, ValueError) as e:
+            log.warning("Ignoring invalid config %s: %s", self.path, e)
+            return
+        publish_config(config)
+
+    def _run(self) -> None:
+        directory = self.path.parent
+        while not self._stop.is_set():
+            fd = _open_inotify(directory) if self.use_inotify else None
+            if fd is not None:
+                try:
+                    self._watch(fd)
+                finally:
+                    os.close(fd)
+                return
+            # Without a directory to watch, poll until it is created
+            if not self._poll(until_exists=self.use_inotify and not directory.is_dir()):
+                return
+
+    def _poll(self, until_exists: bool = False) -> bool:
+        """Fallback: compare the file's stat signature every poll_interval.
+
+        With until_exists, returns True once the config directory exists;
+        otherwise polls until stopped and returns False.
+        """
+        while not self._stop.is_set():
+            self.check()
+            if until_exists and self.path.parent.is_dir():
+                return True
+            select.select([self._wake_r], [], [], self.poll_interval)
+        return False
+
+    def _watch(self, fd: int) -> None:
+        """Block on inotify events for the config directory."""
+        name = os.fsencode(self.path.name)
+        # Catch anything written before the watch was added
+        self.check()
+        while not self._stop.is_set():
+            # The timeout also covers the directory being replaced wholesale
+            ready, _, _ = select.select([fd, self._wake_r], [], [], 30.0)
+            if fd not in ready:
+                self.check()
+                continue
+            try:
+                data = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            if name in self._event_names(data):
+                self.check()
+
+    @staticmethod
+    def _event_names(data: bytes) -> set[bytes]:
+        names = set()
+        pos = 0
+        while pos + _EVENT_HEADER.size <= len(data):
+            _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, pos)
+            pos += _EVENT_HEADER.size
+            names.add(data[pos : pos + length].rstrip(b"\0"))
+            pos += length
+        return names
@@ -0,0 +1,236 @@
+"""Streaming ingestion of new terminal logs while the app runs.
+
+Logs arrive either as files dropped into a spool directory (one log per
+file, keyed by file name) or as records appended to a JSONL feed, one
+``{"key": ..., "text": ...}`` object per line. Sources remember how far
+they have read (a byte offset, or the newest file taken from the spool), so
+each poll only reads new data and their state does not grow with the feed.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from .log_store import LogStore, get_log_store
+
+log = logging.getLogger(__name__)
+
+Record = tuple[str, str]
+
+
+def parse_record(line: bytes) -> Record:
+    """Parse one JSONL line into (key, text).
+
+    Raises:
+        ValueError: If the line is not a JSON object with string key and text.
+    """
+    data = json.loads(line)
+    if not isinstance(data, dict):
+        raise ValueError("Record must be a JSON object")
+    key, text = data.get("key"), data.get("text")
+    if not isinstance(key, str) or not key or not isinstance(text, str):
+        raise ValueError("Record needs a non-empty string 'key' and a string 'text'")
+    return key, text
+
+
+class JsonlSource:
+    """Tails an append-only JSONL file from the last byte offset read.
+
+    Only complete lines are consumed; a partially written last line is read
+    again once its newline arrives. A line longer than ``chunk_size`` is
+    logged and skipped up to its newline. If the file is replaced or
+    truncated, reading starts over from the beginning of the new file.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = 4 * 1024 * 1024) -> None:
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.offset = 0
+        self._inode: int | None = None
+        self._skipping = False  # Inside an oversized line
+
+    def read(self) -> list[Record]:
+        """Return the records appended since the last read (at most one chunk)."""
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != self._inode or st.st_size < self.offset:
+                    self._inode, self.offset = st.st_ino, 0
+                    self._skipping = False
+                if st.st_size == self.offset:
+                    return []
+                f.seek(self.offset)
+                data = f.read(self.chunk_size)
+        except FileNotFoundError:
+            return []
+
+        start = 0
+        if self._skipping:
+            start = data.find(b"\n") + 1
+            if start == 0:
+                self.offset += len(data)
+                return []
+            self._skipping = False
+
+        end = data.rfind(b"\n") + 1
+        if end <= start:
+            self.offset += start
+            if len(data) < self.chunk_size:
+                return []  # Wait for the rest of the line
+            if start:
+                return self.read()  # Read the line again from its start
+            # A single line longer than a chunk; skip to its end, not stall
+            log.warning(
+                "Skipping record longer than %d bytes at %s:%d",
+                self.chunk_size,
+                self.path,
+                self.offset,
+            )
+            self._skipping = True
+            self.offset += len(data)
+            return []
+
+        records = []
+        for line in data[start:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(parse_record(line))
+            except ValueError as e:
+                log.warning("Skipping invalid record in %s: %s", self.path, e)
+        self.offset += end
+        return records
+
+
+class SpoolSource:
+    """Reads each new file in a spool directory once, oldest first.
+
+    The log key is the file name without its suffix. Files whose names start
+    with a dot are ignored, so writers can create a hidden temporary file and
+    rename it into place when it is complete.
+
+    Files are taken in order of status change time, which a rename updates.
+    Rather than every name it has read, the source remembers a time before
+    which every file has been taken, plus the names taken since. The
+    directory is not scanned again until its modification time changes.
+    """
+
+    SETTLE_NS = 1_000_000_000
+    """Age after which a file time is final: nothing created later can get
+    the same timestamp, however coarse the file system's clock."""
+
+    def __init__(self, path: Path, suffix: str = ".log") -> None:
+        self.path = Path(path)
+        self.suffix = suffix
+        self._mark = 0  # Every file changed before this ctime has been taken
+        self._recent: dict[str, int] = {}  # ctime of files taken since _mark
+        self._scanned_mtime: int | None = None  # Directory mtime last scanned
+
+    def read(self) -> list[Record]:
+        """Return the logs in files that appeared since the last read."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._scanned_mtime:
+                return []
+            now = time.time_ns()
+            entries = []
+            for entry in os.scandir(self.path):
+                name = entry.name
+                if name.startswith(".") or not name.endswith(self.suffix):
+                    continue
+                try:
+                    ctime = entry.stat().st_ctime_ns
+                except FileNotFoundError:
+                    continue
+                if ctime > self._mark and self._recent.get(name) != ctime:
+                    if entry.is_file():
+                        entries.append((ctime, name))
+        except FileNotFoundError:
+            return []
+
+        settled = now - self.SETTLE_NS
+        self._scanned_mtime = mtime if mtime <= settled else None
+        self._mark = max(self._mark, settled)
+        self._recent = {
+            name: ctime for name, ctime in self._recent.items() if ctime > settled
+        }
+
+        records = []
+        for ctime, name in sorted(entries):
+            if ctime > settled:
+                self._recent[name] = ctime
+            path = self.path / name
+            try:
+                text = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                log.warning("Skipping unreadable spool file %s: %s", path, e)
+                continue
+            records.append((name.removesuffix(self.suffix), text))
+        return records
+
+
+def open_source(path: Path) -> JsonlSource | SpoolSource:
+    """A SpoolSource for a directory, otherwise a JsonlSource."""
+    path = Path(path).expanduser()
+    return SpoolSource(path) if path.is_dir() else JsonlSource(path)
+
+
+class LogIngestor:
+    """Publish new logs from a source into the log store in the background.
+
+    Each poll drains everything the source has ready and publishes it in
+    batches of one source read, so a burst of records costs a handful of
+    store (and sidebar) updates rather than one per record.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        store: LogStore | None = None,
+        poll_interval: float = 0.25,
+    ) -> None:
+        self.source = open_source(path)
+        self.store = store if store is not None else get_log_store()
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start ingesting in a daemon thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="log-ingestor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop ingesting and wait for the thread to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def poll(self) -> list[str]:
+        """Publish everything the source has ready. Returns the keys added."""
+        added: list[str] = []
+        while records := self.source.read():
+            added += self.store.publish(records)
+        return added
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except OSError as e:
+                log.warning("Log ingestion from %s failed: %s", self.source.path, e)
+            self._stop.wait(self.poll_interval)
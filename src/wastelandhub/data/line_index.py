@@ -0,0 +1,76 @@
+"""Line-offset index over a log body, built incrementally."""
+
+from array import array
+
+
+class LineIndex:
+    """Start offsets of the lines of a text, scanned only as far as needed.
+
+    Lines are numbered like the Typewriter renders them: split on "\\n", with
+    a trailing newline not starting an extra line. Looking up a line scans the
+    text up to it, so the first lines of a huge log are available without
+    reading the rest; ``scan`` indexes the remainder a chunk at a time.
+    """
+
+    CHUNK = 1024 * 1024
+    """Characters indexed per scan() call."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._starts = array("q", [0])
+        self._scanned = 0
+        self.widest = 0
+        """Length in characters of the longest line indexed so far."""
+
+    @property
+    def complete(self) -> bool:
+        """True once the whole text has been indexed."""
+        return self._scanned >= len(self.text)
+
+    def __len__(self) -> int:
+        """Number of lines indexed so far (all of them once complete)."""
+        count = len(self._starts)
+        if not self.complete:
+            return count - 1  # The last line may continue past the scanned text
+        if count > 1 and self._starts[-1] == len(self.text):
+            return count - 1  # Trailing newline
+        return count
+
+    def scan(self, chars: int = CHUNK) -> bool:
+        """Index up to chars more characters. Returns True once complete."""
+        text = self.text
+        stop = min(len(text), self._scanned + chars)
+        starts = self._starts
+        start = starts[-1]
+        widest = self.widest
+        find = text.find
+        position = self._scanned
+        while (newline := find("\n", position, stop)) != -1:
+            if newline - start > widest:
+                widest = newline - start
+            start = position = newline + 1
+            starts.append(start)
+        self._scanned = stop
+        if stop == len(text):
+            widest = max(widest, stop - start)
+        self.widest = widest
+        return self.complete
+
+    def ensure(self, line: int) -> bool:
+        """Index at least up to line. Returns False if the text is shorter."""
+        while len(self) <= line and not self.complete:
+            self.scan(self.CHUNK // 16)
+        return line < len(self)
+
+    def line_end(self, line: int) -> int:
+        """Offset just past the last character of line (before its newline)."""
+        self.ensure(line)
+        if line + 1 < len(self._starts):
+            return self._starts[line + 1] - 1
+        return len(self.text)
+
+    def line(self, line: int) -> str:
+        """Text of line, without its newline."""
+        if not self.ensure(line):
+            raise IndexError(line)
+        return self.text[self._starts[line] : self.line_end(line)]
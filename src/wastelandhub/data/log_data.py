@@ -1,8 +1,14 @@
 """Log data management for WastelandHub."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import Dict
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+from .archive import LogArchive
+from .config import get_config
+
+ARCHIVE_NAME = "logs.whla"
 
 
 @dataclass(frozen=True)
@@ -11,13 +17,33 @@ class LogData:
     
     This is a singleton accessed via load_default(). The data is frozen
     to prevent accidental mutations that would break the cached singleton.
+
+    ``logs`` is either an in-memory dict or a memory-mapped LogArchive;
+    both expose the same mapping interface.
     """
-    logs: Dict[str, str]
+    logs: Mapping[str, str]
 
     @classmethod
     @lru_cache(maxsize=1)
     def load_default(cls) -> "LogData":
-        """Load default log data with expanded content (cached singleton)."""
+        """Load default log data (cached singleton).
+
+        Uses the packed archive in the data directory when one exists,
+        otherwise the built-in logs.
+        """
+        archive_path = get_config().data_dir / ARCHIVE_NAME
+        if archive_path.exists():
+            return cls.from_archive(archive_path)
+        return cls.builtin()
+
+    @classmethod
+    def from_archive(cls, path: Path) -> "LogData":
+        """Open a packed log archive without reading any log bodies."""
+        return cls(logs=LogArchive(path))
+
+    @classmethod
+    def builtin(cls) -> "LogData":
+        """Build log data from the logs embedded in the application."""
         return cls(logs={
             "COMM_01": (
                 ">> RE: FUSION CELL STOCK\n"
@@ -81,6 +107,13 @@ class LogData:
         """Get a specific log by key."""
         return self.logs.get(key, "Log not found.")
 
-    def get_log_keys(self) -> list[str]:
-        """Get all available log keys."""
-        return list(self.logs.keys())
+    def get_log_keys(self) -> tuple[str, ...]:
+        """Get all available log keys, in order.
+
+        The tuple is built on first use and shared by later calls.
+        """
+        return self._keys
+
+    @cached_property
+    def _keys(self) -> tuple[str, ...]:
+        return tuple(self.logs.keys())
@@ -0,0 +1,297 @@
+"""Live log store: the loaded logs plus logs ingested while the app runs."""
+
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import islice
+
+from .body_cache import BodyCache
+from .config import get_config
+from .log_data import LogData
+from .metadata import LogMeta, LogQuery, MetadataIndex
+from .search_index import SearchIndex
+
+LogsCallback = Callable[[list[str]], None]
+
+
+class _Journal:
+    """An unlinked temporary file that published log bodies are appended to.
+
+    Only the process that created a journal appends to it: after a fork, the
+    child opens its own for new logs, and both can still read the old ones.
+    """
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile(prefix="wastelandhub-logs-")
+        self.pid = os.getpid()
+        self.size = 0
+
+    def append(self, text: str) -> tuple[int, int]:
+        """Write text at the end. Returns its (offset, size)."""
+        data = memoryview(text.encode("utf-8"))
+        offset = self.size
+        fd = self._file.fileno()
+        while data:
+            written = os.pwrite(fd, data, self.size)
+            data = data[written:]
+            self.size += written
+        return offset, self.size - offset
+
+    def read(self, offset: int, size: int) -> str:
+        return os.pread(self._file.fileno(), size, offset).decode("utf-8")
+
+
+IngestedLog = tuple[_Journal, int, int]
+"""Where a published log's body is: (journal, offset, size)."""
+
+
+class LogStore:
+    """All logs the terminal can show, growing as new logs are published.
+
+    The base logs come from LogData.load_default() and are never modified;
+    published logs are appended to the key order and the search index. A key
+    can only be published once, so a log's text never changes after it has
+    been shown. Subscribers are called on the publishing thread with the keys
+    each publish added.
+
+    Published bodies are written to a journal file rather than kept in
+    memory. They, and base logs read from an archive, are read back on every
+    access, so get_log() keeps recently read ones in a BodyCache sized by the
+    configured ``body_cache_bytes``.
+    """
+
+    def __init__(self) -> None:
+        self._data: LogData | None = None
+        self._ingested: dict[str, IngestedLog] = {}
+        self._journal: _Journal | None = None
+        self._keys: list[str] | None = None
+        self._index: SearchIndex | None = None
+        self._metadata: MetadataIndex | None = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        """Held while building an index, so only one thread builds each."""
+        self._subscribers: list[LogsCallback] = []
+        self.body_cache = BodyCache()
+
+    @property
+    def data(self) -> LogData:
+        """The base log data, loaded on first use."""
+        data = self._data
+        if data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = LogData.load_default()
+                    self.body_cache.resize(get_config().body_cache_bytes)
+                data = self._data
+        return data
+
+    @property
+    def decodes_logs(self) -> bool:
+        """True if base logs are read from an archive, through the body cache."""
+        return not isinstance(self.data.logs, dict)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ingested or key in self.data.logs
+
+    def __len__(self) -> int:
+        return len(self.data.logs) + len(self._ingested)
+
+    def get_log(self, key: str) -> str:
+        """Get a specific log by key."""
+        ingested = self._ingested.get(key)
+        if ingested is None and not self.decodes_logs:
+            return self.data.get_log(key)  # Already held in memory
+        text = self.body_cache.get(key)
+        if text is None:
+            if ingested is not None:
+                text = _read(ingested)
+            else:
+                text = self.data.logs.get(key)
+                if text is None:
+                    return self.data.get_log(key)
+            self.body_cache.put(key, text)
+        return text
+
+    def get_log_keys(self) -> list[str]:
+        """Get all log keys: the base logs first, then in publish order."""
+        base = self.data.logs
+        with self._lock:
+            return list(self._all_keys(base))
+
+    def iter_keys(self) -> Iterator[str]:
+        """Iterate over log keys in get_log_keys() order without copying them.
+
+        Logs published while iterating may or may not be included.
+        """
+        yield from self.data.logs.keys()
+        with self._lock:
+            ingested = list(self._ingested)
+        yield from ingested
+
+    def iter_logs(self) -> Iterator[tuple[str, str]]:
+        """Iterate over (key, text) pairs, reading each text only when reached.
+
+        Bypasses the body cache, so a full scan does not evict the logs
+        being browsed.
+        """
+        logs = self.data.logs
+        for key in self.iter_keys():
+            ingested = self._ingested.get(key)
+            yield key, logs[key] if ingested is None else _read(ingested)
+
+    def search(self, query: str) -> list[str]:
+        """Search every log, building the index on first use.
+
+        Queries may also filter, sort and group by header metadata (see
+        LogQuery); the metadata index is built the first time one does.
+        """
+        parsed = LogQuery.parse(query)
+        base = self.data.logs
+        index = self._built_index("_index", SearchIndex, base)
+        if parsed.structured:
+            metadata = self._built_index("_metadata", MetadataIndex, base)
+        with self._lock:
+            if not parsed.structured:
+                return index.search(query)
+            if parsed.filters:
+                keys = metadata.select(parsed.filters)
+                if parsed.text:
+                    matches = set(index.search(parsed.text))
+                    keys = [key for key in keys if key in matches]
+            else:
+                keys = index.search(parsed.text)
+            if parsed.sort is not None:
+                keys = metadata.order(keys, parsed.sort, parsed.descending)
+            if parsed.group is not None:
+                groups = metadata.group(keys, parsed.group)
+                keys = [key for group in groups.values() for key in group]
+        return keys
+
+    def get_metadata(self, key: str) -> LogMeta | None:
+        """Header metadata of a log, building the metadata index on first use."""
+        metadata = self._built_index("_metadata", MetadataIndex, self.data.logs)
+        with self._lock:
+            return metadata.get(key)
+
+    def publish(self, logs: Iterable[tuple[str, str]]) -> list[str]:
+        """Add (key, text) pairs and notify subscribers.
+
+        Keys that are already in the store are skipped. Returns the keys that
+        were added.
+        """
+        base = self.data.logs
+        with self._lock:
+            added: dict[str, str] = {}
+            for key, text in logs:
+                if key not in added and key not in self._ingested and key not in base:
+                    added[key] = text
+            if not added:
+                return []
+            journal = self._journal
+            if journal is None or journal.pid != os.getpid():
+                journal = self._journal = _Journal()
+            for key, text in added.items():
+                self._ingested[key] = (journal, *journal.append(text))
+            if self._keys is not None:
+                self._keys.extend(added)
+            if self._index is not None:
+                self._index.add_many(added.items())
+            if self._metadata is not None:
+                self._metadata.add_many(added.items())
+            subscribers = list(self._subscribers)
+        keys = list(added)
+        for callback in subscribers:
+            callback(keys)
+        return keys
+
+    def subscribe(self, callback: LogsCallback) -> Callable[[], None]:
+        """Call callback with the keys added by each publish.
+
+        Returns an unsubscribe function.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        return self._unsubscriber(callback)
+
+    def follow(
+        self, known: int, callback: LogsCallback
+    ) -> tuple[list[str], Callable[[], None]]:
+        """Subscribe callback and return the keys after the first ``known``.
+
+        Both happen under the store lock, so a log published meanwhile is
+        either in the returned keys or passed to callback, never both.
+        Returns the keys and an unsubscribe function.
+        """
+        base = self.data.logs
+        with self._lock:
+            missed = self._all_keys(base)[known:]
+            self._subscribers.append(callback)
+        return missed, self._unsubscriber(callback)
+
+    def _unsubscriber(self, callback: LogsCallback) -> Callable[[], None]:
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def clear(self) -> None:
+        """Forget the base and published logs so the next use reloads them."""
+        with self._lock:
+            self._data = None
+            self._ingested = {}
+            self._journal = None
+            self._keys = None
+            self._index = None
+            self._metadata = None
+        self.body_cache.clear()
+
+    def _built_index[I: (SearchIndex, MetadataIndex)](
+        self, name: str, index_type: type[I], base: Mapping[str, str]
+    ) -> I:
+        """The index in attribute name, built on first use.
+
+        The build runs without the store lock, so publishing and reading logs
+        carry on meanwhile; logs published during the build are added under
+        the lock just before the index is installed.
+        """
+        index = getattr(self, name)
+        if index is not None:
+            return index
+        with self._build_lock:
+            index = getattr(self, name)
+            if index is not None:
+                return index
+            with self._lock:
+                ingested = self._ingested
+                known = list(ingested.items())
+            index = index_type.build(base)
+            index.add_many((key, _read(log)) for key, log in known)
+            with self._lock:
+                if self._ingested is not ingested:
+                    return index  # Cleared meanwhile; do not install a stale index
+                published = islice(ingested.items(), len(known), None)
+                index.add_many((key, _read(log)) for key, log in published)
+                setattr(self, name, index)
+        return index
+
+    def _all_keys(self, base: Mapping[str, str]) -> list[str]:
+        # Caller holds the lock
+        if self._keys is None:
+            self._keys = [*base.keys(), *self._ingested]
+        return self._keys
+
+
+def _read(ingested: IngestedLog) -> str:
+    journal, offset, size = ingested
+    return journal.read(offset, size)
+
+
+_store = LogStore()
+
+
+def get_log_store() -> LogStore:
+    """Get the application-wide log store."""
+    return _store
@@ -0,0 +1,358 @@
+"""Structured header metadata of terminal logs, with per-field indexes."""
+
+import re
+from bisect import insort
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+HEADERS = {
+    "FROM": "sender",
+    "TO": "recipient",
+    "PRIORITY": "priority",
+    "CLASSIFICATION": "classification",
+    "TIME": "time",
+    "SYSTEM STATUS": "status",
+    "USER": "user",
+}
+"""Header labels (as written in logs) and the metadata field each fills."""
+
+FIELDS = tuple(HEADERS.values())
+
+ALIASES = {"from": "sender", "to": "recipient"}
+"""Header names accepted in queries in place of field names."""
+
+PRIORITY_ORDER = ("URGENT", "HIGH", "NORMAL", "LOW")
+"""Priorities in the order "sort:priority" lists them."""
+
+MAX_HEADER_CHARS = 2048
+"""Headers are only looked for in the first characters of a log."""
+
+TIME_FORMATS = (
+    "%H:%M:%S",
+    "%H:%M",
+    "%I:%M:%S %p",
+    "%I:%M %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+    "%b %d, %Y %H:%M",
+    "%b %d, %Y",
+)
+"""Formats "Time:" values are read in, besides ISO 8601. Times without a
+date sort before every dated one."""
+
+_HEADER = re.compile(r"([A-Za-z][A-Za-z ]*?)\s*:\s*(.+)")
+_ADDRESS = re.compile(r"(.*?)\s*<([^>]+)>")
+_QUERY_TERM = re.compile(r'(\w+):(?:"([^"]*)"|(\S+))')
+
+
+class LogMeta:
+    """Header fields of one log; fields the log does not have are None."""
+
+    __slots__ = ("key", *FIELDS)
+
+    def __init__(self, key: str, **values: str) -> None:
+        self.key = key
+        for name in FIELDS:
+            setattr(self, name, values.get(name))
+
+    def get(self, name: str) -> str | None:
+        """Value of a field, by field name or header alias."""
+        return getattr(self, field_name(name))
+
+    def __repr__(self) -> str:
+        values = [
+            f"{name}={value!r}"
+            for name in FIELDS
+            if (value := getattr(self, name)) is not None
+        ]
+        return f"LogMeta({', '.join([repr(self.key), *values])})"
+
+
+def field_name(name: str) -> str:
+    """Resolve a field name or header alias. Raises KeyError if unknown."""
+    name = name.lower()
+    name = ALIASES.get(name, name)
+    if name not in FIELDS:
+        raise KeyError(name)
+    return name
+
+
+def parse_headers(key: str, text: str) -> LogMeta:
+    """Read the "LABEL: value" header block at the top of a log.
+
+    The block ends at the first blank line. The ">> title" line and labels
+    that are not in HEADERS are skipped.
+    """
+    values: dict[str, str] = {}
+    for line in text[:MAX_HEADER_CHARS].split("\n"):
+        line = line.strip()
+        if not line:
+            if values:
+                break
+            continue
+        match = _HEADER.fullmatch(line)
+        if match is None:
+            continue
+        name = HEADERS.get(match.group(1).upper())
+        if name is not None and name not in values:
+            values[name] = match.group(2).strip()
+    return LogMeta(key, **values)
+
+
+def _terms(name: str, value: str) -> set[str]:
+    """Values a field can be looked up by: the whole value, and for addresses
+    the name and the address on their own."""
+    terms = {value.casefold()}
+    if name in ("sender", "recipient"):
+        match = _ADDRESS.fullmatch(value)
+        if match is not None:
+            terms.update(part.casefold() for part in match.groups() if part)
+    return terms
+
+
+def parse_time(value: str) -> datetime | None:
+    """Read a "Time:" value, in UTC if it has a zone. None if unreadable."""
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        for time_format in TIME_FORMATS:
+            try:
+                parsed = datetime.strptime(value, time_format)
+                break
+            except ValueError:
+                continue
+        else:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+SortKey = tuple[int, datetime | str]
+
+
+def _sort_key(name: str, value: str) -> SortKey:
+    """Priorities in PRIORITY_ORDER and times chronologically, each before
+    values they cannot be read from; everything else by its text."""
+    if name == "priority" and value.upper() in PRIORITY_ORDER:
+        return PRIORITY_ORDER.index(value.upper()), ""
+    if name == "time" and (parsed := parse_time(value)) is not None:
+        return 0, parsed
+    return len(PRIORITY_ORDER), value.casefold()
+
+
+class _SortedIndex:
+    """The logs that have one field, kept sorted by its value."""
+
+    __slots__ = ("entries", "keys")
+
+    def __init__(self) -> None:
+        self.entries: list[tuple[SortKey, int]] = []
+        self.keys: dict[int, SortKey] = {}
+
+    def add(self, doc_id: int, key: SortKey) -> None:
+        self.keys[doc_id] = key
+        insort(self.entries, (key, doc_id))
+
+    def order(self, docs: list[int], descending: bool) -> tuple[list[int], list[int]]:
+        """Split docs into those with the field, sorted, and those without."""
+        keys = self.keys
+        present = [doc_id for doc_id in docs if doc_id in keys]
+        missing = [doc_id for doc_id in docs if doc_id not in keys]
+        if len(present) * 8 < len(self.entries):
+            # A few docs: sorting them is cheaper than walking the index
+            present.sort(key=lambda doc_id: (keys[doc_id], doc_id), reverse=descending)
+        else:
+            wanted = set(present)
+            entries = reversed(self.entries) if descending else self.entries
+            present = [doc_id for _, doc_id in entries if doc_id in wanted]
+        return present, missing
+
+
+@dataclass
+class LogQuery:
+    """A sidebar query: free text plus ``field:value``, ``sort:`` and ``group:``.
+
+    ``priority:urgent from:jcurtis@robco.net reactor`` matches the logs with
+    both header values whose text contains "reactor". ``sort:time`` orders
+    the results by a field (``sort:-time`` for descending) and
+    ``group:priority`` groups them by one. Values with spaces are quoted:
+    ``classification:"top secret"``.
+    """
+
+    text: str = ""
+    filters: dict[str, str] = field(default_factory=dict)
+    sort: str | None = None
+    descending: bool = False
+    group: str | None = None
+
+    @classmethod
+    def parse(cls, query: str) -> "LogQuery":
+        """Split a query into its parts; unknown ``name:`` terms stay text."""
+        parsed = cls()
+
+        def take(match: re.Match) -> str:
+            name, value = match.group(1).lower(), match.group(2) or match.group(3)
+            try:
+                if name == "sort":
+                    parsed.descending = value.startswith("-")
+                    parsed.sort = field_name(value.lstrip("-"))
+                elif name == "group":
+                    parsed.group = field_name(value)
+                else:
+                    parsed.filters[field_name(name)] = value
+            except KeyError:
+                return match.group(0)
+            return " "
+
+        parsed.text = _QUERY_TERM.sub(take, query).strip()
+        return parsed
+
+    @property
+    def structured(self) -> bool:
+        """True if the query uses header metadata at all."""
+        return bool(self.filters or self.sort or self.group)
+
+
+class MetadataIndex:
+    """Header metadata of every log, with a hash and a sorted index per field.
+
+    Logs are numbered in the order they are added. The hash indexes map each
+    lowercased value (and, for addresses, the name and address on their own)
+    to the numbers of the logs that have it, in order. The sorted indexes
+    keep the logs that have a field in order of its value; each is built on
+    first use, and logs added later are inserted in place.
+    """
+
+    def __init__(self) -> None:
+        self._records: list[LogMeta] = []
+        self._doc_ids: dict[str, int] = {}
+        self._values: dict[str, dict[str, list[int]]] = {name: {} for name in FIELDS}
+        self._sorted: dict[str, _SortedIndex] = {}
+
+    @classmethod
+    def build(cls, logs: Mapping[str, str]) -> "MetadataIndex":
+        """Parse the headers of every log in the mapping."""
+        index = cls()
+        index.add_many(logs.items())
+        return index
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._doc_ids
+
+    def get(self, key: str) -> LogMeta | None:
+        """The metadata record of a log."""
+        doc_id = self._doc_ids.get(key)
+        return None if doc_id is None else self._records[doc_id]
+
+    def add(self, key: str, text: str) -> None:
+        """Index one more log. Adding a key that is already indexed is a no-op."""
+        if key in self._doc_ids:
+            return
+        record = parse_headers(key, text)
+        doc_id = len(self._records)
+        self._records.append(record)
+        self._doc_ids[key] = doc_id
+        for name in FIELDS:
+            value = getattr(record, name)
+            if value is not None:
+                index = self._values[name]
+                for term in _terms(name, value):
+                    index.setdefault(term, []).append(doc_id)
+                sorted_index = self._sorted.get(name)
+                if sorted_index is not None:
+                    sorted_index.add(doc_id, _sort_key(name, value))
+
+    def add_many(self, logs: Iterable[tuple[str, str]]) -> None:
+        for key, text in logs:
+            self.add(key, text)
+
+    def matching(self, filters: Mapping[str, str]) -> list[int] | None:
+        """Numbers of the logs matching every filter, in order.
+
+        Returns None when there are no filters (every log matches).
+        """
+        result: set[int] | None = None
+        for name, value in filters.items():
+            docs = self._values[field_name(name)].get(value.casefold(), ())
+            result = set(docs) if result is None else result.intersection(docs)
+            if not result:
+                return []
+        return None if result is None else sorted(result)
+
+    def select(
+        self,
+        filters: Mapping[str, str] | None = None,
+        sort: str | None = None,
+        descending: bool = False,
+    ) -> list[str]:
+        """Keys of the logs matching every filter, optionally sorted by a field.
+
+        Logs without the sort field come last, in the order they were added.
+        """
+        docs = self.matching(filters or {})
+        if docs is None:
+            docs = range(len(self._records))
+        if sort is not None:
+            docs = self._order(docs, field_name(sort), descending)
+        return [self._records[doc_id].key for doc_id in docs]
+
+    def order(
+        self, keys: Iterable[str], sort: str, descending: bool = False
+    ) -> list[str]:
+        """Sort keys by a field with the sorted index; unknown keys come last."""
+        doc_ids = self._doc_ids
+        docs, unknown = [], []
+        for key in keys:
+            doc_id = doc_ids.get(key)
+            if doc_id is None:
+                unknown.append(key)
+            else:
+                docs.append(doc_id)
+        ordered = self._order(docs, field_name(sort), descending)
+        return [self._records[doc_id].key for doc_id in ordered] + unknown
+
+    def group(self, keys: Iterable[str], name: str) -> dict[str | None, list[str]]:
+        """Group keys by a field, groups in sort order and None (no value) last.
+
+        Keys keep their relative order within each group.
+        """
+        name = field_name(name)
+        groups: dict[str | None, list[str]] = {}
+        for key in keys:
+            record = self.get(key)
+            value = None if record is None else getattr(record, name)
+            groups.setdefault(value, []).append(key)
+        ordered = sorted(
+            (value for value in groups if value is not None),
+            key=lambda value: _sort_key(name, value),
+        )
+        if None in groups:
+            ordered.append(None)
+        return {value: groups[value] for value in ordered}
+
+    def _order(self, docs: Iterable[int], name: str, descending: bool) -> list[int]:
+        """Order docs by a field, using (and building) its sorted index."""
+        sorted_index = self._sorted.get(name)
+        if sorted_index is None:
+            sorted_index = self._sorted[name] = self._sort(name)
+        present, missing = sorted_index.order(list(docs), descending)
+        return present + missing
+
+    def _sort(self, name: str) -> _SortedIndex:
+        """Sorted index of a field, over every log that has it."""
+        sorted_index = _SortedIndex()
+        for doc_id, record in enumerate(self._records):
+            value = getattr(record, name)
+            if value is not None:
+                sorted_index.keys[doc_id] = _sort_key(name, value)
+        sorted_index.entries = sorted(
+            (key, doc_id) for doc_id, key in sorted_index.keys.items()
+        )
+        return sorted_index
@@ -0,0 +1,115 @@
+"""Inverted full-text index over terminal logs."""
+
+import re
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Mapping
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+INSORT_LIMIT = 32
+"""Batches with at most this many new tokens are inserted one by one; larger
+ones are merged into the vocabulary in a single pass."""
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+class SearchIndex:
+    """Inverted index mapping each token to the logs that contain it.
+
+    Logs are numbered in the order they are added and every posting list is
+    kept sorted by that number, so adding a log only appends to the lists of
+    its tokens. A sorted vocabulary supports prefix lookups for
+    search-as-you-type.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._doc_ids: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._vocabulary: list[str] = []
+
+    @classmethod
+    def build(cls, logs: Mapping[str, str]) -> "SearchIndex":
+        """Index every log in the mapping (key and body)."""
+        index = cls()
+        for key, body in logs.items():
+            index._add(key, body)
+        index._vocabulary = sorted(index._postings)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._doc_ids
+
+    def add(self, key: str, text: str) -> None:
+        """Index one more log. Adding a key that is already indexed is a no-op."""
+        for token in self._add(key, text):
+            insort(self._vocabulary, token)
+
+    def add_many(self, logs: Iterable[tuple[str, str]]) -> None:
+        """Index a batch of logs, merging new tokens into the vocabulary once."""
+        new_tokens: list[str] = []
+        for key, text in logs:
+            new_tokens.extend(self._add(key, text))
+        if len(new_tokens) <= INSORT_LIMIT:
+            for token in new_tokens:
+                insort(self._vocabulary, token)
+        else:
+            # Two sorted runs, which timsort merges in one linear pass
+            new_tokens.sort()
+            self._vocabulary.extend(new_tokens)
+            self._vocabulary.sort()
+
+    def _add(self, key: str, text: str) -> list[str]:
+        """Add postings for a log and return the tokens it introduced."""
+        if key in self._doc_ids:
+            return []
+        doc_id = len(self._keys)
+        self._keys.append(key)
+        self._doc_ids[key] = doc_id
+
+        new_tokens = []
+        for token in set(tokenize(key)) | set(tokenize(text)):
+            posting = self._postings.get(token)
+            if posting is None:
+                self._postings[token] = [doc_id]
+                new_tokens.append(token)
+            else:
+                posting.append(doc_id)
+        return new_tokens
+
+    def _prefix_docs(self, prefix: str) -> set[int]:
+        """Return the logs containing any token that starts with prefix."""
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        docs: set[int] = set()
+        for i in range(start, len(vocabulary)):
+            token = vocabulary[i]
+            if not token.startswith(prefix):
+                break
+            docs.update(self._postings[token])
+        return docs
+
+    def search(self, query: str) -> list[str]:
+        """Return keys of logs matching every word of the query, in index order.
+
+        Each query word is matched as a prefix, so partially typed words
+        already narrow the results. An empty query matches every log.
+        """
+        words = set(tokenize(query))
+        if not words:
+            return list(self._keys)
+
+        result: set[int] | None = None
+        # Narrow with long (more selective) prefixes first
+        for word in sorted(words, key=len, reverse=True):
+            docs = self._prefix_docs(word)
+            result = docs if result is None else result & docs
+            if not result:
+                return []
+        return [self._keys[doc_id] for doc_id in sorted(result)]
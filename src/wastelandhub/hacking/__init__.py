@@ -0,0 +1,5 @@
+"""Password hacking minigame for WastelandHub."""
+
+from .engine import HackingGame, Puzzle, generate_puzzle
+
+__all__ = ["HackingGame", "Puzzle", "generate_puzzle"]
@@ -0,0 +1,188 @@
+"""Fallout-style password hacking engine.
+
+A puzzle is a board of same-length candidate words, one of which is the
+password. Guessing a word reveals its likeness: the number of positions at
+which it matches the password. The likeness of every pair of words is
+computed once when the puzzle is built, together with a bitset per
+(guess, likeness) of the words that would still be possible, so evaluating
+a guess is a lookup and a single AND.
+"""
+
+import random
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from .words import default_words
+
+ATTEMPTS = 4
+MIN_WORDS = 8
+MAX_WORDS = 20
+
+
+def board_shape(difficulty: int) -> tuple[int, int]:
+    """Map terminal_difficulty (0-100) to (word length, word count)."""
+    difficulty = max(0, min(100, difficulty))
+    length = 4 + round(difficulty * 8 / 100)
+    count = MIN_WORDS + round(difficulty * (MAX_WORDS - MIN_WORDS) / 100)
+    return length, count
+
+
+def likeness_matrix(words: Sequence[str]) -> tuple[bytes, ...]:
+    """Return the pairwise likeness matrix of equal-length ASCII words.
+
+    Each word is packed into an int, so comparing two words is one XOR and
+    a count of the zero bytes in the result, independent of word length.
+    """
+    length = len(words[0])
+    packed = [int.from_bytes(word.encode("ascii")) for word in words]
+    return tuple(
+        bytes((a ^ b).to_bytes(length).count(0) for b in packed) for a in packed
+    )
+
+
+def likeness_masks(matrix: Sequence[bytes], length: int) -> tuple[tuple[int, ...], ...]:
+    """For each guess g, bitsets of the words j with likeness(g, j) == k."""
+    masks = []
+    for row in matrix:
+        by_likeness = [0] * (length + 1)
+        for j, likeness in enumerate(row):
+            by_likeness[likeness] |= 1 << j
+        masks.append(tuple(by_likeness))
+    return tuple(masks)
+
+
+def iter_bits(bits: int):
+    """Yield the indices of the set bits in bits, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+@dataclass(frozen=True, slots=True)
+class Puzzle:
+    """An immutable hacking board with its precomputed likeness tables."""
+
+    words: tuple[str, ...]
+    password_index: int
+    likeness: tuple[bytes, ...]
+    masks: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def create(cls, words: Sequence[str], password_index: int) -> "Puzzle":
+        """Build a puzzle, precomputing the likeness matrix and masks."""
+        words = tuple(words)
+        if len({len(word) for word in words}) != 1:
+            raise ValueError("All words on a board must have the same length")
+        if len(set(words)) != len(words):
+            raise ValueError("Words on a board must be unique")
+        matrix = likeness_matrix(words)
+        return cls(
+            words=words,
+            password_index=password_index,
+            likeness=matrix,
+            masks=likeness_masks(matrix, len(words[0])),
+        )
+
+    @property
+    def password(self) -> str:
+        return self.words[self.password_index]
+
+    @property
+    def word_length(self) -> int:
+        return len(self.words[0])
+
+    @property
+    def all_words(self) -> int:
+        """Bitset with one bit per word on the board."""
+        return (1 << len(self.words)) - 1
+
+    def score(self, guess_index: int) -> int:
+        """Likeness of a guess against the password."""
+        return self.likeness[guess_index][self.password_index]
+
+
+def related_decoys(puzzle: Puzzle) -> int:
+    """Number of decoys sharing at least one letter position with the password."""
+    row = puzzle.likeness[puzzle.password_index]
+    return sum(1 for likeness in row if 0 < likeness < puzzle.word_length)
+
+
+def is_playable(puzzle: Puzzle) -> bool:
+    """Reject boards where most decoys share no letters with the password.
+
+    On such boards nearly every guess returns likeness 0 and the game turns
+    into blind luck.
+    """
+    return related_decoys(puzzle) >= len(puzzle.words) // 3
+
+
+def generate_puzzle(
+    difficulty: int,
+    rng: random.Random | None = None,
+    dictionary: Mapping[int, Sequence[str]] | None = None,
+    max_tries: int = 50,
+) -> Puzzle:
+    """Generate a playable puzzle for the given terminal_difficulty.
+
+    If none of ``max_tries`` boards is playable (e.g. with a small
+    dictionary), the one with the most related decoys is returned.
+    """
+    rng = rng or random.Random()
+    dictionary = dictionary if dictionary is not None else default_words()
+    length, count = board_shape(difficulty)
+
+    # Use the closest word length that has enough words for the board
+    usable = [n for n, words in dictionary.items() if len(words) >= count]
+    if not usable:
+        raise ValueError(f"Dictionary has no word length with {count} words")
+    length = min(usable, key=lambda n: (abs(n - length), -n))
+    pool = dictionary[length]
+
+    best, best_related = None, -1
+    for _ in range(max(1, max_tries)):
+        puzzle = Puzzle.create(rng.sample(pool, count), rng.randrange(count))
+        if is_playable(puzzle):
+            return puzzle
+        related = related_decoys(puzzle)
+        if related > best_related:
+            best, best_related = puzzle, related
+    return best
+
+
+class HackingGame:
+    """State of one hacking attempt against a puzzle."""
+
+    def __init__(self, puzzle: Puzzle, attempts: int = ATTEMPTS) -> None:
+        self.puzzle = puzzle
+        self.attempts_left = attempts
+        self.remaining = puzzle.all_words
+        """Bitset of words still consistent with every guess so far."""
+        self.history: list[tuple[int, int]] = []
+        """(word index, likeness) for each guess, in order."""
+        self.solved = False
+
+    @property
+    def over(self) -> bool:
+        return self.solved or self.attempts_left == 0
+
+    def guess(self, index: int) -> int:
+        """Guess the word at index and return its likeness.
+
+        Raises:
+            RuntimeError: If the game is already over.
+        """
+        if self.over:
+            raise RuntimeError("The terminal no longer accepts input")
+        likeness = self.puzzle.score(index)
+        self.history.append((index, likeness))
+        self.remaining &= self.puzzle.masks[index][likeness]
+        if index == self.puzzle.password_index:
+            self.solved = True
+        else:
+            self.attempts_left -= 1
+        return likeness
+
+    def candidates(self) -> list[int]:
+        """Indices of the words that could still be the password."""
+        return list(iter_bits(self.remaining))
@@ -0,0 +1,117 @@
+"""Background pre-generation of hacking puzzles."""
+
+import random
+import threading
+from collections import deque
+from collections.abc import Callable
+
+from .engine import Puzzle, generate_puzzle
+from .solver import calibrated_puzzle
+
+PuzzleGenerator = Callable[[int, random.Random], Puzzle]
+
+
+class PuzzlePool:
+    """A bounded pool of ready-to-play puzzles for one difficulty.
+
+    A daemon thread keeps the pool topped up to ``size`` puzzles, so take()
+    normally returns immediately. Changing the difficulty discards the
+    puzzles generated for the old one. By default boards are calibrated
+    against the solver, which generates and scores several boards per puzzle;
+    when take() finds the pool empty it uses the quicker ``fallback``
+    generator instead, since it runs on the caller's (usually the UI) thread.
+    """
+
+    def __init__(
+        self,
+        difficulty: int,
+        size: int = 3,
+        rng: random.Random | None = None,
+        generator: PuzzleGenerator = calibrated_puzzle,
+        fallback: PuzzleGenerator = generate_puzzle,
+    ) -> None:
+        self.size = size
+        self.generator = generator
+        self.fallback = fallback
+        self._difficulty = difficulty
+        self._rng = rng or random.Random()
+        self._puzzles: deque[Puzzle] = deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self.misses = 0
+        """Number of take() calls that had to generate a puzzle in place
+        (with the fallback generator)."""
+
+    @property
+    def difficulty(self) -> int:
+        return self._difficulty
+
+    def __len__(self) -> int:
+        return len(self._puzzles)
+
+    def start(self) -> None:
+        """Start filling the pool in the background."""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="puzzle-pool", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def take(self) -> Puzzle:
+        """Return a puzzle for the current difficulty and trigger a refill."""
+        with self._condition:
+            if self._puzzles:
+                puzzle = self._puzzles.popleft()
+                self._condition.notify_all()
+                return puzzle
+            self.misses += 1
+            difficulty = self._difficulty
+        return self.fallback(difficulty, random.Random(self._rng.random()))
+
+    def set_difficulty(self, difficulty: int) -> None:
+        """Switch difficulty, discarding puzzles generated for the old one."""
+        with self._condition:
+            if difficulty == self._difficulty:
+                return
+            self._difficulty = difficulty
+            self._puzzles.clear()
+            self._condition.notify_all()
+
+    def wait_full(self, timeout: float | None = None) -> bool:
+        """Block until the pool is full. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: len(self._puzzles) >= self.size, timeout
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopped or len(self._puzzles) < self.size
+                )
+                if self._stopped:
+                    return
+                difficulty = self._difficulty
+                seed = self._rng.random()
+
+            # Generate outside the lock so take() never waits on it
+            puzzle = self.generator(difficulty, random.Random(seed))
+
+            with self._condition:
+                if difficulty == self._difficulty and len(self._puzzles) < self.size:
+                    self._puzzles.append(puzzle)
+                    self._condition.notify_all()
@@ -0,0 +1,81 @@
+"""Password dictionary for the hacking minigame."""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+MIN_LENGTH = 4
+MAX_LENGTH = 12
+
+# Grouped by word length, 4 to 12 letters
+WORDS: tuple[str, ...] = tuple(
+    """
+    ARMS BOMB CAPS CELL CODE CORE DEAD DOOR DUST FIRE GEAR GUNS HACK IRON KEYS
+    LOCK MINE NUKE PIPE RADS ROBO RUST SAFE SCAN SHED SIGN SLAG TANK TECH TOWN
+    VATS WALL WARS WIRE ZONE BOLT FUEL
+    ARMOR ATOMS BLAST BONES CHEMS CRATE DEATH DRONE FERAL GHOUL GUARD HOUSE
+    TRASH LASER MEDIC MUTIE NOISE PLANT POWER RADIO RAIDS RIFLE ROBOT SCRAP
+    SHELL SKULL STEEL STORE SWORD TOWER TOXIC VAULT WASTE WATER SIREN CLONE
+    ACCESS ATOMIC BARREL BUNKER CANNON CASINO CORPSE DANGER DEFEND ENERGY FUSION
+    HUNTER KILLER LEGION MUTANT PLASMA POISON RADIUM RAIDER REMOTE RESCUE ROCKET
+    SECRET SHIELD SIGNAL SYSTEM TARGET TUNNEL VECTOR WINTER ZEALOT BATTLE SPIDER
+    STATIC
+    ARSENAL BLASTER BOTTLES CAPITOL CAPTAIN COMMAND CONTROL COURIER DESTROY
+    DOCTORS ENCLAVE FACTORY FREEDOM GATLING GENERAL ISOTOPE MACHINE MINIGUN
+    MISSION MONSTER NUCLEAR OUTCAST PATRIOT PRISONS PROGRAM REACTOR SCANNER
+    SCIENCE SHELTER SOLDIER TRIBALS VENTURE WARFARE WEAPONS RADIANT SURVIVE
+    AMERICAN ASSASSIN BARRACKS BROTHERS CHEMICAL COMPUTER CONTRACT CREATURE
+    DEFENDER DETONATE DIRECTOR DOCUMENT EXPLORER FIREARMS GRENADES HOLOTAPE
+    INDUSTRY MACHINES MEDICINE MERCHANT MILITARY MUTATION OVERSEER PASSWORD
+    PRESSURE PROTOCOL RADIATOR SECURITY SETTLERS SHOTGUNS SPECIMEN SUPPLIES
+    TERMINAL WARHEADS WANDERER SCAVENGE
+    AUTOMATIC BATTERIES BEHEMOTHS CHEMISTRY COMMANDER CONTAINER CORPORATE
+    DETONATOR EMERGENCY EQUIPMENT EXPLOSION GENERATOR INVENTORY LIBERATOR
+    MECHANISM MINEFIELD OPERATION OVERWATCH PROTECTOR RADIOLOGY RECORDING
+    SCAVENGER SCIENTIST SENTINELS STRONGBOX SURVIVORS TECHNICAL TELEPHONE
+    TRANSPORT VERTIBIRD WASTELAND ACTIVATED ARTILLERY
+    ACCELERATE ADMINISTER ASSESSMENT COMMISSARY COMPROMISE CONNECTION CONTAINERS
+    DEACTIVATE DETERMINED ELECTRICAL ENGINEERED EXPERIMENT EXPLOSIVES GOVERNMENT
+    HYDRAULICS INDUSTRIAL INITIATIVE LABORATORY MAINTAINED MANAGEMENT MECHANICAL
+    OPERATIONS OVERLOADED PRODUCTION PROTECTION REINFORCED RESISTANCE SETTLEMENT
+    STRATEGIES SUPERVISOR TECHNOLOGY TRANSPORTS BROADCASTS CONTROLLED DIAGNOSTIC
+    ACCELERATOR BROTHERHOOD CALIBRATION CATASTROPHE COMMANDMENT COMMUNICATE
+    CONTAINMENT CONTAMINATE DEVASTATION ELECTRONICS EMERGENCIES ENVIRONMENT
+    EXPEDITIONS FABRICATION GENERATIONS INSTRUMENTS INVESTIGATE MAINTENANCE
+    MANUFACTURE OBSERVATION RADIOACTIVE RECONSTRUCT REFRIGERATE RESTRICTION
+    SURROUNDING SURVIVALIST TERMINATION TRANSMITTER UNDERGROUND ANNIHILATED
+    DESTRUCTION
+    ACCELERATION ADMINISTRATE AGRICULTURAL ANNIHILATION AUTHENTICATE
+    COMMISSIONED CONFIDENTIAL CONSTRUCTION CONTAMINATED CONVENTIONAL
+    DECOMMISSION DISTRIBUTION ELECTRICIANS EXPERIMENTAL HEADQUARTERS
+    INFESTATIONS INSTRUCTIONS INTELLIGENCE INTERROGATOR LABORATORIES
+    MANUFACTURER MEASUREMENTS NOTIFICATION OBSERVATIONS PURIFICATION
+    RADIOISOTOPE REPLACEMENTS SURVEILLANCE TRANSMISSION UNAUTHORIZED
+    """.split()
+)
+
+
+def group_by_length(words: Iterable[str]) -> dict[int, tuple[str, ...]]:
+    """Group candidate words by length, dropping duplicates and non-letters."""
+    groups: dict[int, list[str]] = {}
+    seen: set[str] = set()
+    for word in words:
+        word = word.strip().upper()
+        if not (word.isascii() and word.isalpha()) or word in seen:
+            continue
+        if MIN_LENGTH <= len(word) <= MAX_LENGTH:
+            seen.add(word)
+            groups.setdefault(len(word), []).append(word)
+    return {length: tuple(group) for length, group in sorted(groups.items())}
+
+
+@lru_cache(maxsize=1)
+def default_words() -> dict[int, tuple[str, ...]]:
+    """Built-in dictionary grouped by word length (cached)."""
+    return group_by_length(WORDS)
+
+
+def load_words(path: Path) -> dict[int, tuple[str, ...]]:
+    """Load a dictionary file with one word per line, grouped by length."""
+    with open(path, encoding="utf-8") as f:
+        return group_by_length(f)
@@ -0,0 +1,428 @@
+"""Multi-session host: one terminal session per visitor, from a single process.
+
+``wastelandhub host`` loads everything sessions can share once (Textual and
+the app's modules, the configuration, the log store's keys and search index)
+and then forks one app process per connection. The shared state is built
+before forking and frozen out of the garbage collector, so its pages stay
+shared copy-on-write and each session only pays for its own screens, widgets
+and render caches. Archived log bodies are memory-mapped and shared through
+the page cache as well.
+
+Each session runs on its own pseudo-terminal. Visitors connect over TCP or a
+Unix socket with any telnet client; the host negotiates character mode and
+window size (NAWS) and relays bytes between the socket and the session's pty.
+Telnet is unencrypted, so only loopback addresses and Unix sockets are served
+unless remote visitors are explicitly allowed.
+
+Sessions do not start the app's background services (config watcher, log
+ingestor, puzzle pool), which would otherwise run once per visitor. They use
+the configuration and logs the host loaded, and generate puzzles on demand;
+restart the host to pick up changes.
+"""
+
+import errno
+import fcntl
+import gc
+import ipaddress
+import logging
+import os
+import pty
+import selectors
+import signal
+import socket
+import struct
+import termios
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+# --- Telnet ---
+
+IAC, DONT, DO, WONT, WILL, SB, SE = 255, 254, 253, 252, 251, 250, 240
+ECHO, SGA, NAWS = 1, 3, 31
+
+NEGOTIATION = bytes([IAC, WILL, ECHO, IAC, WILL, SGA, IAC, DO, NAWS])
+"""Server echoes, no go-ahead (character mode), client reports its size."""
+
+_DATA, _IAC, _OPTION, _SUB, _SUB_IAC = range(5)
+
+
+class TelnetDecoder:
+    """Strips telnet commands from client input and extracts window sizes.
+
+    Carriage returns sent as CR NUL or CR LF are reduced to a plain CR, which
+    is what the terminal app expects for Enter.
+    """
+
+    def __init__(self) -> None:
+        self._state = _DATA
+        self._sub = bytearray()
+        self._after_cr = False
+
+    def feed(self, data: bytes) -> tuple[bytes, list[tuple[int, int]]]:
+        """Return the terminal input in data and any (columns, rows) reported."""
+        out = bytearray()
+        sizes: list[tuple[int, int]] = []
+        for byte in data:
+            state = self._state
+            if state == _DATA:
+                if byte == IAC:
+                    self._state = _IAC
+                elif self._after_cr and byte in (0, 10):
+                    pass
+                else:
+                    out.append(byte)
+                self._after_cr = byte == 13
+            elif state == _IAC:
+                if byte == IAC:
+                    out.append(IAC)
+                    self._state = _DATA
+                elif byte in (WILL, WONT, DO, DONT):
+                    self._state = _OPTION
+                elif byte == SB:
+                    self._sub.clear()
+                    self._state = _SUB
+                else:
+                    self._state = _DATA
+            elif state == _OPTION:
+                self._state = _DATA
+            elif state == _SUB:
+                if byte == IAC:
+                    self._state = _SUB_IAC
+                else:
+                    self._sub.append(byte)
+            else:  # _SUB_IAC
+                if byte == SE:
+                    self._state = _DATA
+                    size = self._window_size()
+                    if size is not None:
+                        sizes.append(size)
+                else:
+                    self._sub.append(byte)
+                    self._state = _SUB
+        return bytes(out), sizes
+
+    def _window_size(self) -> tuple[int, int] | None:
+        sub = self._sub
+        if len(sub) == 5 and sub[0] == NAWS:
+            columns, rows = struct.unpack(">HH", sub[1:])
+            if columns and rows:
+                return columns, rows
+        return None
+
+
+def encode_output(data: bytes) -> bytes:
+    """Escape terminal output for a telnet client."""
+    return data.replace(b"\xff", b"\xff\xff")
+
+
+# --- Sessions ---
+
+
+def prepare_shared_state(build_index: bool = True) -> None:
+    """Load everything sessions share, before the first fork."""
+    from wastelandhub import main  # noqa: F401  Textual and the app
+    from wastelandhub.data.config import get_config
+    from wastelandhub.data.log_store import get_log_store
+    from wastelandhub.screens import hacking, logs_menu, main_menu  # noqa: F401
+
+    get_config()
+    store = get_log_store()
+    store.get_log_keys()
+    if build_index:
+        store.search("")
+    # Keep the collector from touching (and so un-sharing) these objects
+    gc.collect()
+    gc.freeze()
+
+
+def set_window_size(fd: int, columns: int, rows: int) -> None:
+    """Resize a pty; the session's app receives SIGWINCH."""
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, columns, 0, 0))
+
+
+class Session:
+    """One visitor: a client socket relayed to an app running on a pty."""
+
+    MAX_BUFFERED = 1024 * 1024
+    """Data held for a slow reader (the client, or the app for input) before
+    reading from the other side pauses."""
+
+    def __init__(self, sock: socket.socket, pid: int, master_fd: int) -> None:
+        self.sock = sock
+        self.pid = pid
+        self.master_fd = master_fd
+        self.decoder = TelnetDecoder()
+        self.output = bytearray(NEGOTIATION)
+        self.input = bytearray()
+
+    def close(self) -> None:
+        """Hang up the session's terminal and drop the client."""
+        for close in (self.sock.close, lambda: os.close(self.master_fd)):
+            try:
+                close()
+            except OSError:
+                pass
+        try:
+            os.kill(self.pid, signal.SIGHUP)
+        except ProcessLookupError:
+            pass
+
+
+def _run_session(size: tuple[int, int]) -> None:
+    """Body of a forked session process; never returns."""
+    status = 1
+    try:
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD):
+            signal.signal(signum, signal.SIG_DFL)
+        os.environ.setdefault("TERM", "xterm-256color")
+        os.environ["COLUMNS"], os.environ["LINES"] = map(str, size)
+        from wastelandhub.main import WastelandHubApp
+
+        WastelandHubApp(background_services=False).run()
+        status = 0
+    finally:
+        os._exit(status)
+
+
+class SessionHost:
+    """Accepts connections and runs one forked app session for each."""
+
+    def __init__(
+        self,
+        listener: socket.socket,
+        max_sessions: int = 32,
+        size: tuple[int, int] = (80, 24),
+    ) -> None:
+        self.listener = listener
+        self.max_sessions = max_sessions
+        self.size = size
+        self.sessions: dict[int, Session] = {}
+        self._selector = selectors.DefaultSelector()
+        self._running = False
+
+    def serve_forever(self) -> None:
+        """Relay sessions until stop() is called (e.g. from a signal handler)."""
+        self.listener.setblocking(False)
+        self._selector.register(self.listener, selectors.EVENT_READ, None)
+        self._running = True
+        try:
+            while self._running:
+                for key, events in self._selector.select(timeout=1.0):
+                    if key.data is None:
+                        self._accept()
+                    else:
+                        self._handle(key, events)
+                self._reap()
+        finally:
+            for session in list(self.sessions.values()):
+                self._close(session)
+            self._reap()
+            self._selector.close()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def _accept(self) -> None:
+        try:
+            sock, address = self.listener.accept()
+        except BlockingIOError:
+            return
+        if len(self.sessions) >= self.max_sessions:
+            log.warning("Refusing %s: %d sessions running", address, self.max_sessions)
+            sock.close()
+            return
+        pid, master_fd = pty.fork()
+        if pid == 0:
+            self._close_inherited(sock)
+            _run_session(self.size)
+        set_window_size(master_fd, *self.size)
+        os.set_blocking(master_fd, False)
+        sock.setblocking(False)
+        session = Session(sock, pid, master_fd)
+        self.sessions[pid] = session
+        self._update_events(session)
+        log.info(
+            "Session %d started for %s (%d running)", pid, address, len(self.sessions)
+        )
+
+    def _close_inherited(self, sock: socket.socket) -> None:
+        """In a new session process, drop the host's sockets and ptys."""
+        self.listener.close()
+        self._selector.close()
+        sock.close()
+        for session in self.sessions.values():
+            session.sock.close()
+            os.close(session.master_fd)
+
+    def _handle(self, key: selectors.SelectorKey, events: int) -> None:
+        session: Session = key.data
+        if session.pid not in self.sessions:
+            return
+        try:
+            if key.fileobj is session.sock:
+                if events & selectors.EVENT_READ:
+                    self._from_client(session)
+                if events & selectors.EVENT_WRITE and session.pid in self.sessions:
+                    self._to_client(session)
+            else:
+                if events & selectors.EVENT_WRITE:
+                    self._to_app(session)
+                if events & selectors.EVENT_READ and session.pid in self.sessions:
+                    self._from_app(session)
+        except OSError as error:
+            log.info("Session %d ended: %s", session.pid, error)
+            self._close(session)
+
+    def _from_client(self, session: Session) -> None:
+        data = session.sock.recv(65536)
+        if not data:
+            log.info("Session %d: client disconnected", session.pid)
+            self._close(session)
+            return
+        keys, sizes = session.decoder.feed(data)
+        for columns, rows in sizes:
+            set_window_size(session.master_fd, columns, rows)
+        if keys:
+            session.input += keys
+            self._to_app(session)
+
+    def _to_app(self, session: Session) -> None:
+        if session.input:
+            try:
+                written = os.write(session.master_fd, session.input)
+            except BlockingIOError:
+                written = 0  # The pty's input queue is full
+            del session.input[:written]
+        self._update_events(session)
+
+    def _from_app(self, session: Session) -> None:
+        try:
+            data = os.read(session.master_fd, 65536)
+        except OSError as error:
+            if error.errno != errno.EIO:  # EIO: the app closed its terminal
+                raise
+            data = b""
+        if not data:
+            log.info("Session %d: app exited", session.pid)
+            self._close(session)
+            return
+        session.output += encode_output(data)
+        self._to_client(session)
+
+    def _to_client(self, session: Session) -> None:
+        if session.output:
+            try:
+                sent = session.sock.send(session.output)
+            except BlockingIOError:
+                sent = 0
+            del session.output[:sent]
+        self._update_events(session)
+
+    def _update_events(self, session: Session) -> None:
+        """Wait for each side to drain only while there is data for it, and
+        stop reading from a side while the other is far behind."""
+        read, write = selectors.EVENT_READ, selectors.EVENT_WRITE
+        limit = Session.MAX_BUFFERED
+        self._set_events(
+            session.sock,
+            session,
+            (read if len(session.input) <= limit else 0)
+            | (write if session.output else 0),
+        )
+        self._set_events(
+            session.master_fd,
+            session,
+            (read if len(session.output) <= limit else 0)
+            | (write if session.input else 0),
+        )
+
+    def _set_events(
+        self, fileobj: socket.socket | int, session: Session, events: int
+    ) -> None:
+        registered = fileobj in self._selector.get_map()
+        if not events:
+            if registered:
+                self._selector.unregister(fileobj)
+        elif registered:
+            self._selector.modify(fileobj, events, session)
+        else:
+            self._selector.register(fileobj, events, session)
+
+    def _close(self, session: Session) -> None:
+        self.sessions.pop(session.pid, None)
+        for fileobj in (session.sock, session.master_fd):
+            try:
+                self._selector.unregister(fileobj)
+            except (KeyError, ValueError):
+                pass
+        session.close()
+
+    def _reap(self) -> None:
+        """Collect exited session processes."""
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            session = self.sessions.get(pid)
+            if session is not None:
+                self._close(session)
+
+
+def is_loopback(address: str) -> bool:
+    """Whether a listener on address only accepts connections from this machine."""
+    if "/" in address:
+        return True  # Unix socket
+    host = address.rpartition(":")[0] or "127.0.0.1"
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # A host name, which may resolve to anything
+
+
+def open_listener(address: str) -> socket.socket:
+    """Listen on "HOST:PORT" or, for anything containing a "/", a Unix socket."""
+    if "/" not in address:
+        host, _, port = address.rpartition(":")
+        return socket.create_server((host or "127.0.0.1", int(port)))
+    path = Path(address)
+    if path.is_socket():
+        path.unlink()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(path))
+    sock.listen()
+    return sock
+
+
+def serve(
+    address: str,
+    max_sessions: int = 32,
+    size: tuple[int, int] = (80, 24),
+    build_index: bool = True,
+    allow_remote: bool = False,
+) -> None:
+    """Prepare shared state, then host sessions on address until interrupted.
+
+    Raises:
+        ValueError: If address is reachable from other machines and
+            allow_remote is not set.
+    """
+    if not allow_remote and not is_loopback(address):
+        raise ValueError(f"{address} accepts connections from other machines")
+    prepare_shared_state(build_index)
+    listener = open_listener(address)
+    host = SessionHost(listener, max_sessions, size)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: host.stop())
+    log.info("Hosting WastelandHub sessions on %s", listener.getsockname())
+    try:
+        host.serve_forever()
+    finally:
+        listener.close()
+        if "/" in address:
+            Path(address).unlink(missing_ok=True)
@@ -1,10 +1,52 @@
 """Main entry point for WastelandHub application."""
 
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.filter import LineFilter
+from textual.screen import Screen
 from textual.widgets import Footer, Header
 
-from wastelandhub.screens.logs_menu import LogsMenuScreen
-from wastelandhub.screens.main_menu import MainMenuScreen
+from wastelandhub.data.config import (
+    WastelandConfig,
+    get_config,
+    subscribe_config,
+)
+
+if TYPE_CHECKING:
+    from wastelandhub.data.config_watcher import ConfigWatcher
+    from wastelandhub.data.ingest import LogIngestor
+    from wastelandhub.hacking.pool import PuzzlePool
+    from wastelandhub.widgets.animation import Animation, AnimationClock
+    from wastelandhub.widgets.crt import CRTEffect
+    from wastelandhub.widgets.perf_hud import PerfHud, PerfMonitor
+
+
+# Screens are imported on first navigation so that only the main menu is
+# loaded before the first frame.
+
+
+def _main_menu_screen() -> Screen:
+    from wastelandhub.screens.main_menu import MainMenuScreen
+
+    return MainMenuScreen()
+
+
+def _logs_menu_screen() -> Screen:
+    from wastelandhub.screens.logs_menu import LogsMenuScreen
+
+    return LogsMenuScreen()
+
+
+def _hacking_screen() -> Screen:
+    from wastelandhub.screens.hacking import HackingScreen
+
+    return HackingScreen()
 
 
 class WastelandHubApp(App[None]):
@@ -15,28 +57,176 @@ class WastelandHubApp(App[None]):
 
     # Register screens at class level for proper reuse
     SCREENS = {
-        "main_menu": MainMenuScreen,
-        "logs_menu": LogsMenuScreen,
+        "main_menu": _main_menu_screen,
+        "logs_menu": _logs_menu_screen,
+        "hacking": _hacking_screen,
     }
 
     BINDINGS = [
         ("q", "quit", "Quit"),
         ("ctrl+c", "quit", "Quit"),
+        Binding("f12", "toggle_perf_hud", "Perf HUD", show=False),
+        Binding("f11", "dump_perf", "Dump perf", show=False),
     ]
 
+    def __init__(self, *args, background_services: bool = True, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.background_services = background_services
+        """Watch the config, ingest logs and pre-generate puzzles once mounted."""
+        self.config_watcher: "ConfigWatcher | None" = None
+        self.puzzle_pool: "PuzzlePool | None" = None
+        self.log_ingestor: "LogIngestor | None" = None
+        self._unsubscribe_config = None
+        self.perf_monitor: "PerfMonitor | None" = None
+        self._perf_hud: "PerfHud | None" = None
+        self.crt: "CRTEffect | None" = None
+        """Created the first time CRT effects are switched on."""
+        self.animation_clock: "AnimationClock | None" = None
+        """Created by get_animation_clock() for the first animation."""
+        self._flicker: "Animation | None" = None
+
+    FLICKER_INTERVAL = 0.15
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield Footer()
 
     async def on_mount(self) -> None:
-        """Push initial screen."""
+        """Push initial screen, then start background services."""
+        self._apply_crt(get_config())
         await self.push_screen("main_menu")
+        if self.background_services:
+            self.call_after_refresh(self._start_background_services)
+
+    def _start_background_services(self) -> None:
+        """Start services that are not needed for the first frame."""
+        from wastelandhub.data.config_watcher import ConfigWatcher
+        from wastelandhub.hacking.pool import PuzzlePool
+
+        self.config_watcher = ConfigWatcher()
+        self.config_watcher.start()
+        self.puzzle_pool = PuzzlePool(get_config().terminal_difficulty)
+        self.puzzle_pool.start()
+        self._unsubscribe_config = subscribe_config(self._on_config_changed)
+
+        ingest_path = get_config().ingest_path
+        if ingest_path:
+            from wastelandhub.data.ingest import LogIngestor
+
+            self.log_ingestor = LogIngestor(Path(ingest_path))
+            self.log_ingestor.start()
+
+    def _on_config_changed(self, config: WastelandConfig) -> None:
+        """Receive a new config snapshot from any thread."""
+        from wastelandhub.data.log_store import get_log_store
+
+        if self.puzzle_pool is not None:
+            self.puzzle_pool.set_difficulty(config.terminal_difficulty)
+        get_log_store().body_cache.resize(config.body_cache_bytes)
+        if threading.current_thread() is threading.main_thread():
+            self._apply_crt(config)
+        else:
+            self.call_from_thread(self._apply_crt, config)
+
+    # --- CRT effect ---
+
+    def _apply_crt(self, config: WastelandConfig) -> None:
+        """Switch the CRT effect to the configured settings and repaint."""
+        if self.crt is None:
+            if not config.crt_effects:
+                return
+            from wastelandhub.widgets.crt import CRTEffect
+
+            self.crt = CRTEffect()
+        flicker = config.crt_effects and config.crt_flicker
+        if (self.crt.enabled, self.crt.flicker) == (config.crt_effects, flicker):
+            return
+        self.crt.enabled = config.crt_effects
+        self.crt.flicker = flicker
+        self.crt.next_flicker()
+        if flicker:
+            from wastelandhub.widgets.animation import get_animation_clock
+
+            self._flicker = get_animation_clock(self).add(
+                self._flicker_step, self.FLICKER_INTERVAL
+            )
+        elif self._flicker is not None:
+            self._flicker.stop()
+            self._flicker = None
+        if self.screen_stack:
+            self.screen.refresh()
+
+    def _flicker_step(self, now: float) -> None:
+        if self.crt.next_flicker():
+            self.screen.refresh()
+
+    def get_line_filters(self) -> Sequence[LineFilter]:
+        """Add the CRT flicker to the filters applied to every widget."""
+        filters = super().get_line_filters()
+        if self.crt is None:
+            return filters
+        return [*filters, *self.crt.get_line_filters()]
+
+    # --- Performance HUD ---
+
+    def action_toggle_perf_hud(self) -> None:
+        """Show or hide the performance overlay, recording only while shown."""
+        from wastelandhub.widgets.perf_hud import PerfHud, PerfMonitor
+
+        if self.perf_monitor is None:
+            self.perf_monitor = PerfMonitor(self)
+            self.perf_monitor.subscribe(lambda sample: self._follow_screen())
+        if self.perf_monitor.recording:
+            self.perf_monitor.stop()
+            if self._perf_hud is not None:
+                self._perf_hud.remove()
+                self._perf_hud = None
+            return
+        self.perf_monitor.start()
+        self._perf_hud = PerfHud(self.perf_monitor)
+        self.screen.mount(self._perf_hud)
+
+    def _follow_screen(self) -> None:
+        """Move the overlay onto the current screen after navigation."""
+        from wastelandhub.widgets.perf_hud import PerfHud
+
+        hud = self._perf_hud
+        if hud is None or hud.screen is self.screen:
+            return
+        hud.remove()
+        self._perf_hud = PerfHud(self.perf_monitor)
+        self.screen.mount(self._perf_hud)
+
+    def action_dump_perf(self) -> None:
+        """Write the recorded performance samples to the data directory."""
+        if self.perf_monitor is None or not self.perf_monitor.samples:
+            self.notify("No performance samples yet; press F12 to start recording.")
+            return
+        name = time.strftime("perf-%Y%m%d-%H%M%S.json")
+        path = self.perf_monitor.dump(get_config().data_dir / "perf" / name)
+        self.notify(f"Performance samples written to {path}")
+
+    async def on_unmount(self) -> None:
+        """Stop background services."""
+        if self._unsubscribe_config is not None:
+            self._unsubscribe_config()
+        if self.animation_clock is not None:
+            self.animation_clock.clear()
+        if self.config_watcher is not None:
+            self.config_watcher.stop()
+        if self.puzzle_pool is not None:
+            self.puzzle_pool.stop()
+        if self.log_ingestor is not None:
+            self.log_ingestor.stop()
+        if self.perf_monitor is not None:
+            self.perf_monitor.stop()
 
 
 def main() -> None:
     """Main entry point for WastelandHub."""
-    app = WastelandHubApp()
-    app.run()
+    from wastelandhub.cli import main as cli_main
+
+    raise SystemExit(cli_main())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""Startup profiling for ``wastelandhub --profile-startup``.
+
+Run as ``python -m wastelandhub.profiling`` in a fresh interpreter so that
+import costs are measured from a cold module cache.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+def profile_startup() -> list[tuple[str, float]]:
+    """Start the app headlessly and return (phase, seconds) timings."""
+    timings: list[tuple[str, float]] = []
+    start = last = time.perf_counter()
+
+    def mark(phase: str) -> None:
+        nonlocal last
+        now = time.perf_counter()
+        timings.append((phase, now - last))
+        last = now
+
+    import textual.app  # noqa: F401
+
+    mark("import textual")
+
+    from wastelandhub import main
+
+    mark("import wastelandhub")
+
+    from wastelandhub.data.config import get_config, reset_config
+
+    reset_config()
+    get_config()
+    mark("config load")
+
+    from textual.css.stylesheet import Stylesheet
+
+    stylesheet = Stylesheet()
+    stylesheet.read(Path(main.__file__).parent / main.WastelandHubApp.CSS_PATH)
+    stylesheet.parse()
+    mark("stylesheet load")
+
+    from wastelandhub.screens.main_menu import MainMenuScreen
+
+    async def wait_for_first_paint(pilot) -> None:
+        # pause() returns once pending messages are handled and the screen
+        # has been refreshed.
+        await pilot.pause()
+        if not isinstance(pilot.app.screen, MainMenuScreen):
+            raise RuntimeError("Main menu was not shown at startup")
+        mark("first paint of MainMenuScreen")
+        pilot.app.exit()
+
+    main.WastelandHubApp().run(headless=True, auto_pilot=wait_for_first_paint)
+    timings.append(("total to first interactive frame", last - start))
+    return timings
+
+
+def format_report(timings: list[tuple[str, float]]) -> str:
+    """Format timings as an aligned table in milliseconds."""
+    width = max(len(phase) for phase, _ in timings)
+    lines = ["WastelandHub startup profile"]
+    for phase, seconds in timings:
+        lines.append(f"  {phase:<{width}}  {seconds * 1000:8.1f} ms")
+    return "\n".join(lines)
+
+
+def profile_startup_in_subprocess() -> int:
+    """Run the profiler in a fresh interpreter and return its exit code."""
+    return subprocess.call([sys.executable, "-m", "wastelandhub.profiling"])
+
+
+if __name__ == "__main__":
+    print(format_report(profile_startup()))
@@ -0,0 +1,145 @@
+import random
+
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Container, Horizontal
+from textual.screen import Screen
+from textual.widgets import Footer, Header, RichLog, Static
+
+from wastelandhub.data.config import get_config
+from wastelandhub.hacking.engine import HackingGame, generate_puzzle
+from wastelandhub.hacking.solver import best_guess
+from wastelandhub.widgets.animation import Animation, get_animation_clock
+from wastelandhub.widgets.hacking_widget import HackingWidget, MemoryDump
+
+
+class HackingScreen(Screen):
+    """Screen for the terminal password hacking minigame."""
+
+    BINDINGS = [
+        ("escape", "pop_screen", "Back to main menu"),
+        ("n", "new_game", "New terminal"),
+        ("h", "hint", "Hint"),
+        ("a", "toggle_autoplay", "Demo"),
+    ]
+
+    AUTOPLAY_DELAY = 0.8
+    """Seconds between guesses in demo mode."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._rng = random.Random()
+        self._autoplay: Animation | None = None
+        self.game: HackingGame | None = None
+
+    def compose(self) -> ComposeResult:
+        """Compose the hacking board and the guess log."""
+        yield Header()
+
+        with Container(id="hack-container"):
+            yield Static(
+                ">> ROBCO INDUSTRIES (TM) TERMLINK PROTOCOL <<",
+                classes="hack-title",
+            )
+            yield Static(id="hack-status", classes="hack-status")
+            with Horizontal(id="hack-body"):
+                yield HackingWidget(id="hack-board")
+                yield RichLog(id="hack-log", wrap=True)
+
+        yield Footer()
+
+    def on_screen_resume(self) -> None:
+        """Start a fresh terminal every time the screen is entered."""
+        self.action_new_game()
+
+    def action_new_game(self) -> None:
+        """Start a new game with a pre-generated puzzle."""
+        self._stop_autoplay()
+        pool = self.app.puzzle_pool
+        if pool is not None:
+            puzzle = pool.take()
+        else:
+            # Background services have not started yet; calibrating against
+            # the solver would stall the UI, so take an uncalibrated board
+            puzzle = generate_puzzle(get_config().terminal_difficulty, self._rng)
+        self.game = HackingGame(puzzle)
+        dump = MemoryDump.build(puzzle.words, self._rng)
+
+        board = self.query_one("#hack-board", HackingWidget)
+        board.set_game(self.game, dump)
+        self.query_one("#hack-log", RichLog).clear()
+        self._update_status()
+        board.focus()
+
+    @on(HackingWidget.Guessed)
+    def on_guess(self, event: HackingWidget.Guessed) -> None:
+        """Score a guess and report it in the log."""
+        game = self.game
+        if game is None or game.over:
+            return
+        likeness = game.guess(event.index)
+        word = game.puzzle.words[event.index]
+
+        hack_log = self.query_one("#hack-log", RichLog)
+        hack_log.write(f">{word}")
+        if game.solved:
+            hack_log.write(">Exact match!\n>Please wait\n>while system\n>is accessed.")
+        else:
+            hack_log.write(f">Entry denied.\n>Likeness={likeness}")
+        self.query_one("#hack-board", HackingWidget).refresh()
+        self._update_status()
+
+    def action_hint(self) -> None:
+        """Select the guess that eliminates the most candidates."""
+        game = self.game
+        if game is None or game.over:
+            return
+        self.query_one("#hack-board", HackingWidget).selected = best_guess(
+            game.puzzle, game.remaining
+        )
+
+    def action_toggle_autoplay(self) -> None:
+        """Let the solver play the current terminal."""
+        if self._autoplay is not None:
+            self._stop_autoplay()
+        else:
+            self._autoplay = get_animation_clock(self.app).add(
+                self._autoplay_step, self.AUTOPLAY_DELAY
+            )
+
+    def _autoplay_step(self, now: float) -> None:
+        game = self.game
+        if game is None or game.over:
+            self._stop_autoplay()
+            return
+        self.action_hint()
+        self.query_one("#hack-board", HackingWidget).action_guess()
+
+    def _stop_autoplay(self) -> None:
+        if self._autoplay is not None:
+            self._autoplay.stop()
+            self._autoplay = None
+
+    def _update_status(self) -> None:
+        """Show the attempts left or the outcome of the game."""
+        game = self.game
+        status = self.query_one("#hack-status", Static)
+        if game is None:
+            status.update("")
+        elif game.solved:
+            status.update(">> ACCESS GRANTED <<")
+        elif game.over:
+            status.update(">> TERMINAL LOCKED <<  Press N for a new terminal.")
+        else:
+            blocks = " ".join("■" * game.attempts_left)
+            status.update(
+                f"ENTER PASSWORD NOW\n{game.attempts_left} ATTEMPT(S) LEFT: {blocks}"
+            )
+
+    def on_unmount(self) -> None:
+        self._stop_autoplay()
+
+    def action_pop_screen(self) -> None:
+        """Return to the main menu."""
+        self._stop_autoplay()
+        self.app.pop_screen()
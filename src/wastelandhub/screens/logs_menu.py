@@ -1,11 +1,17 @@
-from textual import on
+import threading
+
+from textual import on, work
 from textual.app import ComposeResult
-from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.containers import Horizontal, Vertical
+from textual.message import Message
 from textual.screen import Screen
-from textual.widgets import Button, Footer, Header, Static
+from textual.widgets import Footer, Header, Input, Static
+from textual.worker import get_current_worker
 
-from wastelandhub.data.log_data import LogData
-from wastelandhub.data.config import get_config
+from wastelandhub.data.config import WastelandConfig, get_config, subscribe_config
+from wastelandhub.data.log_store import get_log_store
+from wastelandhub.data.metadata import LogQuery
+from wastelandhub.widgets.log_list import LogList
 from wastelandhub.widgets.typewriter import Typewriter
 
 
@@ -14,8 +20,24 @@ class LogsMenuScreen(Screen):
 
     BINDINGS = [
         ("escape", "pop_screen", "Back to main menu"),
+        ("slash", "focus_search", "Search"),
+        ("s", "skip_typing", "Skip"),
     ]
 
+    PREFETCH_NEIGHBORS = 2
+    """Logs either side of the focused one that are prefetched with it."""
+
+    class LogsPublished(Message):
+        """New logs were added to the log store (posted from any thread)."""
+
+        def __init__(self, keys: list[str]) -> None:
+            super().__init__()
+            self.keys = keys
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._published: list[str] = []
+
     def compose(self) -> ComposeResult:
         """Compose the screen with dynamic log buttons and a typewriter display."""
         yield Header()
@@ -23,15 +45,47 @@ class LogsMenuScreen(Screen):
         with Horizontal():
             with Vertical(id="logs-sidebar"):
                 yield Static(">> AVAILABLE LOGS <<", classes="sidebar-title")
-                with VerticalScroll(id="logs-container"):
-                    # Generate buttons for each log key
-                    for key in LogData.load_default().get_log_keys():
-                        yield Button(f"OPEN {key}", id=f"open-{key}", classes="log-button")
+                yield Input(placeholder="SEARCH...", id="logs-search")
+                # Only the visible rows are mounted, however many logs exist
+                yield LogList(get_log_store().get_log_keys(), id="logs-container")
 
             yield Typewriter(id="typewriter", classes="main-display")
 
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Follow configuration changes and new logs while the screen exists."""
+        self._unsubscribe_config = subscribe_config(self._on_config_changed)
+        typewriter = self.query_one("#typewriter", Typewriter)
+        typewriter.glow = typewriter.scanlines = get_config().crt_effects
+        # Keys only ever get appended, so anything published since compose()
+        # is the tail of the store's key list
+        log_list = self.query_one("#logs-container", LogList)
+        missed, self._unsubscribe_logs = get_log_store().follow(
+            len(log_list.keys), self._on_logs_published
+        )
+        if missed:
+            log_list.extend(missed)
+
+    def on_unmount(self) -> None:
+        self._unsubscribe_config()
+        self._unsubscribe_logs()
+
+    def _on_config_changed(self, config: WastelandConfig) -> None:
+        """Receive a new config snapshot from any thread."""
+        if threading.current_thread() is threading.main_thread():
+            self._apply_config(config)
+        else:
+            self.app.call_from_thread(self._apply_config, config)
+
+    def _apply_config(self, config: WastelandConfig) -> None:
+        """Apply settings that affect the screen while it is running."""
+        typewriter = self.query_one("#typewriter", Typewriter)
+        typewriter.set_cps(config.typewriter_cps)
+        if typewriter.scanlines != config.crt_effects:
+            typewriter.glow = typewriter.scanlines = config.crt_effects
+            typewriter.refresh()
+
     def on_show(self) -> None:
         """Restore focus to the first log button after the screen is shown."""
         self.call_after_refresh(self._focus_first_button)
@@ -48,21 +102,147 @@ class LogsMenuScreen(Screen):
         except Exception:
             pass
 
-    @on(Button.Pressed)
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button presses to start the typewriter effect."""
-        button_id = event.button.id
-        if button_id and button_id.startswith("open-"):
-            key = button_id[5:]  # Remove "open-" prefix
-            log_data = LogData.load_default()
-            if key in log_data.logs:
-                try:
-                    config = get_config()
-                    typewriter = self.query_one("#typewriter", Typewriter)
-                    typewriter.start(log_data.get_log(key), cps=config.typewriter_cps)
-                except Exception as e:
-                    # Add debugging to help identify issues
-                    self.app.log(f"Typewriter error for key {key}: {e}")
+    @on(LogList.Selected)
+    def on_log_selected(self, event: LogList.Selected) -> None:
+        """Handle log selection to start the typewriter effect."""
+        key = event.key
+        store = get_log_store()
+        if key in store:
+            try:
+                config = get_config()
+                typewriter = self.query_one("#typewriter", Typewriter)
+                # Usually a body cache hit, read ahead by _prefetch()
+                text = store.get_log(key)
+                typewriter.start(text, cps=config.typewriter_cps, key=key)
+            except Exception as e:
+                # Add debugging to help identify issues
+                self.app.log(f"Typewriter error for key {key}: {e}")
+
+    # --- Prefetching ---
+
+    @on(LogList.Highlighted)
+    def on_log_highlighted(self, event: LogList.Highlighted) -> None:
+        """Decode the focused log and its neighbours before one is selected.
+
+        Logs held in memory need no reading ahead, so this only runs for an
+        archive-backed store.
+        """
+        store = get_log_store()
+        if not store.decodes_logs:
+            return
+        keys = self.query_one("#logs-container", LogList).keys
+        cache = store.body_cache
+        focused = event.index
+        nearby = range(
+            max(0, focused - self.PREFETCH_NEIGHBORS),
+            min(len(keys), focused + self.PREFETCH_NEIGHBORS + 1),
+        )
+        # The focused log first, then outwards
+        order = sorted(nearby, key=lambda index: abs(index - focused))
+        missing = [keys[i] for i in order if keys[i] not in cache]
+        if missing:
+            self._prefetch(missing)
+
+    @work(thread=True, exclusive=True, group="prefetch")
+    def _prefetch(self, keys: list[str]) -> None:
+        """Read and decode logs off the event loop into the store's body cache.
+
+        Starting a new prefetch cancels this one, so moving quickly through
+        the list only finishes the logs that stay focused.
+        """
+        store = get_log_store()
+        worker = get_current_worker()
+        for key in keys:
+            if worker.is_cancelled:
+                return
+            if key in store:
+                store.get_log(key)
+
+    @on(Input.Changed, "#logs-search")
+    def on_search_changed(self, event: Input.Changed) -> None:
+        """Filter the sidebar on every keystroke."""
+        self._search(event.value)
+
+    @on(Input.Submitted, "#logs-search")
+    def on_search_submitted(self) -> None:
+        """Jump from the search box to the first matching log."""
+        self.query_one("#logs-container", LogList).move_cursor(0)
+
+    @work(thread=True, exclusive=True, group="search")
+    def _search(self, query: str) -> None:
+        """Query the search index off the event loop and update the sidebar.
+
+        Besides words, queries can filter, sort and group the sidebar by log
+        headers, e.g. ``priority:urgent sort:time`` or ``group:from``.
+        """
+        keys = get_log_store().search(query)
+        tags = self._group_tags(keys, query)
+        # Drop the results if a newer keystroke superseded this query
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_logs, keys, tags)
+
+    def _show_logs(self, keys: list[str], tags: dict[str, str] | None) -> None:
+        """Replace the keys listed in the sidebar."""
+        self.query_one("#logs-container", LogList).set_keys(keys, tags)
+
+    @staticmethod
+    def _group_tags(keys: list[str], query: str) -> dict[str, str] | None:
+        """The value each log is grouped by, if the query groups the sidebar."""
+        group = LogQuery.parse(query).group
+        if group is None:
+            return None
+        store = get_log_store()
+        tags = {}
+        for key in keys:
+            meta = store.get_metadata(key)
+            tags[key] = (meta and meta.get(group)) or "-"
+        return tags
+
+    # --- Live ingestion ---
+
+    def _on_logs_published(self, keys: list[str]) -> None:
+        """Receive newly published keys on the ingesting thread."""
+        self.post_message(self.LogsPublished(keys))
+
+    @on(LogsPublished)
+    def on_logs_published(self, event: LogsPublished) -> None:
+        """Collect new keys and add them to the sidebar once per refresh."""
+        if not self._published:
+            self.call_after_refresh(self._flush_published)
+        self._published.extend(event.keys)
+
+    def _flush_published(self) -> None:
+        """Append the collected keys to the sidebar as one batch."""
+        keys, self._published = self._published, []
+        query = self.query_one("#logs-search", Input).value
+        if query.strip():
+            self._append_matching(query, keys)
+        else:
+            self._append_logs(keys, query)
+
+    @work(thread=True, group="published")
+    def _append_matching(self, query: str, keys: list[str]) -> None:
+        """Keep only the new keys that match the active search."""
+        matches = set(get_log_store().search(query))
+        keys = [key for key in keys if key in matches]
+        if keys:
+            tags = self._group_tags(keys, query)
+            self.app.call_from_thread(self._append_logs, keys, query, tags)
+
+    def _append_logs(
+        self, keys: list[str], query: str, tags: dict[str, str] | None = None
+    ) -> None:
+        """Append keys to the sidebar unless the search changed meanwhile."""
+        if self.query_one("#logs-search", Input).value == query:
+            self.query_one("#logs-container", LogList).extend(keys, tags)
+
+    def action_skip_typing(self) -> None:
+        """Show the rest of the log being typed at once."""
+        self.query_one("#typewriter", Typewriter).skip_to_end()
+
+    def action_focus_search(self) -> None:
+        """Move focus to the search box."""
+        self.query_one("#logs-search", Input).focus()
 
     def action_pop_screen(self) -> None:
         """Pop the screen and stop any ongoing typewriter effect."""
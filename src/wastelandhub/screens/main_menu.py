@@ -60,5 +60,7 @@ class MainMenuScreen(Screen):
         """Handle navigation when a button is pressed."""
         if event.button.id == "logs":
             await self.app.push_screen("logs_menu")
+        elif event.button.id == "hack":
+            await self.app.push_screen("hacking")
         elif event.button.id == "logout":
             self.app.exit()
@@ -0,0 +1,132 @@
+"""One frame clock shared by every animation in an app.
+
+Animated widgets register a callback with the app's AnimationClock instead of
+running a timer each. The clock wakes once per frame, and only when some
+animation is due: while nothing is animating no timer is scheduled at all.
+Callbacks are passed the frame time, so animations advance by the time that
+actually elapsed and stay correct when a frame runs late.
+"""
+
+from collections.abc import Callable
+from time import monotonic
+
+from textual.app import App
+from textual.timer import Timer
+
+AnimationCallback = Callable[[float], object]
+
+
+class Animation:
+    """An animation registered with an AnimationClock; stop() removes it."""
+
+    __slots__ = ("callback", "interval", "due", "_clock")
+
+    def __init__(
+        self, clock: "AnimationClock", callback: AnimationCallback, interval: float
+    ) -> None:
+        self._clock: AnimationClock | None = clock
+        self.callback = callback
+        self.interval = interval
+        self.due = monotonic() + interval
+
+    @property
+    def active(self) -> bool:
+        return self._clock is not None
+
+    def stop(self) -> None:
+        """Stop calling the callback. Safe to call more than once."""
+        clock, self._clock = self._clock, None
+        if clock is not None:
+            clock._remove(self)
+
+
+class AnimationClock:
+    """Runs registered animations from one timer, at most FRAME_RATE frames a second.
+
+    Each frame is scheduled for when the earliest animation is next due, so a
+    clock with only slow animations (a flicker every 150 ms) wakes no more
+    often than they need, and a clock with none does not wake at all.
+    """
+
+    FRAME_RATE = 60
+    """Maximum number of frames per second."""
+
+    def __init__(self, app: App, frame_rate: int = FRAME_RATE) -> None:
+        self.app = app
+        self.frame_time = 1.0 / frame_rate
+        self._animations: list[Animation] = []
+        self._timer: Timer | None = None
+        self._next_frame = 0.0  # When the scheduled frame runs
+        self._last_frame = 0.0
+        self.frames = 0
+
+    def __len__(self) -> int:
+        return len(self._animations)
+
+    def add(self, callback: AnimationCallback, interval: float = 0.0) -> Animation:
+        """Call ``callback(now)`` every ``interval`` seconds until stopped.
+
+        ``now`` is the frame's ``time.monotonic()``. Intervals shorter than a
+        frame are rounded up to one frame. The first call comes after one
+        interval.
+        """
+        animation = Animation(self, callback, max(interval, self.frame_time))
+        self._animations.append(animation)
+        self._schedule()
+        return animation
+
+    def clear(self) -> None:
+        """Stop every animation, e.g. when the app shuts down."""
+        for animation in list(self._animations):
+            animation.stop()
+
+    def _remove(self, animation: Animation) -> None:
+        self._animations.remove(animation)
+        if not self._animations and self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def _schedule(self) -> None:
+        """Schedule the next frame for the earliest due animation."""
+        if not self._animations:
+            return
+        due = max(
+            min(animation.due for animation in self._animations),
+            self._last_frame + self.frame_time,
+        )
+        if self._timer is not None:
+            if due >= self._next_frame:
+                return
+            self._timer.stop()  # An earlier frame is needed
+        self._next_frame = due
+        self._timer = self.app.set_timer(
+            max(0.0, due - monotonic()), self._run_frame, name="animation-frame"
+        )
+
+    def _run_frame(self) -> None:
+        """Call every animation that is due, then schedule the next frame."""
+        self._timer = None
+        now = self._last_frame = monotonic()
+        self.frames += 1
+        # Timers may fire a little early; anything due within half a frame runs
+        horizon = now + self.frame_time / 2
+        for animation in list(self._animations):
+            if not animation.active or animation.due > horizon:
+                continue
+            animation.due += animation.interval
+            if animation.due < now:
+                animation.due = now + animation.interval  # Skip missed frames
+            animation.callback(now)
+        self._schedule()
+
+
+def get_animation_clock(app: App) -> AnimationClock:
+    """Get the animation clock of an app, creating it on first use.
+
+    The clock is kept in the app's ``animation_clock`` attribute, so it lives
+    exactly as long as the app.
+    """
+    clock = getattr(app, "animation_clock", None)
+    if clock is None:
+        clock = app.animation_clock = AnimationClock(app)
+    return clock
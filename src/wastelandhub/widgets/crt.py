@@ -0,0 +1,128 @@
+"""CRT post-processing: scanlines, phosphor glow and flicker.
+
+Everything is applied through Textual's line filters and render_line, so it
+only touches rendered strips. Strip.apply_filter caches the result per strip
+and filter, so a line that has not changed since the last frame costs a cache
+lookup, and restyled Styles are memoized per filter.
+
+- scanline() dims every other screen row of a widget that draws them (the
+  Typewriter does, from its render_line).
+- glow() lights up the cells just typed.
+- CRTEffect keeps the flicker level, which the app adds to its line filters
+  so it reaches every widget on screen.
+"""
+
+import random
+from collections.abc import Sequence
+
+from rich.color import Color as RichColor
+from rich.segment import Segment
+from rich.style import Style
+from textual.color import Color
+from textual.filter import LineFilter
+from textual.strip import Strip
+
+SCANLINE_BRIGHTNESS = 0.78
+"""Brightness of every other screen row."""
+
+FLICKER_LEVELS = (1.0, 1.0, 0.97, 0.94)
+"""Brightness levels a flickering screen picks from at random."""
+
+GLOW_STYLES = (
+    Style(color="#e8ffe8", bold=True),
+    Style(color="#b0ffb0", bold=True),
+    Style(color="#70ff70"),
+)
+"""Styles for freshly typed cells, newest first."""
+
+_BACKGROUND = Color(0, 0, 0)
+
+
+class CRTFilter(LineFilter):
+    """Scales the foreground and background colors of a line by brightness."""
+
+    def __init__(self, brightness: float, enabled: bool = True) -> None:
+        super().__init__(enabled=enabled)
+        self.brightness = brightness
+        self._styles: dict[Style, Style] = {}
+
+    def apply(self, segments: list[Segment], background: Color) -> list[Segment]:
+        styles = self._styles
+        result = []
+        for segment in segments:
+            text, style, control = segment
+            if style is None or control:
+                result.append(segment)
+                continue
+            dimmed = styles.get(style)
+            if dimmed is None:
+                dimmed = styles[style] = self._dim(style)
+            result.append(Segment(text, dimmed))
+        return result
+
+    def _dim(self, style: Style) -> Style:
+        return style + Style(
+            color=self._scale(style.color), bgcolor=self._scale(style.bgcolor)
+        )
+
+    def _scale(self, color: RichColor | None) -> RichColor | None:
+        if color is None or color.is_default:
+            return None
+        r, g, b = color.get_truecolor()
+        k = self.brightness
+        return RichColor.from_rgb(r * k, g * k, b * k)
+
+
+_SCANLINE = CRTFilter(SCANLINE_BRIGHTNESS)
+
+
+def scanline(strip: Strip, y: int) -> Strip:
+    """Apply the scanline effect to a strip drawn on screen row y."""
+    return strip.apply_filter(_SCANLINE, _BACKGROUND) if y % 2 else strip
+
+
+class CRTEffect:
+    """The screen's flicker, as a line filter for every widget.
+
+    The effect starts off; enable it and set ``flicker`` to have
+    next_flicker() pick a new brightness.
+    """
+
+    def __init__(self, enabled: bool = False, flicker: bool = False) -> None:
+        self.enabled = enabled
+        self.flicker = flicker
+        self.level = 1.0
+        self._filters: dict[float, CRTFilter] = {}
+
+    def next_flicker(self) -> bool:
+        """Pick a new flicker level. Returns True if the screen needs a repaint."""
+        level = random.choice(FLICKER_LEVELS) if self.enabled and self.flicker else 1.0
+        changed = level != self.level
+        self.level = level
+        return changed
+
+    def get_line_filters(self) -> Sequence[LineFilter]:
+        """Filters that apply the current flicker level, if it dims the screen."""
+        if self.level == 1.0:
+            return ()
+        key = round(self.level, 3)
+        line_filter = self._filters.get(key)
+        if line_filter is None:
+            line_filter = self._filters[key] = CRTFilter(key)
+        return (line_filter,)
+
+
+def glow(strip: Strip, end: int) -> Strip:
+    """Light up the cells just before ``end``, as if freshly hit by the beam."""
+    start = max(0, end - len(GLOW_STYLES))
+    if end <= 0 or end > strip.cell_length:
+        return strip
+    cuts = list(range(start, end + 1))
+    parts = strip.divide([*cuts, strip.cell_length])
+    # parts[0] is before the glow, then one cell each, then the rest
+    head, cells, tail = parts[0], parts[1 : end - start + 1], parts[end - start + 1 :]
+    lit = [
+        Strip(Segment.apply_style(list(cell), post_style=style))
+        for cell, style in zip(cells, reversed(GLOW_STYLES[: len(cells)]))
+    ]
+    return Strip.join([head, *lit, *tail])
@@ -0,0 +1,145 @@
+import random
+from dataclasses import dataclass
+
+from rich.text import Text
+from textual.binding import Binding
+from textual.events import Click
+from textual.message import Message
+from textual.reactive import reactive
+from textual.widget import Widget
+
+from wastelandhub.hacking.engine import HackingGame
+
+GARBAGE = "!@#$%^&*()-_=+[]{}<>;:'\",./?|\\"
+ROWS = 16
+ROW_WIDTH = 12
+COLUMNS = 2
+ADDRESS_WIDTH = 7  # "0xF4F0 "
+COLUMN_GAP = 2
+
+
+@dataclass(frozen=True)
+class MemoryDump:
+    """Fake memory dump with the board's words hidden among garbage.
+
+    ``owner[i]`` is the index of the word covering character i, or -1.
+    """
+
+    chars: str
+    owner: tuple[int, ...]
+    base_address: int
+
+    @classmethod
+    def build(cls, words: tuple[str, ...], rng: random.Random) -> "MemoryDump":
+        """Scatter words through the dump with at least one garbage char between."""
+        size = ROWS * ROW_WIDTH * COLUMNS
+        slack = size - sum(len(word) for word in words) - len(words)
+        if slack < 0:
+            raise ValueError("Too many words to fit in the memory dump")
+        cuts = sorted(rng.randint(0, slack) for _ in words)
+        gaps = [b - a for a, b in zip([0, *cuts], cuts)]
+
+        chars: list[str] = []
+        owner: list[int] = []
+        for index, (word, gap) in enumerate(zip(words, gaps)):
+            chars.extend(rng.choice(GARBAGE) for _ in range(gap + 1))
+            owner.extend([-1] * (gap + 1))
+            chars.extend(word)
+            owner.extend([index] * len(word))
+        tail = size - len(chars)
+        chars.extend(rng.choice(GARBAGE) for _ in range(tail))
+        owner.extend([-1] * tail)
+
+        base_address = rng.randrange(0xF000, 0xFF00, ROW_WIDTH)
+        return cls("".join(chars), tuple(owner), base_address)
+
+    def position(self, x: int, y: int) -> int | None:
+        """Map a cell in the rendered dump to a character index."""
+        if not 0 <= y < ROWS:
+            return None
+        column_width = ADDRESS_WIDTH + ROW_WIDTH + COLUMN_GAP
+        column, x = divmod(x, column_width)
+        x -= ADDRESS_WIDTH
+        if column >= COLUMNS or not 0 <= x < ROW_WIDTH:
+            return None
+        return (column * ROWS + y) * ROW_WIDTH + x
+
+
+class HackingWidget(Widget, can_focus=True):
+    """Displays a hacking board as a memory dump and lets the user pick words."""
+
+    BINDINGS = [
+        Binding("left,up", "previous_word", "Previous word", show=False),
+        Binding("right,down", "next_word", "Next word", show=False),
+        Binding("enter", "guess", "Enter password"),
+    ]
+
+    selected: reactive[int] = reactive(0)
+
+    class Guessed(Message):
+        """Posted when the user enters the selected word."""
+
+        def __init__(self, index: int) -> None:
+            super().__init__()
+            self.index = index
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.game: HackingGame | None = None
+        self.dump: MemoryDump | None = None
+
+    def set_game(self, game: HackingGame, dump: MemoryDump) -> None:
+        """Show a new board and select its first word."""
+        self.game = game
+        self.dump = dump
+        self.selected = 0
+        self.refresh()
+
+    def render(self) -> Text:
+        if self.game is None or self.dump is None:
+            return Text("")
+        dump = self.dump
+        guessed = {index for index, _ in self.game.history}
+        text = Text(no_wrap=True)
+        for row in range(ROWS):
+            for column in range(COLUMNS):
+                start = (column * ROWS + row) * ROW_WIDTH
+                address = dump.base_address + start
+                text.append(f"0x{address:04X} ", style="dim")
+                for i in range(start, start + ROW_WIDTH):
+                    owner = dump.owner[i]
+                    if owner == -1:
+                        style = ""
+                    elif owner == self.selected:
+                        style = "reverse"
+                    elif owner in guessed:
+                        style = "dim"
+                    else:
+                        style = "bold"
+                    text.append(dump.chars[i], style=style)
+                if column < COLUMNS - 1:
+                    text.append(" " * COLUMN_GAP)
+            text.append("\n")
+        return text
+
+    def action_previous_word(self) -> None:
+        if self.game is not None:
+            self.selected = (self.selected - 1) % len(self.game.puzzle.words)
+
+    def action_next_word(self) -> None:
+        if self.game is not None:
+            self.selected = (self.selected + 1) % len(self.game.puzzle.words)
+
+    def action_guess(self) -> None:
+        if self.game is not None and not self.game.over:
+            self.post_message(self.Guessed(self.selected))
+
+    def on_click(self, event: Click) -> None:
+        """Select and enter the word under the mouse."""
+        offset = event.get_content_offset(self)
+        if self.dump is None or offset is None:
+            return
+        position = self.dump.position(offset.x, offset.y)
+        if position is not None and self.dump.owner[position] != -1:
+            self.selected = self.dump.owner[position]
+            self.action_guess()
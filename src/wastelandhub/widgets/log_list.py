@@ -0,0 +1,258 @@
+from collections.abc import Mapping, Sequence
+from math import ceil
+
+from textual import on
+from textual.containers import VerticalScroll
+from textual.content import Content
+from textual.events import DescendantFocus, Resize
+from textual.message import Message
+from textual.widget import Widget
+from textual.widgets import Button
+
+
+class LogRow(Button):
+    """A recyclable sidebar row that opens one log."""
+
+    def __init__(self) -> None:
+        super().__init__("", classes="log-button")
+        self.index = -1
+        self.log_key = ""
+        self.tag: str | None = None
+
+    def bind(self, index: int, key: str, tag: str | None = None) -> None:
+        """Point this row at the log with the given position, key and tag."""
+        if index == self.index and key == self.log_key and tag == self.tag:
+            return
+        self.index = index
+        self.log_key = key
+        self.tag = tag
+        if tag is None:
+            self.label = f"OPEN {key}"
+        else:
+            # Tags come from log text, so never parse them as markup
+            self.label = Content(f"{tag} | {key}")
+
+
+class LogList(VerticalScroll):
+    """A virtualized list of log buttons.
+
+    Only the rows that fit in the viewport (plus OVERSCAN rows either side)
+    are mounted. Spacers above and below stand in for the rest of the list,
+    and rows are re-bound to new keys as the user scrolls, so the DOM size
+    does not depend on the number of logs.
+
+    Rows can be tagged, e.g. with the value the list is grouped by, which is
+    shown in place of the "OPEN" prefix.
+    """
+
+    DEFAULT_CSS = """
+    LogList > LogRow {
+        height: 3;
+    }
+    """
+
+    ROW_HEIGHT = 3
+    """Height of each row in cells (must match the CSS above)."""
+
+    OVERSCAN = 2
+    """Rows kept mounted beyond each edge of the viewport."""
+
+    INITIAL_ROWS = 12
+    """Rows mounted before the viewport size is known."""
+
+    BINDINGS = [
+        ("up", "cursor_up", "Previous log"),
+        ("down", "cursor_down", "Next log"),
+        ("pageup", "page_up", "Page up"),
+        ("pagedown", "page_down", "Page down"),
+        ("home", "first", "First log"),
+        ("end", "last", "Last log"),
+    ]
+
+    class Selected(Message):
+        """Posted when a log row is pressed."""
+
+        def __init__(self, key: str) -> None:
+            super().__init__()
+            self.key = key
+
+    class Highlighted(Message):
+        """Posted when a log row gains focus, before it is (maybe) selected."""
+
+        def __init__(self, key: str, index: int) -> None:
+            super().__init__()
+            self.key = key
+            self.index = index
+
+    def __init__(self, keys: Sequence[str] = (), **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._keys: list[str] = list(keys)
+        self._tags: dict[str, str] = {}
+        self._rows: list[LogRow] = []
+        self._first = 0
+        self._top = Widget(classes="log-list-spacer")
+        self._bottom = Widget(classes="log-list-spacer")
+        self.cursor = 0
+        """Index of the log that keyboard navigation is positioned on."""
+
+    @property
+    def keys(self) -> Sequence[str]:
+        """The log keys shown by the list, in display order."""
+        return self._keys
+
+    def compose(self):
+        """Compose the spacers and an initial pool of rows."""
+        self._rows = [LogRow() for _ in range(min(len(self._keys), self.INITIAL_ROWS))]
+        self._bind_rows()
+        yield self._top
+        yield from self._rows
+        yield self._bottom
+
+    def set_keys(
+        self, keys: Sequence[str], tags: Mapping[str, str] | None = None
+    ) -> None:
+        """Replace the listed logs (and their tags) and scroll back to the top."""
+        self._keys = list(keys)
+        self._tags = dict(tags or {})
+        self.cursor = 0
+        self.scroll_to(y=0, animate=False, immediate=True)
+        self._first = 0
+        self._resize_pool()
+        self._bind_rows()
+
+    def extend(
+        self, keys: Sequence[str], tags: Mapping[str, str] | None = None
+    ) -> None:
+        """Append logs to the end of the list without disturbing the view."""
+        self._keys.extend(keys)
+        self._tags.update(tags or {})
+        self._resize_pool()
+        self._bind_rows()
+
+    def row_for(self, index: int) -> LogRow | None:
+        """Return the mounted row bound to index, if it is in the window."""
+        offset = index - self._first
+        if 0 <= offset < len(self._rows):
+            return self._rows[offset]
+        return None
+
+    # --- Windowing ---
+
+    def on_resize(self, event: Resize) -> None:
+        """Grow or shrink the row pool to match the viewport."""
+        self._resize_pool()
+        self._sync_window()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        self._sync_window()
+
+    def _pool_size(self) -> int:
+        """Number of rows needed to cover the viewport plus overscan."""
+        height = self.scrollable_content_region.height
+        if not height:
+            return min(len(self._keys), self.INITIAL_ROWS)
+        visible = ceil(height / self.ROW_HEIGHT) + 1
+        return min(len(self._keys), visible + 2 * self.OVERSCAN)
+
+    def _resize_pool(self) -> None:
+        """Mount or remove rows so the pool matches _pool_size()."""
+        size = self._pool_size()
+        if size > len(self._rows):
+            new_rows = [LogRow() for _ in range(size - len(self._rows))]
+            self._rows.extend(new_rows)
+            if self.is_mounted:
+                self.mount(*new_rows, before=self._bottom)
+        elif size < len(self._rows):
+            extra_rows = self._rows[size:]
+            del self._rows[size:]
+            for row in extra_rows:
+                row.remove()
+
+    def _sync_window(self) -> None:
+        """Re-bind rows if scrolling moved the window."""
+        first = int(self.scroll_y) // self.ROW_HEIGHT - self.OVERSCAN
+        first = max(0, min(first, len(self._keys) - len(self._rows)))
+        if first != self._first:
+            self._first = first
+            self._bind_rows()
+
+    def _bind_rows(self) -> None:
+        """Bind every pooled row to its key and size the spacers around them."""
+        first = self._first = max(
+            0, min(self._first, len(self._keys) - len(self._rows))
+        )
+        tags = self._tags
+        for offset, row in enumerate(self._rows):
+            key = self._keys[first + offset]
+            row.bind(first + offset, key, tags.get(key))
+        below = len(self._keys) - first - len(self._rows)
+        self._top.styles.height = first * self.ROW_HEIGHT
+        self._bottom.styles.height = below * self.ROW_HEIGHT
+        self._restore_focus()
+
+    def _restore_focus(self) -> None:
+        """Keep focus on the cursor log after rows were re-bound."""
+        if not self.is_mounted:
+            return
+        focused = self.app.focused
+        if isinstance(focused, LogRow) and focused in self._rows:
+            if focused.index != self.cursor:
+                row = self.row_for(self.cursor)
+                (row or self).focus(scroll_visible=False)
+
+    # --- Navigation ---
+
+    def move_cursor(self, index: int) -> None:
+        """Move the cursor to index, scrolling and focusing its row."""
+        if not self._keys:
+            return
+        index = max(0, min(index, len(self._keys) - 1))
+        self.cursor = index
+        top = index * self.ROW_HEIGHT
+        bottom = top + self.ROW_HEIGHT
+        height = self.scrollable_content_region.height
+        if top < self.scroll_y:
+            self.scroll_to(y=top, animate=False, immediate=True)
+        elif bottom > self.scroll_y + height:
+            self.scroll_to(y=bottom - height, animate=False, immediate=True)
+        self._sync_window()
+        row = self.row_for(index)
+        if row is not None:
+            # Already scrolled into place; the row's layout may still be stale
+            row.focus(scroll_visible=False)
+
+    def _page_rows(self) -> int:
+        return max(1, self.scrollable_content_region.height // self.ROW_HEIGHT)
+
+    def action_cursor_up(self) -> None:
+        self.move_cursor(self.cursor - 1)
+
+    def action_cursor_down(self) -> None:
+        self.move_cursor(self.cursor + 1)
+
+    def action_page_up(self) -> None:
+        self.move_cursor(self.cursor - self._page_rows())
+
+    def action_page_down(self) -> None:
+        self.move_cursor(self.cursor + self._page_rows())
+
+    def action_first(self) -> None:
+        self.move_cursor(0)
+
+    def action_last(self) -> None:
+        self.move_cursor(len(self._keys) - 1)
+
+    @on(DescendantFocus)
+    def _track_focus(self, event: DescendantFocus) -> None:
+        """Follow focus changes made by Tab or the mouse."""
+        if isinstance(event.widget, LogRow):
+            self.cursor = event.widget.index
+            self.post_message(self.Highlighted(event.widget.log_key, self.cursor))
+
+    @on(Button.Pressed)
+    def _select_row(self, event: Button.Pressed) -> None:
+        """Translate row presses into Selected messages."""
+        if isinstance(event.button, LogRow):
+            event.stop()
+            self.post_message(self.Selected(event.button.log_key))
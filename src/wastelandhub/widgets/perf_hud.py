@@ -0,0 +1,318 @@
+"""Developer performance overlay: frame time, loop lag, animations, DOM size, RSS.
+
+PerfMonitor only measures while it records, so it costs nothing until the
+HUD is first shown. Every ``interval`` seconds the measurements are folded
+into one sample, and the last ``window`` samples can be dumped to JSON for
+offline comparison.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+
+from textual import __version__ as textual_version
+from textual.app import App
+from textual.screen import Screen
+from textual.timer import Timer
+from textual.widgets import Static
+
+from wastelandhub.data.log_store import get_log_store
+from wastelandhub.widgets.animation import get_animation_clock
+
+PerfSample = dict[str, object]
+SampleCallback = Callable[[PerfSample], None]
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or its peak where that is unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _FrameTimer:
+    """Times screen updates by wrapping Screen._on_timer_update.
+
+    Textual has no public hook around a frame: its update timer calls the
+    private per-frame update directly, without a message. So that method is
+    wrapped, but only while at least one monitor records, and the original
+    is put back when the last one stops. Frames are credited to the
+    ``perf_monitor`` of the screen's app, if that monitor is recording.
+    """
+
+    def __init__(self) -> None:
+        self.users = 0
+        self._update: Callable | None = None
+
+    def acquire(self) -> bool:
+        """Start timing frames. False if Textual no longer has the method."""
+        if self.users == 0:
+            update = getattr(Screen, "_on_timer_update", None)
+            if not callable(update):
+                return False
+            self._update = update
+            Screen._on_timer_update = self._wrap(update)
+        self.users += 1
+        return True
+
+    def release(self) -> None:
+        self.users -= 1
+        if self.users == 0 and self._update is not None:
+            Screen._on_timer_update = self._update
+            self._update = None
+
+    @staticmethod
+    def _wrap(update: Callable) -> Callable:
+        @wraps(update)
+        def timed_update(screen: Screen, *args, **kwargs):
+            monitor = getattr(screen.app, "perf_monitor", None)
+            if not isinstance(monitor, PerfMonitor) or not monitor.recording:
+                return update(screen, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return update(screen, *args, **kwargs)
+            finally:
+                monitor.record_frame(time.perf_counter() - start)
+
+        return timed_update
+
+
+_frame_timer = _FrameTimer()
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class PerfMonitor:
+    """Rolling window of UI performance samples for an app.
+
+    Each sample covers the last ``interval`` seconds:
+
+    - ``frames``, ``frame_ms_p50``, ``frame_ms_max``: screen updates (layout,
+      compositing and writing to the terminal) and how long they took; only
+      timed when the monitor is the app's ``perf_monitor``
+    - ``loop_lag_ms_p50``, ``loop_lag_ms_max``: how late a probe timer set
+      every ``LAG_PROBE_INTERVAL`` seconds ran
+    - ``animations``: animations registered with the app's animation clock,
+      ``animation_frames``: frames the clock ran
+    - ``dom_nodes``: widgets on the current screen, ``rss_bytes``: process RSS
+    - ``body_cache``: hits, misses, evictions and size of the log store's
+      decoded-body cache since startup
+    """
+
+    LAG_PROBE_INTERVAL = 0.05
+
+    def __init__(self, app: App, interval: float = 0.5, window: int = 120) -> None:
+        self.app = app
+        self.interval = interval
+        self.samples: deque[PerfSample] = deque(maxlen=window)
+        self._frames: list[float] = []
+        self._lags: list[float] = []
+        self._sampler: Timer | None = None
+        self._probe: Timer | None = None
+        self._probe_due = 0.0
+        self._times_frames = False
+        self._recording = False
+        self._animation_frames = 0
+        self._started = 0.0
+        self._subscribers: list[SampleCallback] = []
+
+    @property
+    def recording(self) -> bool:
+        return self._recording
+
+    def start(self) -> None:
+        """Start recording."""
+        if self.recording:
+            return
+        self._recording = True
+        self._started = time.monotonic()
+        self._frames, self._lags = [], []
+        self._animation_frames = get_animation_clock(self.app).frames
+        self._times_frames = _frame_timer.acquire()
+        self._sampler = self.app.set_interval(
+            self.interval, self.sample, name="perf-sampler"
+        )
+        self._schedule_probe()
+
+    def stop(self) -> None:
+        """Stop recording and unhook from Textual; the samples are kept."""
+        if not self.recording:
+            return
+        self._recording = False
+        if self._times_frames:
+            _frame_timer.release()
+            self._times_frames = False
+        for timer in (self._sampler, self._probe):
+            if timer is not None:
+                timer.stop()
+        self._sampler = self._probe = None
+
+    def record_frame(self, seconds: float) -> None:
+        self._frames.append(seconds)
+
+    def _schedule_probe(self) -> None:
+        self._probe_due = time.monotonic() + self.LAG_PROBE_INTERVAL
+        self._probe = self.app.set_timer(
+            self.LAG_PROBE_INTERVAL, self._run_probe, name="perf-lag-probe"
+        )
+
+    def _run_probe(self) -> None:
+        """Record how late the probe ran, then set the next one."""
+        self._lags.append(max(0.0, time.monotonic() - self._probe_due))
+        if self.recording:
+            self._schedule_probe()
+
+    def sample(self) -> PerfSample:
+        """Fold the measurements since the last sample into a new sample."""
+        frames, lags = self._frames, self._lags
+        self._frames, self._lags = [], []
+        clock = get_animation_clock(self.app)
+        animation_frames = clock.frames - self._animation_frames
+        self._animation_frames = clock.frames
+        screen = self.app.screen
+        nodes = list(screen.walk_children(with_self=True))
+        sample: PerfSample = {
+            "time": round(time.monotonic() - self._started, 3),
+            "screen": type(screen).__name__,
+            "frames": len(frames),
+            "frame_ms_p50": round(_percentile(frames, 0.5) * 1000, 3),
+            "frame_ms_max": round(max(frames, default=0.0) * 1000, 3),
+            "loop_lag_ms_p50": round(_percentile(lags, 0.5) * 1000, 3),
+            "loop_lag_ms_max": round(max(lags, default=0.0) * 1000, 3),
+            "animations": len(clock),
+            "animation_frames": animation_frames,
+            "dom_nodes": len(nodes),
+            "rss_bytes": current_rss_bytes(),
+            "body_cache": get_log_store().body_cache.stats(),
+        }
+        if not self._times_frames:
+            # This Textual version cannot be hooked to time frames
+            sample.update(frames=None, frame_ms_p50=None, frame_ms_max=None)
+        self.samples.append(sample)
+        for callback in list(self._subscribers):
+            callback(sample)
+        return sample
+
+    def subscribe(self, callback: SampleCallback) -> Callable[[], None]:
+        """Call callback with every new sample. Returns an unsubscribe function."""
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def dump(self, path: Path) -> Path:
+        """Write the sample window and environment details to a JSON file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "interval": self.interval,
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "textual": textual_version,
+                "terminal": os.environ.get("TERM", ""),
+                "size": list(self.app.size),
+            },
+            "samples": list(self.samples),
+        }
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        return path
+
+
+class PerfHud(Static):
+    """Overlay showing the latest PerfMonitor sample."""
+
+    DEFAULT_CSS = """
+    PerfHud {
+        overlay: screen;
+        position: absolute;
+        width: 44;
+        height: auto;
+        padding: 0 1;
+        background: #001100 90%;
+        color: #00ff00;
+        border: round #00ff00;
+    }
+    """
+
+    WIDTH = 44
+
+    def __init__(self, monitor: PerfMonitor, **kwargs) -> None:
+        super().__init__("PERF: sampling...", **kwargs)
+        self.monitor = monitor
+        self._unsubscribe: Callable[[], None] | None = None
+
+    def on_mount(self) -> None:
+        self._unsubscribe = self.monitor.subscribe(self.show_sample)
+        self._align_right()
+        if self.monitor.samples:
+            self.show_sample(self.monitor.samples[-1])
+
+    def on_unmount(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+
+    def show_sample(self, sample: PerfSample) -> None:
+        self._align_right()
+        self.update(self.format_sample(sample, self.monitor.interval))
+
+    def _align_right(self) -> None:
+        """Keep to the top right corner, away from the log list and menus."""
+        self.styles.offset = (max(0, self.screen.size.width - self.WIDTH - 1), 1)
+
+    @classmethod
+    def format_sample(cls, sample: PerfSample, interval: float) -> str:
+        """Render a sample as the HUD's text."""
+        rss = sample["rss_bytes"]
+        bodies: dict[str, int] = sample["body_cache"]
+        lookups = bodies["hits"] + bodies["misses"]
+        mib = 1024 * 1024
+        lines = [f"PERF  {sample['screen']}"]
+        if sample["frames"] is None:
+            lines.append("frame  n/a")
+        else:
+            lines.append(
+                f"frame  {sample['frame_ms_p50']:6.1f} ms p50"
+                f" {sample['frame_ms_max']:6.1f} max"
+                f" {sample['frames'] / interval:4.0f}/s"
+            )
+        lines.append(
+            f"lag    {sample['loop_lag_ms_p50']:6.1f} ms p50"
+            f" {sample['loop_lag_ms_max']:6.1f} max"
+        )
+        lines.append(
+            f"anim   {sample['animations']:3d} running"
+            f" {sample['animation_frames'] / interval:5.0f} frames/s"
+        )
+        lines.append(f"dom    {sample['dom_nodes']:3d} nodes")
+        lines.append(
+            "rss    n/a" if rss is None else f"rss    {rss / mib:6.1f} MiB"
+        )
+        lines.append(
+            f"bodies {bodies['hits'] / max(lookups, 1):4.0%} hit"
+            f" {bodies['bytes'] / mib:5.1f}/{bodies['max_bytes'] / mib:.0f} MiB"
+        )
+        return "\n".join(lines)
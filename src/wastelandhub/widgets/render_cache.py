@@ -0,0 +1,47 @@
+"""LRU cache of logs already rendered to strips, shared by every Typewriter."""
+
+from dataclasses import dataclass
+
+from textual.strip import Strip
+
+from wastelandhub.data.lru import ByteBudgetLRU
+
+RenderKey = tuple[str, int, int, str]
+"""(log key, hash of the log text, render width, theme)."""
+
+_STRIP_OVERHEAD = 120
+_SEGMENT_OVERHEAD = 80
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedLog:
+    """The strips of one log rendered at one width."""
+
+    strips: tuple[Strip, ...]
+    widest: int
+    """Cell width of the widest strip."""
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the strips."""
+        total = 0
+        for strip in self.strips:
+            segments = list(strip)
+            total += _STRIP_OVERHEAD + _SEGMENT_OVERHEAD * len(segments)
+            total += sum(len(segment.text) for segment in segments)
+        return total
+
+
+class RenderCache(ByteBudgetLRU[RenderKey, RenderedLog]):
+    """Rendered logs keyed by RenderKey, sized by the memory of their strips."""
+
+    def sizeof(self, value: RenderedLog) -> int:
+        return value.nbytes
+
+
+_cache = RenderCache()
+
+
+def get_render_cache() -> RenderCache:
+    """Get the application-wide render cache."""
+    return _cache
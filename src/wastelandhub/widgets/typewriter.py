@@ -1,50 +1,443 @@
+from bisect import bisect_right
+from time import monotonic
+
+from rich.measure import measure_renderables
+from rich.segment import Segment
+from textual.events import Resize
+from textual.geometry import Size
+from textual.strip import Strip
 from textual.widgets import RichLog
 
+from wastelandhub.data.line_index import LineIndex
+from wastelandhub.widgets.animation import Animation, get_animation_clock
+from wastelandhub.widgets.crt import glow, scanline
+from wastelandhub.widgets.render_cache import (
+    RenderedLog,
+    RenderKey,
+    get_render_cache,
+)
+
 
 class Typewriter(RichLog):
-    """A RichLog widget that simulates a typewriter effect by gradually revealing text."""
+    """A RichLog widget that simulates a typewriter effect by gradually revealing text.
+
+    Text is revealed incrementally: finished lines are written to the log once
+    and never touched again. The line being typed is not part of the log
+    until it is finished: it is kept as strips of TAIL_CHUNK cells that only
+    the new characters are rendered into, and drawn by render_line, so typing
+    a line costs time linear in its length however long it is. Ticks come
+    from the app's AnimationClock and are capped at its frame rate, so high
+    ``cps`` values reveal several characters per frame instead of scheduling
+    a callback per character.
+
+    Logs started with a ``key`` are cached once fully rendered, per theme and
+    (when wrapping) per width. Re-opening a log types it again, but skipping
+    to its end or resizing back to a previous width shows the cached lines
+    instead of rendering the text again, and without wrapping the typed lines
+    are replayed from the cache as they are completed.
+
+    While typing, the newest characters glow like freshly lit phosphor (set
+    ``glow`` to False to disable). Set ``scanlines`` to dim every other row.
+
+    Logs longer than PAGED_THRESHOLD are viewed in pages: only the first
+    screenful is typed, then lines are rendered from a LineIndex as they
+    scroll into view, and only the lines near the visible ones are kept.
+    Paging renders one row per log line, so a Typewriter with ``wrap`` set
+    never pages and types every log in full.
+    """
+
+    PAGED_THRESHOLD = 256 * 1024
+    """Logs longer than this many characters are viewed in pages (unless
+    wrapping)."""
+
+    PAGE_BUFFER = 2
+    """Screenfuls of rendered lines kept above and below the visible ones."""
+
+    TAIL_CHUNK = 256
+    """Cells per strip of the line being typed."""
+
+    _RICH_LOG_STATE = (
+        "_line_cache",
+        "_start_line",
+        "_widest_line_width",
+        "_deferred_renders",
+    )
+    """RichLog internals that showing cached strips relies on."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Without the RichLog internals it relies on, the render cache is off
+        self._reuse_renders = all(hasattr(self, name) for name in self._RICH_LOG_STATE)
         self._full_text = ""
         self._current_index = 0
-        self._interval = None
+        self._animation: Animation | None = None
         self._cps = 10  # Default characters per second
+        self._line_start = 0  # Index in _full_text where the unfinished line begins
+        self._tail: list[Strip] = []  # The unfinished line, in chunks
+        self._tail_starts: list[int] = []  # First cell of each chunk
+        self._tail_length = 0  # Cells in the unfinished line
+        self._lines_done = 0  # Lines of _full_text committed to the log
+        self._replay: RenderedLog | None = None  # Cached strips of those lines
+        self._last_tick = 0.0
+        self._carry = 0.0  # Fractional characters owed from previous ticks
+        self._log_key: str | None = None
+        self._shown_key: RenderKey | None = None  # Render currently on screen
+        self.render_cache = get_render_cache()
+        self.glow = True
+        self.scanlines = False
+        self._pages: LineIndex | None = None  # Index of a log viewed in pages
+        self._paging = False  # True once a paged log's first screenful is typed
+        self._page_strips: dict[int, Strip] = {}
 
-    def start(self, text: str, cps: int = 10) -> None:
-        """Start the typewriter effect with the given text and speed."""
+    def start(self, text: str, cps: int = 10, key: str | None = None) -> None:
+        """Start the typewriter effect with the given text and speed.
+
+        If ``key`` identifies a log that was already rendered, it is still
+        typed, but its completed lines come from the render cache. Logs longer
+        than PAGED_THRESHOLD are typed up to the first screenful and then paged.
+        """
         self.stop()  # Stop any existing effect
         self.clear()
+        self._pages = None
+        self._paging = False
+        self._page_strips = {}
+        if len(text) > self.PAGED_THRESHOLD and not self.wrap:
+            self._pages = LineIndex(text)
+            rows = self.scrollable_content_region.height or 100
+            text = text[: self._pages.line_end(rows - 1)]
+            key = None  # Never rendered in full, so nothing to cache
         self._full_text = text
         self._current_index = 0
+        self._line_start = 0
+        self._clear_tail()
+        self._lines_done = 0
+        self._carry = 0.0
         self._cps = cps
-        interval_seconds = 1.0 / cps
-        self._interval = self.set_interval(interval_seconds, self._type_next_char)
+        self._log_key = key
+        self._shown_key = None
+        self._replay = self._cached_lines()
+        self._last_tick = monotonic()
+        self._schedule_ticks()
+
+    def set_cps(self, cps: int) -> None:
+        """Change the typing speed, taking effect immediately if typing."""
+        self._cps = cps
+        if self._animation:
+            self._animation.stop()
+            self._schedule_ticks()
+
+    def _schedule_ticks(self) -> None:
+        """Tick once per character, but no more often than once a frame."""
+        self._animation = get_animation_clock(self.app).add(
+            self._type_next_frame, 1.0 / self._cps
+        )
 
     def stop(self) -> None:
         """Stop the typewriter effect."""
-        if self._interval:
-            self._interval.stop()
-            self._interval = None
+        if self._animation:
+            self._animation.stop()
+            self._animation = None
 
     def skip_to_end(self) -> None:
-        """Skip to the end of the typewriter effect, displaying the full text immediately."""
+        """Skip to the end of the typewriter effect, displaying the full text immediately.
+
+        Only the text that is not yet on screen is rendered, and nothing at all
+        if the log is in the render cache.
+        """
         self.stop()
-        self.clear()
-        self.write(self._full_text)
+        if self._current_index < len(self._full_text) and not self._show_cached():
+            self._finish()
 
-    def _type_next_char(self) -> None:
-        """Internal method to type the next character."""
-        if self._current_index < len(self._full_text):
-            self._current_index += 1
-            # Clear and write the accumulated text up to current index
-            self.clear()
-            current_text = self._full_text[:self._current_index]
-            self.write(current_text)
-        else:
+    @property
+    def is_typing(self) -> bool:
+        """True while the effect is still revealing text."""
+        return self._animation is not None
+
+    def _type_next_frame(self, now: float) -> None:
+        """Reveal every character that is due since the previous tick."""
+        due = self._carry + (now - self._last_tick) * self._cps
+        self._last_tick = now
+        count = int(due)
+        self._carry = due - count
+        if count:
+            self._reveal(self._current_index + count)
+        if self._current_index >= len(self._full_text):
             self.stop()
+            self._finish()
+
+    def _reveal(self, end: int) -> None:
+        """Reveal ``_full_text`` up to ``end``, rendering only the new text."""
+        text = self._full_text
+        end = min(end, len(text))
+        if end <= self._current_index:
+            return
+
+        # Commit every line completed by this batch in a single write.
+        newline = text.rfind("\n", self._current_index, end)
+        if newline != -1:
+            self._commit_lines(newline)
+            self._line_start = newline + 1
+            self._clear_tail()
+            start = self._line_start
+        else:
+            start = self._current_index
+
+        # Render only the characters typed since the last batch.
+        if start < end:
+            self._extend_tail(text[start:end])
+        self._current_index = end
+        self._update_tail_size(refresh_all=newline != -1)
+
+    def _commit_lines(self, end: int) -> None:
+        """Add the lines from ``_line_start`` up to ``end`` to the log."""
+        text = self._full_text
+        count = text.count("\n", self._line_start, end) + 1
+        if self._replay is None:
+            self.write(text[self._line_start : end])
+        else:
+            done = self._lines_done
+            self._append_strips(self._replay.strips[done : done + count])
+        self._lines_done += count
+
+    def _finish(self) -> None:
+        """Commit the last line, then cache the log or start paging through it."""
+        text = self._full_text
+        if self._line_start < len(text):
+            # Everything not committed yet, without the text's final newline
+            end = len(text) - 1 if text.endswith("\n") else len(text)
+            self._commit_lines(end)
+            self._line_start = len(text)
+            self._clear_tail()
+            self._update_tail_size(refresh_all=True)
+        self._current_index = len(text)
+        if self._pages is None:
+            self._remember()
+        else:
+            self._start_paging()
+
+    def render_line(self, y: int) -> Strip:
+        """Render a line, lighting up the characters just typed."""
+        scroll_x, scroll_y = self.scroll_offset
+        row = scroll_y + y - len(self.lines)
+        rows = self._tail_rows()
+        if self._paging or not 0 <= row < rows:
+            strip = super().render_line(y)
+        else:
+            width = self.scrollable_content_region.width
+            start = row * width if self.wrap else scroll_x
+            strip = self._tail_cells(start, start + width)
+            if self.glow and self.is_typing and row == rows - 1:
+                strip = glow(strip, self._tail_length - start)
+        if self.scanlines:
+            strip = scanline(strip, self.content_region.y + y)
+        return strip
+
+    # --- The line being typed ---
+
+    def _clear_tail(self) -> None:
+        self._tail = []
+        self._tail_starts = []
+        self._tail_length = 0
+
+    def _extend_tail(self, text: str) -> None:
+        """Render ``text`` onto the end of the unfinished line."""
+        strip = self._render_unwrapped(text)
+        tail, starts = self._tail, self._tail_starts
+        start = self._tail_length
+        if tail and tail[-1].cell_length < self.TAIL_CHUNK:
+            # Top up the last chunk, so chunks stay few and short
+            start = starts.pop()
+            strip = Strip.join([tail.pop(), strip]).simplify()
+        tail.append(strip)
+        starts.append(start)
+        self._tail_length = start + strip.cell_length
+
+    def _tail_rows(self) -> int:
+        """Rows the unfinished line takes on screen."""
+        if not self._tail_length:
+            return 0
+        width = self.scrollable_content_region.width
+        return -(-self._tail_length // width) if self.wrap and width else 1
+
+    def _tail_cells(self, start: int, end: int) -> Strip:
+        """Cells ``start`` to ``end`` of the unfinished line, padded to fit."""
+        starts = self._tail_starts
+        first = last = max(0, bisect_right(starts, start) - 1)
+        while last < len(starts) and starts[last] < end:
+            last += 1
+        strip = Strip.join(self._tail[first : max(last, first + 1)])
+        offset = starts[first]
+        return strip.crop_extend(
+            start - offset, end - offset, self.rich_style
+        ).apply_style(self.rich_style)
+
+    def _update_tail_size(self, refresh_all: bool) -> None:
+        """Make room for the unfinished line and repaint what changed."""
+        rows = self._tail_rows()
+        width = self._tail_length if not self.wrap else 0
+        height = len(self.lines) + rows
+        size = Size(max(self.virtual_size.width, width), height)
+        if size != self.virtual_size:
+            self.virtual_size = size
+            if self.auto_scroll:
+                self.scroll_end(animate=False, immediate=False, x_axis=False)
+        if refresh_all:
+            self.refresh()
+        elif rows:
+            self.refresh_lines(height - 1)
+
+    # --- Paged logs ---
+
+    def _start_paging(self) -> None:
+        """Replace the typed lines with lines rendered from the index."""
+        self._paging = True
+        self.lines = []
+        self._line_cache.clear()
+        self._update_page_size()
+        if not self._pages.complete:
+            self.call_later(self._index_pages, self._pages)
+
+    def _index_pages(self, pages: LineIndex) -> None:
+        """Index one more chunk of a paged log, between other events."""
+        if pages is not self._pages:
+            return  # Another log was opened meanwhile
+        complete = pages.scan()
+        self._update_page_size()
+        if not complete:
+            self.call_later(self._index_pages, pages)
+
+    def _update_page_size(self) -> None:
+        self._widest_line_width = max(self._widest_line_width, self._pages.widest)
+        self.virtual_size = Size(self._widest_line_width, len(self._pages))
+
+    def _render_line(self, y: int, scroll_x: int, width: int) -> Strip:
+        if not self._paging:
+            return super()._render_line(y, scroll_x, width)
+        strip = self._page_strips.get(y)
+        if strip is None:
+            if y >= len(self._pages):
+                return Strip.blank(width, self.rich_style)
+            height = self.scrollable_content_region.height
+            if len(self._page_strips) > height * (2 * self.PAGE_BUFFER + 2):
+                self._prune_pages(height)
+            strip = self._page_strips[y] = self._render_page_line(y)
+        return strip.crop_extend(scroll_x, scroll_x + width, self.rich_style)
+
+    def _render_unwrapped(self, text: str) -> Strip:
+        """Render one line of text the way write() would without wrapping."""
+        renderable = self._make_renderable(text)
+        console = self.app.console
+        options = console.options.update(overflow="ignore", no_wrap=True)
+        width = max(1, measure_renderables(console, options, [renderable]).maximum)
+        segments = console.render(renderable, options.update_width(width))
+        lines = list(Segment.split_lines(segments))
+        return Strip(lines[0]) if lines else Strip.blank(width)
+
+    def _render_page_line(self, y: int) -> Strip:
+        """Render one line of a paged log."""
+        strip = self._render_unwrapped(self._pages.line(y))
+        if strip.cell_length > self._widest_line_width:
+            # Wide characters or tabs take more cells than the index counted
+            self._widest_line_width = strip.cell_length
+            self.virtual_size = Size(strip.cell_length, len(self._pages))
+        return strip
+
+    def _prune_pages(self, height: int) -> None:
+        """Forget rendered lines more than PAGE_BUFFER screenfuls off screen."""
+        top = self.scroll_offset.y - height * self.PAGE_BUFFER
+        bottom = self.scroll_offset.y + height * (self.PAGE_BUFFER + 1)
+        self._page_strips = {
+            y: strip for y, strip in self._page_strips.items() if top <= y < bottom
+        }
+
+    # --- Render cache ---
+
+    def _render_key(self) -> RenderKey | None:
+        """Cache key for the current log at the current width, if cacheable."""
+        width = self.scrollable_content_region.width
+        if self._log_key is None or not width or not self._reuse_renders:
+            return None
+        # Without wrapping, lines are rendered the same at every width
+        return (
+            self._log_key,
+            hash(self._full_text),
+            width if self.wrap else 0,
+            self.app.theme,
+        )
+
+    def _show_cached(self) -> bool:
+        """Show the whole log from the render cache. Returns False on a miss."""
+        key = self._render_key()
+        rendered = self.render_cache.get(key) if key is not None else None
+        if rendered is None:
+            return False
+        self._show(rendered)
+        self._shown_key = key
+        self._current_index = self._line_start = len(self._full_text)
+        self._clear_tail()
+        return True
+
+    def _cached_lines(self) -> RenderedLog | None:
+        """The cached render to replay typed lines from, if there is one.
+
+        Only unwrapped renders qualify, as they have one strip per line.
+        """
+        key = None if self.wrap else self._render_key()
+        rendered = self.render_cache.get(key) if key is not None else None
+        if rendered is None:
+            return None
+        text = self._full_text
+        lines = text.count("\n") + (not text.endswith("\n"))
+        return rendered if len(rendered.strips) == lines else None
+
+    def _append_strips(self, strips: tuple[Strip, ...]) -> None:
+        """Add already rendered strips to the end of the log."""
+        self.lines.extend(strips)
+        widest = max((strip.cell_length for strip in strips), default=0)
+        self._widest_line_width = max(self._widest_line_width, widest)
+        self.virtual_size = Size(self._widest_line_width, len(self.lines))
+        if self.auto_scroll:
+            self.scroll_end(animate=False, immediate=False, x_axis=False)
+        self.refresh()
+
+    def _show(self, rendered: RenderedLog) -> None:
+        """Replace the log's lines with already rendered strips."""
+        self._deferred_renders.clear()
+        self._line_cache.clear()
+        self._start_line = 0
+        self.lines = list(rendered.strips)
+        self._widest_line_width = rendered.widest
+        self.virtual_size = Size(rendered.widest, len(self.lines))
+        if self.auto_scroll:
+            self.scroll_end(animate=False, immediate=False, x_axis=False)
+        self.refresh()
+
+    def _remember(self) -> None:
+        """Cache the fully revealed log as rendered at the current width."""
+        key = self._render_key()
+        if key is None or key == self._shown_key:
+            return
+        self._shown_key = key
+        self.render_cache.put(
+            key, RenderedLog(tuple(self.lines), self._widest_line_width)
+        )
+
+    def on_resize(self, event: Resize) -> None:
+        """Re-render a fully shown, wrapped log when the width changes."""
+        if self.is_typing:
+            self._update_tail_size(refresh_all=True)  # Wrapped rows may change
+            return
+        if self._log_key is None:
+            return
+        if self._current_index < len(self._full_text):
+            return
+        key = self._render_key()
+        if key == self._shown_key or self._show_cached():
+            return
+        self.clear()
+        self.write(self._full_text)
+        self._remember()
 
     def on_unmount(self) -> None:
-        """Ensure the interval is stopped when the widget is unmounted."""
+        """Ensure the animation is stopped when the widget is unmounted."""
         self.stop()
-
@@ -0,0 +1,37 @@
+import gc
+import weakref
+
+import pytest
+from textual.app import App
+
+from wastelandhub.widgets.animation import get_animation_clock
+
+
+@pytest.mark.asyncio
+async def test_animations_run_by_interval_and_stop():
+    """Test that each animation runs at its own interval off one clock."""
+    app = App()
+    async with app.run_test() as pilot:
+        clock = get_animation_clock(app)
+        fast, slow = [], []
+        fast_animation = clock.add(fast.append)
+        slow_animation = clock.add(slow.append, 0.1)
+        await pilot.pause(0.25)
+        fast_animation.stop()
+        slow_animation.stop()
+
+        assert len(fast) > len(slow) >= 1
+        assert len(clock) == 0 and clock._timer is None
+
+
+@pytest.mark.asyncio
+async def test_clock_does_not_keep_its_app_alive():
+    """Test that an app with a registered clock can still be freed."""
+    app = App()
+    async with app.run_test():
+        get_animation_clock(app).add(lambda now: None, 1.0)
+    app_ref = weakref.ref(app)
+    del app
+    gc.collect()
+
+    assert app_ref() is None
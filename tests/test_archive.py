@@ -0,0 +1,122 @@
+import pytest
+
+from wastelandhub.data.archive import (
+    MAX_KEY_BYTES,
+    LogArchive,
+    train_dictionary,
+    write_archive,
+    write_encoded_archive,
+)
+from wastelandhub.data.log_data import LogData
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    """Write the built-in logs to a packed archive."""
+    path = tmp_path / "logs.whla"
+    write_archive(path, LogData.builtin().logs)
+    return path
+
+
+def test_archive_round_trip(archive_path):
+    """Test that every log survives a write/read round trip."""
+    builtin = LogData.builtin().logs
+    with LogArchive(archive_path) as archive:
+        assert len(archive) == len(builtin)
+        assert list(archive.keys()) == list(builtin.keys())
+        for key, body in builtin.items():
+            assert archive[key] == body
+
+
+def test_archive_unicode(tmp_path):
+    """Test that non-ASCII keys and bodies are preserved."""
+    path = tmp_path / "logs.whla"
+    write_archive(path, {"NÜKA": "Ω-class reactor ☢", "EMPTY": ""})
+
+    with LogArchive(path) as archive:
+        assert archive["NÜKA"] == "Ω-class reactor ☢"
+        assert archive["EMPTY"] == ""
+        assert "MISSING" not in archive
+
+
+def test_archive_rejects_foreign_file(tmp_path):
+    """Test that opening a file that is not an archive raises ValueError."""
+    path = tmp_path / "logs.whla"
+    path.write_bytes(b"not an archive at all")
+
+    with pytest.raises(ValueError):
+        LogArchive(path)
+
+
+def test_log_data_from_archive(archive_path):
+    """Test that LogData keeps its API when backed by an archive."""
+    log_data = LogData.from_archive(archive_path)
+
+    assert log_data.get_log_keys() == LogData.builtin().get_log_keys()
+    assert "FUSION CELL STOCK" in log_data.get_log("COMM_01")
+    assert log_data.get_log("NONEXISTENT_KEY") == "Log not found."
+    assert "SECURITY" in log_data.logs
+
+
+def test_load_default_prefers_archive(tmp_path, monkeypatch):
+    """Test that load_default() opens the archive in the data directory."""
+    monkeypatch.setattr(
+        "wastelandhub.data.config.xdg_data_home", lambda: tmp_path / "data"
+    )
+    write_archive(tmp_path / "data" / "wastelandhub" / "logs.whla", {"ONLY": "one"})
+
+    LogData.load_default.cache_clear()
+    try:
+        log_data = LogData.load_default()
+        assert isinstance(log_data.logs, LogArchive)
+        assert log_data.get_log_keys() == ("ONLY",)
+    finally:
+        LogData.load_default.cache_clear()
+
+
+def test_archive_rejects_keys_too_long_for_the_index(tmp_path):
+    """Test that a key over the u16 length limit fails before writing."""
+    path = tmp_path / "logs.whla"
+    write_archive(path, {"OLD": "kept"})
+    longest = "K" * MAX_KEY_BYTES
+
+    with pytest.raises(ValueError, match="limited to 65535"):
+        write_archive(path, {"OK": "fine", longest + "K": "too long"})
+    with pytest.raises(ValueError, match="limited to 65535"):
+        write_encoded_archive(path, [("OK", b"fine"), ("\u00e9" * 40000, b"")])
+
+    assert [p.name for p in tmp_path.iterdir()] == ["logs.whla"]
+    with LogArchive(path) as archive:
+        assert dict(archive) == {"OLD": "kept"}
+
+    write_archive(path, {longest: "at the limit"})
+    with LogArchive(path) as archive:
+        assert archive[longest] == "at the limit"
+
+
+def test_compressed_archive_round_trip(tmp_path):
+    """Test that a compressed archive decodes every record on its own."""
+    builtin = LogData.builtin().logs
+    logs = {f"{key}_{n}": body for n in range(20) for key, body in builtin.items()}
+    plain, compressed = tmp_path / "plain.whla", tmp_path / "compressed.whla"
+    write_archive(plain, logs)
+    write_archive(compressed, logs, compress=True)
+
+    assert compressed.stat().st_size < plain.stat().st_size / 2
+    with LogArchive(compressed) as archive:
+        assert archive.compressed and archive.zdict
+        assert archive["SECURITY_7"] == builtin["SECURITY"]
+        assert dict(archive) == logs
+
+
+def test_train_dictionary_keeps_shared_pieces_within_size():
+    """Test that the dictionary holds boilerplate shared by several logs."""
+    samples = [
+        f"FROM: Overseer <overseer@robco.net>\nDay {n}: all quiet.\n- OVERSEER"
+        for n in range(10)
+    ]
+    zdict = train_dictionary(samples)
+    assert b"FROM: Overseer <overseer@robco.net>\n" in zdict
+    assert b"Day 3" not in zdict  # Only in one sample
+
+    assert len(train_dictionary(samples, size=64)) <= 64
@@ -0,0 +1,66 @@
+import sys
+
+import pytest
+
+from wastelandhub.data.archive import write_archive
+from wastelandhub.data.body_cache import BodyCache
+from wastelandhub.data.config import WastelandConfig
+from wastelandhub.data.log_data import LogData
+from wastelandhub.data.log_store import LogStore
+
+
+def test_bodies_are_evicted_by_size_least_recently_used_first():
+    """Test that the byte budget evicts the least recently read bodies."""
+    body = "x" * 100
+    cache = BodyCache(max_bytes=sys.getsizeof(body) * 2)
+    cache.put("A", body)
+    cache.put("B", body)
+    assert cache.get("A") == body  # A is now more recent than B
+    cache.put("C", body)
+
+    assert "A" in cache and "C" in cache and "B" not in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.get("B") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_resize_evicts_and_zero_disables():
+    """Test that shrinking the budget evicts, and a body over budget is skipped."""
+    cache = BodyCache()
+    cache.put("A", "alpha")
+    cache.put("B", "bravo")
+    cache.resize(sys.getsizeof("bravo"))
+    assert list(cache._entries) == ["B"]
+
+    cache.resize(0)
+    cache.put("C", "charlie")
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_config_rejects_negative_budget():
+    with pytest.raises(ValueError):
+        WastelandConfig(body_cache_bytes=-1)
+
+
+def test_store_caches_bodies_read_from_an_archive(tmp_path):
+    """Test that repeated reads of an archived log are served from the cache."""
+    path = tmp_path / "logs.whla"
+    builtin = LogData.builtin().logs
+    write_archive(path, builtin)
+    store = LogStore()
+    data = store._data = LogData.from_archive(path)
+
+    assert store.get_log("COMM_01") == builtin["COMM_01"]
+    assert store.get_log("COMM_01") == builtin["COMM_01"]
+    assert (store.body_cache.hits, store.body_cache.misses) == (1, 1)
+    assert store.get_log("NOPE") == "Log not found."
+    assert "NOPE" not in store.body_cache
+
+    # A full scan reads around the cache rather than flushing it
+    assert dict(store.iter_logs()) == builtin
+    assert len(store.body_cache) == 1
+
+    store.clear()
+    assert len(store.body_cache) == 0
+    data.logs.close()
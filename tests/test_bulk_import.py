@@ -0,0 +1,107 @@
+import pytest
+
+from wastelandhub.data.archive import LogArchive, write_archive
+from wastelandhub.data.bulk_import import (
+    find_log_files,
+    import_directory,
+    normalize,
+    unique_keys,
+)
+from wastelandhub.data.log_data import LogData
+from wastelandhub.data.log_store import get_log_store
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """A directory of log files, one nested and one hidden."""
+    source = tmp_path / "logs"
+    (source / "vault" / ".cache").mkdir(parents=True)
+    for n in range(40):
+        text = f">> REPORT {n}\r\nPRIORITY: HIGH\r\n\r\nAll systems nominal.  \r\n"
+        (source / f"REPORT_{n:02d}.log").write_bytes(text.encode())
+    (source / "vault" / "OVERSEER.txt").write_text("Door stays shut.\n")
+    (source / "vault" / ".cache" / "SKIP.log").write_text("hidden")
+    (source / "notes.md").write_text("not a log")
+    return source
+
+
+def test_normalize_line_endings_and_whitespace():
+    assert normalize(b"\xef\xbb\xbfA  \r\nB\rC\n\n") == "A\nB\nC"
+    assert normalize(b"bad \xff byte") == "bad � byte"
+
+
+def test_find_log_files_keys_by_relative_path(log_dir):
+    keys = [key for key, _ in find_log_files(log_dir)]
+
+    assert keys[0] == "REPORT_00"
+    assert "vault/OVERSEER" in keys
+    assert len(keys) == 41
+
+
+def test_files_sharing_a_key_are_skipped(log_dir, tmp_path):
+    """Test that a file with the key of an earlier one is reported, not merged."""
+    (log_dir / "vault" / "OVERSEER.log").write_text("Door opens.\n")
+    files, skipped = unique_keys(find_log_files(log_dir))
+    assert dict(files)["vault/OVERSEER"].name == "OVERSEER.log"
+    assert [path.name for path, _ in skipped] == ["OVERSEER.txt"]
+
+    archive = tmp_path / "logs.whla"
+    result = import_directory(log_dir, archive, workers=1)
+    assert result.imported == 41
+    assert [path for path, _ in result.failed] == [skipped[0][0]]
+    with LogArchive(archive) as logs:
+        assert logs["vault/OVERSEER"] == "Door opens."
+    get_log_store().clear()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_import_merges_into_archive(log_dir, tmp_path, workers):
+    """Test that imported logs join the built-in ones in a compressed archive."""
+    archive = tmp_path / "logs.whla"
+
+    result = import_directory(log_dir, archive, workers=workers)
+
+    assert (result.imported, result.replaced, result.failed) == (41, 0, [])
+    builtin = LogData.builtin().logs
+    with LogArchive(archive) as logs:
+        assert logs.compressed
+        assert list(logs)[: len(builtin)] == list(builtin)
+        assert len(logs) == result.total == len(builtin) + 41
+        assert logs["REPORT_07"] == (
+            ">> REPORT 7\nPRIORITY: HIGH\n\nAll systems nominal."
+        )
+    get_log_store().clear()
+
+
+def test_import_replaces_keys_and_keeps_existing_format(log_dir, tmp_path):
+    """Test that re-importing replaces logs in place in a plain archive."""
+    archive = tmp_path / "logs.whla"
+    write_archive(archive, {"REPORT_01": "old", "KEEP": "kept"})
+
+    result = import_directory(log_dir, archive, workers=1)
+
+    assert result.replaced == 1
+    assert not result.compressed
+    with LogArchive(archive) as logs:
+        assert list(logs)[:3] == ["REPORT_01", "KEEP", "REPORT_00"]
+        assert logs["KEEP"] == "kept"
+        assert logs["REPORT_01"].startswith(">> REPORT 1")
+    get_log_store().clear()
+
+
+def test_store_indexes_see_imported_logs(log_dir, tmp_path, monkeypatch):
+    """Test that search and metadata queries find logs after an import."""
+    monkeypatch.setattr("wastelandhub.data.config.xdg_data_home", lambda: tmp_path)
+    store = get_log_store()
+    store.search("nominal")  # Build the indexes over the logs before the import
+
+    import_directory(log_dir, workers=1)
+    try:
+        assert "REPORT_07" in store.search("nominal")
+        assert "vault/OVERSEER" in store.search("door")
+        assert store.get_metadata("REPORT_07").priority == "HIGH"
+        assert len(store.search("priority:high")) == 40
+    finally:
+        store.data.logs.close()
+        LogData.load_default.cache_clear()
+        store.clear()
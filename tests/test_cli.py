@@ -0,0 +1,105 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from wastelandhub.cli import main
+from wastelandhub.data.archive import write_archive
+from wastelandhub.data.log_data import LogData
+from wastelandhub.data.log_store import get_log_store
+
+LOGS = {
+    "COMM_01": "FROM: J.C.\nStock is red.",
+    "DIARY_05": "Day 5. The water chip is failing.",
+}
+
+
+@pytest.fixture
+def archive_logs(tmp_path, monkeypatch):
+    """Serve LOGS from an archive in a temporary data directory."""
+    monkeypatch.setattr(
+        "wastelandhub.data.config.xdg_data_home", lambda: tmp_path / "data"
+    )
+    write_archive(tmp_path / "data" / "wastelandhub" / "logs.whla", LOGS)
+    LogData.load_default.cache_clear()
+    get_log_store().clear()
+    yield
+    LogData.load_default.cache_clear()
+    get_log_store().clear()
+
+
+def test_logs_list_and_search(archive_logs, capsys):
+    """Test that list prints every key, or only the matching ones."""
+    assert main(["logs", "list"]) == 0
+    assert capsys.readouterr().out.splitlines() == list(LOGS)
+
+    assert main(["logs", "list", "--search", "water"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["DIARY_05"]
+
+
+def test_logs_show(archive_logs, capsys):
+    """Test that show prints one log and fails cleanly for unknown keys."""
+    assert main(["logs", "show", "COMM_01"]) == 0
+    assert capsys.readouterr().out == LOGS["COMM_01"] + "\n"
+
+    assert main(["logs", "show", "MISSING"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "MISSING" in captured.err
+
+
+def test_logs_export_jsonl_includes_published_logs(archive_logs, capsys):
+    """Test that export writes one record per log, ingest-compatible."""
+    get_log_store().publish([("LIVE_01", "Just arrived.")])
+
+    assert main(["logs", "export", "--format", "jsonl"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["key"], r["text"]) for r in records] == [
+        *LOGS.items(),
+        ("LIVE_01", "Just arrived."),
+    ]
+
+
+def test_logs_commands_do_not_import_textual():
+    """Test that the headless path never loads the UI toolkit."""
+    code = (
+        "import sys\n"
+        "from wastelandhub.cli import main\n"
+        "main(['logs', 'list'])\n"
+        "assert not [m for m in sys.modules if m.split('.')[0] == 'textual']\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    )
+    assert result.returncode == 0, result.stderr
+    assert "COMM_01" in result.stdout
+
+
+def test_logs_build_archive_from_jsonl(archive_logs, tmp_path, capsys):
+    """Test that build-archive packs a feed and reports the compression."""
+    feed = tmp_path / "feed.jsonl"
+    feed.write_text(
+        "".join(json.dumps({"key": k, "text": t}) + "\n" for k, t in LOGS.items())
+    )
+    output = tmp_path / "out.whla"
+
+    args = ["logs", "build-archive", "--input", str(feed), "--output", str(output)]
+    assert main([*args, "--compress"]) == 0
+    report = capsys.readouterr().out
+    assert "Wrote 2 logs" in report and "ratio" in report and "MB/s" in report
+    assert dict(LogData.from_archive(output).logs) == LOGS
+
+
+def test_import_reports_throughput(archive_logs, tmp_path, capsys):
+    """Test that import merges files into the archive the store reads."""
+    source = tmp_path / "incoming"
+    source.mkdir()
+    (source / "RADIO_01.log").write_text("Galaxy News Radio, on the air.")
+
+    assert main(["import", str(source), "--workers", "1"]) == 0
+    report = capsys.readouterr().out
+    assert "Imported 1 logs" in report and "records/s" in report
+    assert get_log_store().get_log_keys() == [*LOGS, "RADIO_01"]
@@ -2,7 +2,14 @@ import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from wastelandhub.data.config import WastelandConfig, get_config
+import pytest
+
+from wastelandhub.data.config import (
+    ConfigPersister,
+    WastelandConfig,
+    get_config,
+    reset_config,
+)
 
 
 def test_config_defaults():
@@ -80,7 +87,7 @@ def test_config_cache_invalidation(tmp_path, monkeypatch):
     monkeypatch.setattr("wastelandhub.data.config.xdg_config_home", lambda: tmp_path / "config")
     
     # Clear cache before test
-    get_config.cache_clear()
+    reset_config()
     
     # First call creates default config
     config1 = get_config()
@@ -104,3 +111,55 @@ def test_config_properties():
     assert isinstance(config.data_dir, Path)
     assert "wastelandhub" in str(config.config_dir)
     assert "wastelandhub" in str(config.data_dir)
+
+
+def test_save_is_atomic(tmp_path, monkeypatch):
+    """Test that save() leaves no temporary files behind."""
+    monkeypatch.setattr(
+        "wastelandhub.data.config.xdg_config_home", lambda: tmp_path / "config"
+    )
+
+    WastelandConfig(typewriter_cps=30).save()
+    WastelandConfig(typewriter_cps=40).save()
+
+    config_dir = tmp_path / "config" / "wastelandhub"
+    assert [p.name for p in config_dir.iterdir()] == ["config.json"]
+    assert WastelandConfig.load().typewriter_cps == 40
+
+
+def test_persister_coalesces_saves(tmp_path, monkeypatch):
+    """Test that rapid saves are published at once and written once."""
+    monkeypatch.setattr(
+        "wastelandhub.data.config.xdg_config_home", lambda: tmp_path / "config"
+    )
+    reset_config()
+
+    persister = ConfigPersister(delay=0.1)
+    try:
+        for cps in range(10, 60, 10):
+            persister.save(WastelandConfig(typewriter_cps=cps))
+            # The snapshot is updated before anything reaches disk
+            assert get_config().typewriter_cps == cps
+
+        assert persister.wait(timeout=5)
+        assert persister.writes == 1
+        assert WastelandConfig.load().typewriter_cps == 50
+    finally:
+        persister.close()
+        reset_config()
+
+
+@pytest.mark.asyncio
+async def test_persister_flush(tmp_path, monkeypatch):
+    """Test that flush() can be awaited until pending saves are written."""
+    monkeypatch.setattr(
+        "wastelandhub.data.config.xdg_config_home", lambda: tmp_path / "config"
+    )
+
+    persister = ConfigPersister(delay=0.05)
+    persister.save(WastelandConfig(theme="amber"))
+    await persister.flush()
+
+    assert WastelandConfig.load().theme == "amber"
+    persister.close()
+    reset_config()
@@ -0,0 +1,133 @@
+import json
+import sys
+import time
+
+import pytest
+
+from wastelandhub.data.config import (
+    WastelandConfig,
+    get_config,
+    publish_config,
+    reset_config,
+    subscribe_config,
+)
+from wastelandhub.data.config_watcher import ConfigWatcher
+
+
+def wait_for(predicate, timeout=3.0):
+    """Poll predicate until it is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Point the config at a temporary directory and reset the snapshot."""
+    monkeypatch.setattr(
+        "wastelandhub.data.config.xdg_config_home", lambda: tmp_path / "config"
+    )
+    path = tmp_path / "config" / "wastelandhub" / "config.json"
+    path.parent.mkdir(parents=True)
+    reset_config()
+    yield path
+    reset_config()
+
+
+def test_from_file_validates_types(tmp_path):
+    """Test that values of the wrong type are rejected."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"typewriter_cps": "fast"}))
+    with pytest.raises(ValueError):
+        WastelandConfig.from_file(path)
+
+    path.write_text(json.dumps({"enable_sound": 1}))
+    with pytest.raises(ValueError):
+        WastelandConfig.from_file(path)
+
+    path.write_text(json.dumps({"typewriter_cps": 0}))
+    with pytest.raises(ValueError):
+        WastelandConfig.from_file(path)
+
+
+def test_config_is_immutable():
+    """Test that config snapshots cannot be modified in place."""
+    config = WastelandConfig()
+    with pytest.raises(Exception):  # dataclass FrozenInstanceError
+        config.typewriter_cps = 5
+
+
+def test_publish_notifies_subscribers(config_file):
+    """Test that subscribers only hear about changed snapshots."""
+    received = []
+    unsubscribe = subscribe_config(received.append)
+    try:
+        publish_config(WastelandConfig(typewriter_cps=42))
+        publish_config(WastelandConfig(typewriter_cps=42))
+        assert [c.typewriter_cps for c in received] == [42]
+        assert get_config().typewriter_cps == 42
+    finally:
+        unsubscribe()
+
+    publish_config(WastelandConfig(typewriter_cps=7))
+    assert len(received) == 1
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher_reloads_on_change(config_file, use_inotify):
+    """Test that edits to config.json are picked up in the background."""
+    config_file.write_text(json.dumps({"typewriter_cps": 10}))
+    assert get_config().typewriter_cps == 10
+
+    watcher = ConfigWatcher(poll_interval=0.05, use_inotify=use_inotify)
+    watcher.start()
+    try:
+        time.sleep(0.1)  # let the watcher settle before editing
+        config_file.write_text(json.dumps({"typewriter_cps": 250}))
+        assert wait_for(lambda: get_config().typewriter_cps == 250)
+
+        # Atomic rename-over replacement is detected too
+        tmp = config_file.with_name("config.json.tmp")
+        tmp.write_text(json.dumps({"typewriter_cps": 300, "theme": "amber"}))
+        tmp.replace(config_file)
+        assert wait_for(lambda: get_config().theme == "amber")
+    finally:
+        watcher.stop()
+    assert not watcher.running
+
+
+def test_watcher_keeps_snapshot_on_invalid_file(config_file):
+    """Test that a broken file does not replace a good snapshot."""
+    config_file.write_text(json.dumps({"typewriter_cps": 10}))
+    assert get_config().typewriter_cps == 10
+
+    watcher = ConfigWatcher()
+    config_file.write_text("{ truncated")
+    assert watcher.check()
+    assert get_config().typewriter_cps == 10
+    assert not watcher.check()  # unchanged file is not re-read
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs inotify")
+def test_watcher_switches_to_inotify_once_directory_exists(tmp_path):
+    """Test that a missing config directory is only polled until it appears."""
+    path = tmp_path / "config" / "wastelandhub" / "config.json"
+    reset_config()
+    watcher = ConfigWatcher(path, poll_interval=0.05)
+    watcher.start()
+    try:
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({"typewriter_cps": 20}))
+        assert wait_for(lambda: get_config().typewriter_cps == 20)
+
+        # Polling this slowly would miss the next edit; inotify does not
+        watcher.poll_interval = 60
+        time.sleep(0.1)
+        path.write_text(json.dumps({"typewriter_cps": 30}))
+        assert wait_for(lambda: get_config().typewriter_cps == 30)
+    finally:
+        watcher.stop()
+        reset_config()
@@ -0,0 +1,69 @@
+import pytest
+from rich.segment import Segment
+from rich.style import Style
+from textual.strip import Strip
+
+from wastelandhub.data.config import WastelandConfig
+from wastelandhub.main import WastelandHubApp
+from wastelandhub.widgets.crt import GLOW_STYLES, CRTEffect, CRTFilter, glow, scanline
+
+GREEN = Style(color="#00ff00", bgcolor="#001100")
+
+
+def line(text: str) -> Strip:
+    return Strip([Segment(text, GREEN)])
+
+
+def test_scanlines_dim_odd_rows_and_reuse_results():
+    """Test that every other row is dimmed and repeated lines hit the cache."""
+    strip = line("VAULT-TEC")
+
+    assert scanline(strip, 0) is strip
+    dimmed = scanline(strip, 1)
+    assert dimmed.text == strip.text
+    assert dimmed.cell_length == strip.cell_length
+    (segment,) = list(dimmed)
+    assert segment.style.color.triplet.green < 0xFF
+    assert scanline(strip, 3) is dimmed
+
+
+def test_flicker_filters_only_while_enabled_and_dimmed(monkeypatch):
+    """Test that the effect adds a filter only for a dimmed flicker level."""
+    effect = CRTEffect()
+    assert effect.get_line_filters() == ()
+
+    monkeypatch.setattr("random.choice", lambda levels: 0.94)
+    assert not effect.next_flicker()  # Disabled effects never flicker
+    effect.enabled = effect.flicker = True
+    assert effect.next_flicker()
+    (line_filter,) = effect.get_line_filters()
+    assert line_filter.brightness == 0.94
+    assert effect.get_line_filters() == (line_filter,)
+
+
+@pytest.mark.asyncio
+async def test_app_applies_flicker_to_every_widget(monkeypatch):
+    """Test that the app's line filters carry the flicker to rendered widgets."""
+    monkeypatch.setattr("random.choice", lambda levels: 0.94)
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app.crt is None  # Not even loaded unless configured
+        assert not any(isinstance(f, CRTFilter) for f in app.get_line_filters())
+
+        app._apply_crt(WastelandConfig(crt_effects=True, crt_flicker=True))
+        (crt_filter,) = [f for f in app.get_line_filters() if isinstance(f, CRTFilter)]
+        assert crt_filter.brightness == 0.94
+        app._apply_crt(WastelandConfig())
+        assert app._flicker is None
+
+
+def test_glow_lights_newest_cells():
+    """Test that the cells before the cursor get the glow styles, newest first."""
+    strip = glow(line("TERMINAL"), 5)
+
+    assert strip.text == "TERMINAL"
+    styles = [segment.style for segment in strip]
+    assert styles[-2].color == GLOW_STYLES[0].color  # "I", the newest
+    assert styles[-3].color == GLOW_STYLES[1].color
+    assert styles[0].color == GREEN.color
@@ -52,7 +52,8 @@ def test_get_log_keys():
     log_data = LogData.load_default()
     
     keys = log_data.get_log_keys()
-    assert isinstance(keys, list)
+    assert isinstance(keys, tuple)
+    assert log_data.get_log_keys() is keys
     assert len(keys) == 6
     assert "COMM_01" in keys
     assert "RESEARCH" in keys
@@ -0,0 +1,148 @@
+import random
+
+import pytest
+
+from wastelandhub.hacking.engine import (
+    HackingGame,
+    Puzzle,
+    board_shape,
+    generate_puzzle,
+    is_playable,
+    likeness_matrix,
+    related_decoys,
+)
+from wastelandhub.hacking.pool import PuzzlePool
+from wastelandhub.hacking.words import default_words, group_by_length
+from wastelandhub.widgets.hacking_widget import MemoryDump
+
+
+def naive_likeness(a: str, b: str) -> int:
+    return sum(x == y for x, y in zip(a, b))
+
+
+def test_board_shape_bounds():
+    """Test that difficulty maps to word length and count monotonically."""
+    assert board_shape(0) == (4, 8)
+    assert board_shape(100) == (12, 20)
+    assert board_shape(-5) == board_shape(0)
+    assert board_shape(500) == board_shape(100)
+    shapes = [board_shape(d) for d in range(0, 101, 10)]
+    assert shapes == sorted(shapes)
+
+
+def test_likeness_matrix_matches_naive():
+    """Test the packed likeness computation against a direct comparison."""
+    words = default_words()[9]
+    matrix = likeness_matrix(words)
+    for i, a in enumerate(words):
+        for j, b in enumerate(words):
+            assert matrix[i][j] == naive_likeness(a, b)
+
+
+def test_guess_narrows_candidates():
+    """Test that each guess keeps only words consistent with its likeness."""
+    puzzle = generate_puzzle(60, random.Random(7))
+    game = HackingGame(puzzle)
+    wrong = next(i for i in range(len(puzzle.words)) if i != puzzle.password_index)
+
+    likeness = game.guess(wrong)
+
+    assert likeness == naive_likeness(puzzle.words[wrong], puzzle.password)
+    assert puzzle.password_index in game.candidates()
+    for i in game.candidates():
+        assert naive_likeness(puzzle.words[wrong], puzzle.words[i]) == likeness
+    assert game.attempts_left == 3
+
+
+def test_game_win_and_lockout():
+    """Test that the password wins and running out of attempts locks."""
+    puzzle = Puzzle.create(["FIRE", "WIRE", "DEAD", "BOMB", "NUKE"], 0)
+
+    game = HackingGame(puzzle)
+    assert game.guess(1) == 3
+    assert game.guess(0) == 4
+    assert game.solved and game.over
+    assert game.candidates() == [0]
+
+    game = HackingGame(puzzle, attempts=2)
+    game.guess(2)
+    game.guess(3)
+    assert game.over and not game.solved
+    with pytest.raises(RuntimeError):
+        game.guess(0)
+
+
+def test_puzzle_rejects_invalid_boards():
+    """Test that mixed lengths and duplicate words are rejected."""
+    with pytest.raises(ValueError):
+        Puzzle.create(["FIRE", "FIRES"], 0)
+    with pytest.raises(ValueError):
+        Puzzle.create(["FIRE", "FIRE"], 0)
+
+
+def test_generate_puzzle_uses_nearest_length():
+    """Test that small dictionaries fall back to a length with enough words."""
+    dictionary = group_by_length(default_words()[5] + ("ATOM", "BOLT"))
+    puzzle = generate_puzzle(0, random.Random(1), dictionary)
+    assert puzzle.word_length == 5
+    assert len(puzzle.words) == 8
+
+
+def test_generate_puzzle_keeps_the_best_board_when_none_is_playable():
+    """Test that running out of tries returns the most related board seen."""
+    # Only ATOM/ATOB share letters, so no board has enough related decoys
+    words = ("ATOM", "ATOB", "CCCC", "DDDD", "EEEE", "FFFF", "GGGG", "HHHH", "IIII")
+    puzzle = generate_puzzle(0, random.Random(5), {4: words}, max_tries=50)
+    assert not is_playable(puzzle)
+    assert related_decoys(puzzle) == 1
+
+
+def test_memory_dump_places_every_word():
+    """Test that the dump contains each word exactly where its owner says."""
+    puzzle = generate_puzzle(100, random.Random(3))
+    dump = MemoryDump.build(puzzle.words, random.Random(3))
+
+    for index, word in enumerate(puzzle.words):
+        positions = [i for i, owner in enumerate(dump.owner) if owner == index]
+        assert len(positions) == len(word)
+        assert "".join(dump.chars[i] for i in positions) == word
+
+
+def test_puzzle_pool_fills_in_background():
+    """Test that the pool pre-generates puzzles and refills after take()."""
+    pool = PuzzlePool(difficulty=100, size=3, rng=random.Random(5))
+    pool.start()
+    try:
+        assert pool.wait_full(timeout=5)
+        puzzle = pool.take()
+        assert (puzzle.word_length, len(puzzle.words)) == board_shape(100)
+        assert pool.misses == 0
+        assert pool.wait_full(timeout=5)
+        assert len(pool) == 3
+    finally:
+        pool.stop()
+
+
+def test_puzzle_pool_difficulty_change():
+    """Test that changing difficulty discards stale puzzles."""
+    pool = PuzzlePool(difficulty=0, size=2)
+    pool.start()
+    try:
+        assert pool.wait_full(timeout=5)
+        pool.set_difficulty(100)
+        assert pool.wait_full(timeout=5)
+        assert pool.take().word_length == board_shape(100)[0]
+    finally:
+        pool.stop()
+
+
+def test_puzzle_pool_take_without_thread():
+    """Test that an empty pool still returns a puzzle by generating in place."""
+
+    def calibrate(difficulty, rng):
+        raise AssertionError("calibrated on the caller's thread")
+
+    pool = PuzzlePool(difficulty=30, generator=calibrate)
+    puzzle = pool.take()
+    assert puzzle.word_length == board_shape(30)[0]
+    assert pool.misses == 1
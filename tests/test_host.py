@@ -0,0 +1,144 @@
+import os
+import socket
+import struct
+import termios
+import threading
+import time
+
+import pytest
+
+from wastelandhub import host
+from wastelandhub.host import (
+    IAC,
+    NAWS,
+    NEGOTIATION,
+    SB,
+    SE,
+    WILL,
+    SessionHost,
+    TelnetDecoder,
+    encode_output,
+    is_loopback,
+    open_listener,
+)
+
+
+def naws(columns: int, rows: int) -> bytes:
+    return bytes([IAC, SB, NAWS, *struct.pack(">HH", columns, rows), IAC, SE])
+
+
+def test_decoder_strips_negotiation_and_reads_window_size():
+    """Test that telnet commands are removed and NAWS sizes are reported."""
+    decoder = TelnetDecoder()
+
+    keys, sizes = decoder.feed(bytes([IAC, WILL, NAWS]) + naws(120, 40) + b"q")
+
+    assert keys == b"q"
+    assert sizes == [(120, 40)]
+
+
+def test_decoder_handles_commands_split_across_reads():
+    """Test that a window size split over several packets is still parsed."""
+    decoder = TelnetDecoder()
+    message = naws(100, 30) + b"\x1b[A"
+
+    results = [decoder.feed(message[i : i + 1]) for i in range(len(message))]
+
+    assert b"".join(keys for keys, _ in results) == b"\x1b[A"
+    assert [size for _, sizes in results for size in sizes] == [(100, 30)]
+
+
+def test_decoder_unescapes_iac_and_normalizes_enter():
+    """Test that IAC IAC is a literal 0xFF and CR NUL / CR LF become CR."""
+    decoder = TelnetDecoder()
+
+    assert decoder.feed(bytes([IAC, IAC]))[0] == b"\xff"
+    assert decoder.feed(b"a\r\0b\r")[0] == b"a\rb\r"
+    assert decoder.feed(b"\nc")[0] == b"c"
+
+
+def test_encode_output_escapes_iac():
+    assert encode_output(b"a\xffb") == b"a\xff\xffb"
+
+
+def test_only_loopback_addresses_are_served_by_default(monkeypatch):
+    """Test that addresses other machines can reach need allow_remote."""
+    assert is_loopback("127.0.0.1:2323")
+    assert is_loopback(":2323")
+    assert is_loopback("localhost:2323")
+    assert is_loopback("::1:2323")
+    assert is_loopback("/run/wastelandhub.sock")
+    assert not is_loopback("0.0.0.0:2323")
+    assert not is_loopback("192.168.1.20:2323")
+    assert not is_loopback("terminal.example:2323")
+
+    monkeypatch.setattr(host, "prepare_shared_state", pytest.fail)
+    with pytest.raises(ValueError, match="other machines"):
+        host.serve("0.0.0.0:2323")
+
+
+def test_open_listener_on_unix_socket_replaces_stale_socket(tmp_path):
+    """Test that a Unix socket path left by a previous host can be reused."""
+    path = tmp_path / "host.sock"
+    open_listener(str(path)).close()
+
+    listener = open_listener(str(path))
+    try:
+        assert listener.getsockname() == str(path)
+    finally:
+        listener.close()
+
+
+def run_cat(size: tuple[int, int]) -> None:
+    """Session body for tests: copy input back through cat on the pty."""
+    try:
+        attributes = termios.tcgetattr(0)
+        attributes[3] &= ~termios.ECHO  # Only cat's output comes back
+        termios.tcsetattr(0, termios.TCSANOW, attributes)
+        os.execvp("cat", ["cat"])
+    finally:
+        os._exit(1)
+
+
+# The client runs on a second thread; the forked child only execs cat
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_session_host_relays_input_and_output(tmp_path, monkeypatch):
+    """Test accept, fork, relay both ways and reaping over a Unix socket.
+
+    The input is far more than a pty accepts at once, so the host has to
+    hold it back rather than drop it.
+    """
+    monkeypatch.setattr(host, "_run_session", run_cat)
+    listener = open_listener(str(tmp_path / "host.sock"))
+    session_host = SessionHost(listener, max_sessions=1)
+    server = threading.Thread(target=session_host.serve_forever)
+    server.start()
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(str(tmp_path / "host.sock"))
+        client.settimeout(10)
+        line = b"x" * 99
+        lines = 1000
+        payload = (line + b"\r") * lines
+        sender = threading.Thread(target=client.sendall, args=(payload,))
+        sender.start()
+
+        received = bytearray()
+        while received.count(line) < lines:
+            data = client.recv(65536)
+            assert data, "session closed early"
+            received += data
+        sender.join()
+
+        assert received.startswith(NEGOTIATION)
+        assert len(session_host.sessions) == 1
+
+        client.close()
+        deadline = time.monotonic() + 10
+        while session_host.sessions and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not session_host.sessions
+    finally:
+        session_host.stop()
+        server.join()
+        listener.close()
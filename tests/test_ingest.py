@@ -0,0 +1,174 @@
+import json
+import os
+import threading
+
+from wastelandhub.data.ingest import JsonlSource, LogIngestor, SpoolSource
+from wastelandhub.data.log_data import LogData
+from wastelandhub.data.log_store import LogStore
+from wastelandhub.data.search_index import SearchIndex
+
+
+def append_records(path, *records, end="\n"):
+    with open(path, "a", encoding="utf-8") as f:
+        for key, text in records:
+            f.write(json.dumps({"key": key, "text": text}) + end)
+
+
+def test_jsonl_source_reads_only_new_complete_lines(tmp_path):
+    """Test that the JSONL tail resumes from its offset and waits for newlines."""
+    path = tmp_path / "feed.jsonl"
+    append_records(path, ("A", "first"), ("B", "second"))
+    source = JsonlSource(path)
+
+    assert source.read() == [("A", "first"), ("B", "second")]
+    assert source.read() == []
+
+    # A record without its newline yet is left for the next read
+    append_records(path, ("C", "third"), end="")
+    assert source.read() == []
+    with open(path, "a") as f:
+        f.write("\n")
+    assert source.read() == [("C", "third")]
+    assert source.offset == path.stat().st_size
+
+
+def test_jsonl_source_skips_invalid_records(tmp_path):
+    """Test that malformed lines are skipped without stopping the feed."""
+    path = tmp_path / "feed.jsonl"
+    path.write_text('not json\n{"key": 1, "text": "x"}\n[]\n')
+    append_records(path, ("OK", "fine"))
+
+    assert JsonlSource(path).read() == [("OK", "fine")]
+
+
+def test_jsonl_source_skips_oversized_line_to_its_newline(tmp_path, caplog):
+    """Test that a line longer than a chunk is skipped whole, then reading goes on."""
+    path = tmp_path / "feed.jsonl"
+    append_records(path, ("BIG", "x" * 300), ("A", "after"))
+    source = JsonlSource(path, chunk_size=64)
+
+    records = []
+    for _ in range(10):
+        records += source.read()
+    assert records == [("A", "after")]
+    assert source.offset == path.stat().st_size
+    assert "Skipping record longer than 64 bytes" in caplog.text
+    assert caplog.text.count("Skipping") == 1
+
+
+def test_jsonl_source_restarts_after_truncation(tmp_path):
+    """Test that a truncated or replaced feed is read from the beginning."""
+    path = tmp_path / "feed.jsonl"
+    append_records(path, ("A", "first"), ("B", "second"))
+    source = JsonlSource(path)
+    source.read()
+
+    path.write_text("")
+    append_records(path, ("C", "third"))
+    assert source.read() == [("C", "third")]
+
+
+def test_spool_source_reads_each_file_once(tmp_path):
+    """Test that spool files are read once, oldest first, ignoring temp files."""
+    (tmp_path / "OLD.log").write_text("old")
+    (tmp_path / "NEW.log").write_text("new")
+    (tmp_path / ".PARTIAL.log").write_text("half")
+    (tmp_path / "notes.txt").write_text("ignored")
+    newer = (tmp_path / "OLD.log").stat().st_mtime_ns + 1_000_000
+    os.utime(tmp_path / "NEW.log", ns=(newer, newer))
+    source = SpoolSource(tmp_path)
+
+    assert source.read() == [("OLD", "old"), ("NEW", "new")]
+    assert source.read() == []
+
+    (tmp_path / "LATEST.log").write_text("latest")
+    assert source.read() == [("LATEST", "latest")]
+
+
+def test_spool_source_remembers_a_mark_not_every_file(tmp_path, monkeypatch):
+    """Test that settled files are forgotten and an unchanged spool is not scanned."""
+    for n in range(3):
+        (tmp_path / f"LOG_{n}.log").write_text(str(n))
+    source = SpoolSource(tmp_path)
+    source.SETTLE_NS = 0  # Every timestamp is final at once
+    assert [key for key, _ in source.read()] == ["LOG_0", "LOG_1", "LOG_2"]
+    assert source._recent == {}
+
+    scans = []
+    monkeypatch.setattr(
+        "wastelandhub.data.ingest.os.scandir", lambda path: scans.append(path) or []
+    )
+    assert source.read() == []
+    assert scans == []
+
+
+def test_log_store_publish_appends_and_indexes():
+    """Test that published logs extend keys and search, and notify once."""
+    store = LogStore()
+    base_keys = LogData.load_default().get_log_keys()
+    assert store.search("quarantine") == []
+
+    batches = []
+    unsubscribe = store.subscribe(batches.append)
+    added = store.publish(
+        [("QUARANTINE_01", "Sector 7 is under quarantine."), ("COMM_01", "dupe")]
+    )
+
+    assert added == ["QUARANTINE_01"]
+    assert batches == [["QUARANTINE_01"]]
+    assert store.get_log_keys() == [*base_keys, "QUARANTINE_01"]
+    assert store.get_log("QUARANTINE_01") == "Sector 7 is under quarantine."
+    assert store.get_log("COMM_01") == LogData.load_default().get_log("COMM_01")
+    assert store.search("quarantine") == ["QUARANTINE_01"]
+
+    # Publishing only known keys changes nothing
+    unsubscribe()
+    assert store.publish([("QUARANTINE_01", "again")]) == []
+    assert batches == [["QUARANTINE_01"]]
+
+
+def test_search_index_is_built_without_the_store_lock(monkeypatch):
+    """Test that publishing during the first search's build is not blocked."""
+    store = LogStore()
+    build = SearchIndex.build
+    publishers = []
+
+    def build_while_publishing(logs):
+        publisher = threading.Thread(
+            target=store.publish, args=([("LATE_01", "Arrived mid-build.")],)
+        )
+        publisher.start()
+        publisher.join(timeout=5)
+        publishers.append(publisher)
+        return build(logs)
+
+    monkeypatch.setattr(SearchIndex, "build", build_while_publishing)
+    assert store.search("mid build") == ["LATE_01"]
+    assert not publishers[0].is_alive()
+
+
+def test_log_ingestor_polls_into_store(tmp_path):
+    """Test that a poll publishes everything the feed has ready in order."""
+    path = tmp_path / "feed.jsonl"
+    append_records(path, *((f"FEED_{i:04d}", f"record {i}") for i in range(2000)))
+    store = LogStore()
+    ingestor = LogIngestor(path, store=store)
+    ingestor.source.chunk_size = 4096
+
+    added = ingestor.poll()
+    assert added == [f"FEED_{i:04d}" for i in range(2000)]
+    assert ingestor.poll() == []
+    assert store.get_log("FEED_1999") == "record 1999"
+
+
+def test_published_bodies_are_read_back_from_the_journal():
+    """Test that published logs are not held in memory but still readable."""
+    store = LogStore()
+    store.publish([("NOTE_01", "Xylophone recital off."), ("NOTE_02", "Found it.")])
+    store.body_cache.clear()
+
+    assert not any(isinstance(entry, str) for entry in store._ingested.values())
+    assert store.get_log("NOTE_02") == "Found it."
+    assert "NOTE_02" in store.body_cache
+    assert dict(store.iter_logs())["NOTE_01"] == "Xylophone recital off."
+    assert store.search("xylophone") == ["NOTE_01"]
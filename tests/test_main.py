@@ -1,7 +1,30 @@
+import json
+import os
+import subprocess
+import sys
+
 import pytest
+from textual.screen import Screen
 
+from wastelandhub.data.archive import write_archive
+from wastelandhub.data.config import WastelandConfig, publish_config, reset_config
 from wastelandhub.data.log_data import LogData
+from wastelandhub.data.log_store import get_log_store
+from wastelandhub.hacking.solver import best_guess
 from wastelandhub.main import WastelandHubApp
+from wastelandhub.profiling import format_report, profile_startup
+from wastelandhub.screens.logs_menu import LogsMenuScreen
+from wastelandhub.widgets.log_list import LogList, LogRow
+from wastelandhub.widgets.perf_hud import PerfHud
+from wastelandhub.widgets.render_cache import get_render_cache
+
+
+def find_log_row(app: WastelandHubApp, key: str) -> LogRow:
+    """Return the mounted sidebar row currently bound to key."""
+    for row in app.screen.query(LogRow):
+        if row.log_key == key:
+            return row
+    raise LookupError(key)
 
 
 @pytest.mark.asyncio
@@ -17,6 +40,36 @@ async def test_app_starts_and_shows_main_menu():
         assert menu_container is not None
 
 
+@pytest.mark.asyncio
+async def test_hosted_sessions_start_no_background_services():
+    """Test that an app without background services starts none of them."""
+    app = WastelandHubApp(background_services=False)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app.config_watcher is None
+        assert app.puzzle_pool is None
+        assert app.log_ingestor is None
+
+
+def test_main_defers_background_modules():
+    """Test that importing the app leaves services and effects unloaded."""
+    deferred = (
+        "wastelandhub.data.config_watcher",
+        "wastelandhub.widgets.animation",
+        "wastelandhub.widgets.crt",
+    )
+    code = (
+        "import sys\n"
+        "import wastelandhub.main\n"
+        f"assert not [m for m in {deferred!r} if m in sys.modules]\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    )
+    assert result.returncode == 0, result.stderr
+
+
 @pytest.mark.asyncio
 async def test_navigation_to_logs_menu():
     """Test navigation from main menu to logs menu."""
@@ -49,7 +102,7 @@ async def test_typewriter_functionality():
         assert typewriter is not None
 
         # Click on a log button
-        await pilot.click("#open-COMM_01")
+        await pilot.click(find_log_row(app, "COMM_01"))
         await pilot.pause()
 
         # Typewriter should have some content now
@@ -93,6 +146,357 @@ async def test_all_log_buttons_exist():
 
         # Check that all expected log buttons exist
         log_data = LogData.load_default()
+        log_list = app.screen.query_one("#logs-container", LogList)
+        assert tuple(log_list.keys) == log_data.get_log_keys()
         for key in log_data.get_log_keys():
-            button = app.screen.query_one(f"#open-{key}")
-            assert button is not None
+            assert find_log_row(app, key) is not None
+
+
+@pytest.mark.asyncio
+async def test_log_list_mounts_only_visible_rows():
+    """Test that a large log list mounts a bounded pool of recycled rows."""
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+
+        log_list = app.screen.query_one("#logs-container", LogList)
+        keys = [f"LOG_{i:05d}" for i in range(5000)]
+        log_list.set_keys(keys)
+        await pilot.pause()
+
+        rows = list(log_list.query(LogRow))
+        assert len(rows) < 30
+        assert [row.log_key for row in rows] == keys[: len(rows)]
+
+        # Jumping to the end re-binds the same row widgets
+        log_list.focus()
+        await pilot.press("end")
+        await pilot.pause()
+        assert list(log_list.query(LogRow)) == rows
+        assert isinstance(app.focused, LogRow)
+        assert app.focused.log_key == keys[-1]
+
+        await pilot.press("up")
+        await pilot.pause()
+        assert app.focused.log_key == keys[-2]
+
+
+@pytest.mark.asyncio
+async def test_log_row_keyboard_selection_starts_typewriter():
+    """Test that arrow keys and Enter open the log under the cursor."""
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+
+        await pilot.press("down", "enter")
+        await pilot.pause()
+
+        typewriter = app.screen.query_one("#typewriter")
+        keys = LogData.load_default().get_log_keys()
+        assert typewriter._full_text == LogData.load_default().get_log(keys[1])
+
+
+@pytest.mark.asyncio
+async def test_focused_log_is_prefetched_before_selection(log_store, tmp_path):
+    """Test that focusing a row decodes it into the body cache before Enter."""
+    path = tmp_path / "logs.whla"
+    write_archive(path, LogData.builtin().logs)
+    data = log_store._data = LogData.from_archive(path)
+    cache = log_store.body_cache
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+        await pilot.press("down", "down")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        keys = log_store.get_log_keys()
+        assert all(key in cache for key in keys[:5])
+
+        misses = cache.misses
+        await pilot.press("enter")
+        await pilot.pause()
+
+        assert cache.misses == misses
+        typewriter = app.screen.query_one("#typewriter")
+        assert typewriter._full_text == LogData.builtin().get_log(keys[2])
+    data.logs.close()
+
+
+@pytest.mark.asyncio
+async def test_logs_in_memory_are_not_prefetched(log_store, monkeypatch):
+    """Test that moving through logs held in memory starts no prefetch worker."""
+    prefetched = []
+    monkeypatch.setattr(LogsMenuScreen, "_prefetch", prefetched.append)
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+        await pilot.press("down", "down")
+        await pilot.pause()
+
+    assert not log_store.decodes_logs
+    assert prefetched == []
+
+
+@pytest.fixture
+def slow_typing():
+    """Type slowly enough that logs are still typing between key presses."""
+    publish_config(WastelandConfig(typewriter_cps=10))
+    yield
+    reset_config()
+
+
+@pytest.mark.asyncio
+async def test_skipped_log_reopens_from_render_cache(slow_typing):
+    """Test that a log skipped to its end is shown from the cache when reopened."""
+    get_render_cache().clear()
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+
+        typewriter = app.screen.query_one("#typewriter")
+        await pilot.press("enter", "s")
+        await pilot.pause()
+        assert not typewriter.is_typing
+        lines = list(typewriter.lines)
+
+        await pilot.press("down", "enter")
+        await pilot.pause()
+        assert typewriter.is_typing
+
+        # Reopening types the log again; skipping shows the cached render
+        await pilot.press("up", "enter")
+        await pilot.pause()
+        assert typewriter.is_typing
+        await pilot.press("s")
+        await pilot.pause()
+        assert typewriter.lines == lines
+
+
+@pytest.mark.asyncio
+async def test_search_filters_log_list():
+    """Test that typing in the search box filters the sidebar."""
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+
+        await pilot.click("#logs-search")
+        await pilot.press(*"fusion")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        log_list = app.screen.query_one("#logs-container", LogList)
+        assert list(log_list.keys) == ["COMM_01"]
+
+        await pilot.press(*["backspace"] * 6)
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert tuple(log_list.keys) == LogData.load_default().get_log_keys()
+
+
+@pytest.mark.asyncio
+async def test_search_groups_log_list_by_header():
+    """Test that a group: query orders the sidebar and tags rows by value."""
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+
+        await pilot.click("#logs-search")
+        await pilot.press(*"group:priority")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        log_list = app.screen.query_one("#logs-container", LogList)
+        assert log_list.keys[0] == "COMM_01"
+        assert str(log_list.row_for(0).label) == "URGENT | COMM_01"
+        assert str(log_list.row_for(1).label).startswith("- | ")
+
+
+@pytest.fixture
+def log_store():
+    """The app's log store, reset after the test."""
+    store = get_log_store()
+    yield store
+    store.clear()
+
+
+@pytest.mark.asyncio
+async def test_published_logs_are_appended_to_sidebar(log_store):
+    """Test that logs published while the screen is open extend the sidebar."""
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+
+        log_list = app.screen.query_one("#logs-container", LogList)
+        rows = list(log_list.query(LogRow))
+        log_store.publish([("LIVE_01", ">> LIVE FEED\nReactor 3 online.")])
+        await pilot.pause()
+
+        base_keys = LogData.load_default().get_log_keys()
+        assert list(log_list.keys) == [*base_keys, "LIVE_01"]
+        # The sidebar was extended in place, not recomposed
+        assert list(log_list.query(LogRow))[: len(rows)] == rows
+
+        log_list.focus()
+        await pilot.press("end", "enter")
+        await pilot.pause()
+        typewriter = app.screen.query_one("#typewriter")
+        assert typewriter._full_text == ">> LIVE FEED\nReactor 3 online."
+
+        # Logs published while the screen is in the background show up too
+        await pilot.press("escape")
+        await pilot.pause()
+        log_store.publish([("LIVE_02", "Standing by.")])
+        await pilot.click("#logs")
+        await pilot.pause()
+        assert list(log_list.keys)[-2:] == ["LIVE_01", "LIVE_02"]
+
+
+@pytest.mark.asyncio
+async def test_logs_published_while_mounting_are_listed_once(log_store, monkeypatch):
+    """Test that logs published around the screen's subscription are not doubled."""
+    follow = log_store.follow
+
+    def racing_follow(known, callback):
+        # One publish lands after compose(), one right after subscribing
+        log_store.publish([("RACE_01", "Before.")])
+        result = follow(known, callback)
+        log_store.publish([("RACE_02", "After.")])
+        return result
+
+    monkeypatch.setattr(log_store, "follow", racing_follow)
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+        await pilot.pause()
+
+        log_list = app.screen.query_one("#logs-container", LogList)
+        base_keys = LogData.load_default().get_log_keys()
+        assert list(log_list.keys) == [*base_keys, "RACE_01", "RACE_02"]
+
+
+@pytest.mark.asyncio
+async def test_published_logs_respect_active_search(log_store):
+    """Test that only new logs matching the current search are appended."""
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#logs")
+        await pilot.pause()
+
+        await pilot.click("#logs-search")
+        await pilot.press(*"fusion")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        log_store.publish([("CELLS", "Fusion cells restocked."), ("OTHER", "Nothing.")])
+        await pilot.pause()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        log_list = app.screen.query_one("#logs-container", LogList)
+        assert list(log_list.keys) == ["COMM_01", "CELLS"]
+
+
+@pytest.mark.asyncio
+async def test_hacking_screen_access_granted():
+    """Test that entering the password on the HACK screen grants access."""
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#hack")
+        await pilot.pause()
+
+        screen = app.screen
+        board = screen.query_one("#hack-board")
+        assert screen.game is not None
+        assert board.game is screen.game
+
+        board.selected = screen.game.puzzle.password_index
+        await pilot.press("enter")
+        await pilot.pause()
+
+        assert screen.game.solved
+        assert "ACCESS GRANTED" in str(screen.query_one("#hack-status").render())
+
+        await pilot.press("escape")
+        await pilot.pause()
+        assert app.screen.query_one("#menu-container") is not None
+
+
+@pytest.mark.asyncio
+async def test_hacking_screen_hint_selects_best_guess():
+    """Test that the hint key selects the solver's best guess."""
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.click("#hack")
+        await pilot.pause()
+
+        await pilot.press("h")
+        await pilot.pause()
+
+        game = app.screen.game
+        board = app.screen.query_one("#hack-board")
+        assert board.selected == best_guess(game.puzzle, game.remaining)
+
+
+@pytest.mark.asyncio
+async def test_perf_hud_records_and_dumps_samples(tmp_path, monkeypatch):
+    """Test that F12 toggles the perf overlay and F11 dumps its samples."""
+    monkeypatch.setattr("wastelandhub.data.config.xdg_data_home", lambda: tmp_path)
+    update = Screen._on_timer_update
+    app = WastelandHubApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.press("f12")
+        await pilot.pause(0.2)
+        hud = app.screen.query_one(PerfHud)
+
+        sample = app.perf_monitor.sample()
+        assert sample["screen"] == "MainMenuScreen"
+        assert sample["dom_nodes"] > 0
+        assert sample["frames"] > 0  # at least the frame that drew the HUD
+        assert sample["loop_lag_ms_max"] >= 0
+        assert sample["animations"] == 0
+        assert "PERF  MainMenuScreen" in str(hud.render())
+
+        await pilot.press("f11")
+        await pilot.pause()
+        (dump,) = (tmp_path / "wastelandhub" / "perf").glob("perf-*.json")
+        assert json.loads(dump.read_text())["samples"][-1]["dom_nodes"] > 0
+
+        await pilot.press("f12")
+        await pilot.pause()
+        assert not app.screen.query(PerfHud)
+        assert not app.perf_monitor.recording
+        # Textual is left as it was found
+        assert Screen._on_timer_update is update
+
+
+def test_profile_startup_reports_phases():
+    """Test that the startup profiler times every phase up to first paint."""
+    timings = profile_startup()
+    phases = [phase for phase, _ in timings]
+    assert phases[0] == "import textual"
+    assert "first paint of MainMenuScreen" in phases
+    assert all(seconds >= 0 for _, seconds in timings)
+    assert "total to first interactive frame" in format_report(timings)
@@ -0,0 +1,104 @@
+from wastelandhub.data.log_data import LogData
+from wastelandhub.data.log_store import LogStore
+from wastelandhub.data.metadata import LogQuery, MetadataIndex, parse_headers
+
+MEMOS = {
+    "MEMO_A": "FROM: Overseer <overseer@robco.net>\nPRIORITY: LOW\nTime: 09:00:00\n",
+    "MEMO_B": "FROM: J.C. <jcurtis@robco.net>\nPRIORITY: URGENT\nTime: 18:30:00\n",
+    "MEMO_C": "FROM: J.C. <jcurtis@robco.net>\nPRIORITY: URGENT\nTime: 07:15:00\n",
+    "MEMO_D": ">> NO HEADERS\nJust a note.",
+}
+
+
+def test_parse_headers_reads_only_the_header_block():
+    """Test that known labels are read up to the first blank line."""
+    meta = parse_headers("COMM_01", LogData.builtin().get_log("COMM_01"))
+
+    assert meta.sender == "J.C. <jcurtis@robco.net>"
+    assert meta.get("to") == "MaintenanceTeam <maintenance@robco.net>"
+    assert meta.priority == "URGENT"
+    assert meta.time is None
+
+    late = parse_headers("X", ">> TITLE\nTime: 10:00:00\n\nPRIORITY: HIGH")
+    assert late.time == "10:00:00"
+    assert late.priority is None
+
+
+def test_select_by_hash_index_and_sort_by_time():
+    """Test exact lookups by value or address, sorted by a field."""
+    index = MetadataIndex.build(MEMOS)
+
+    assert index.select({"from": "jcurtis@robco.net"}) == ["MEMO_B", "MEMO_C"]
+    assert index.select({"priority": "urgent"}, sort="time") == ["MEMO_C", "MEMO_B"]
+    assert index.select({"priority": "urgent", "from": "overseer"}) == []
+    assert index.select(sort="priority") == ["MEMO_B", "MEMO_C", "MEMO_A", "MEMO_D"]
+
+    # Adding a log inserts it into the sorted index of its fields
+    index.add("MEMO_E", "PRIORITY: HIGH\n")
+    assert index.select(sort="priority", descending=True)[:2] == [
+        "MEMO_A",
+        "MEMO_E",
+    ]
+
+
+def test_sort_by_time_is_chronological():
+    """Test that times sort by when they are, not by their text."""
+    index = MetadataIndex.build(
+        {
+            "LATE": "Time: 9:05 PM\n",
+            "NOON": "Time: 12:00\n",
+            "EARLY": "Time: 7:15:00\n",
+            "UNREADABLE": "Time: teatime\n",
+        }
+    )
+
+    assert index.select(sort="time") == ["EARLY", "NOON", "LATE", "UNREADABLE"]
+
+    sorted_index = index._sorted["time"]
+    index.add("MORNING", "Time: 2077-10-23T09:47:00+00:00\n")
+    index.add("DAWN", "Time: 06:00\n")
+    assert index._sorted["time"] is sorted_index
+    assert index.select(sort="time") == [
+        "DAWN",
+        "EARLY",
+        "NOON",
+        "LATE",
+        "MORNING",
+        "UNREADABLE",
+    ]
+
+
+def test_group_keeps_order_within_groups():
+    index = MetadataIndex.build(MEMOS)
+
+    assert index.group(list(MEMOS), "priority") == {
+        "URGENT": ["MEMO_B", "MEMO_C"],
+        "LOW": ["MEMO_A"],
+        None: ["MEMO_D"],
+    }
+
+
+def test_query_parsing():
+    """Test that field terms are split from text and unknown names stay text."""
+    query = LogQuery.parse('from:jcurtis@robco.net sort:-time reactor x:y group:to')
+
+    assert query.filters == {"sender": "jcurtis@robco.net"}
+    assert (query.sort, query.descending, query.group) == ("time", True, "recipient")
+    assert query.text == "reactor x:y"
+    assert not LogQuery.parse("reactor").structured
+    assert LogQuery.parse('classification:"top secret"').filters == {
+        "classification": "top secret"
+    }
+
+
+def test_log_store_search_combines_text_and_metadata():
+    """Test that store searches filter by headers, including published logs."""
+    store = LogStore()
+    store.publish(MEMOS.items())
+
+    assert store.search("priority:urgent") == ["COMM_01", "MEMO_B", "MEMO_C"]
+    assert store.search("priority:urgent fusion") == ["COMM_01"]
+
+    store.publish([("MEMO_F", "FROM: J.C. <jcurtis@robco.net>\nTime: 06:00:00\n")])
+    assert store.search("from:jcurtis@robco.net sort:time")[:2] == ["MEMO_F", "MEMO_C"]
+    assert store.get_metadata("MEMO_F").time == "06:00:00"
@@ -0,0 +1,69 @@
+import threading
+
+from rich.segment import Segment
+from textual.strip import Strip
+
+from wastelandhub.widgets.render_cache import RenderCache, RenderedLog
+
+
+def rendered(*lines: str) -> RenderedLog:
+    """A RenderedLog with one plain strip per line."""
+    strips = tuple(Strip([Segment(line)]) for line in lines)
+    return RenderedLog(strips, max(len(line) for line in lines))
+
+
+def test_get_counts_hits_and_misses():
+    """Test that lookups are counted and return the cached render."""
+    cache = RenderCache()
+    key = ("COMM_01", 1, 80, "textual-dark")
+    log = rendered("FROM: J.C.", "Stock is red.")
+
+    assert cache.get(key) is None
+    cache.put(key, log)
+    assert cache.get(key) is log
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.nbytes == log.nbytes
+
+
+def test_entries_are_evicted_by_size_least_recently_used_first():
+    """Test that the byte cap evicts the least recently used renders."""
+    log = rendered("x" * 100)
+    cache = RenderCache(max_bytes=log.nbytes * 2)
+    a, b, c = (("LOG", n, 80, "t") for n in range(3))
+    cache.put(a, log)
+    cache.put(b, log)
+    cache.get(a)  # a is now more recent than b
+    cache.put(c, log)
+
+    assert a in cache and c in cache and b not in cache
+    assert cache.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_oversized_render_is_not_cached():
+    """Test that a log bigger than the whole budget is not cached."""
+    cache = RenderCache(max_bytes=10)
+    cache.put(("BIG", 0, 80, "t"), rendered("x" * 100))
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_concurrent_puts_keep_the_budget():
+    """Test that renders cached from several threads are accounted exactly."""
+    log = rendered("x" * 100)
+    cache = RenderCache(max_bytes=log.nbytes * 50)
+
+    def fill(thread: int) -> None:
+        for n in range(500):
+            cache.put(("LOG", thread * 1000 + n, 80, "t"), log)
+            cache.get(("LOG", thread * 1000 + n - 1, 80, "t"))
+
+    threads = [threading.Thread(target=fill, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 50
+    assert cache.nbytes == log.nbytes * 50
+    assert cache.evictions == 8 * 500 - 50
@@ -0,0 +1,69 @@
+from wastelandhub.data.log_data import LogData
+from wastelandhub.data.search_index import SearchIndex, tokenize
+
+
+def test_tokenize():
+    """Test that tokens are lowercase alphanumeric runs."""
+    assert tokenize(">> RE: FUSION CELL-STOCK v2.1") == [
+        "re", "fusion", "cell", "stock", "v2", "1"
+    ]
+
+
+def test_search_exact_and_prefix():
+    """Test that query words match whole tokens and prefixes."""
+    index = SearchIndex.build(LogData.builtin().logs)
+
+    assert index.search("fusion") == ["COMM_01"]
+    assert index.search("FUS") == ["COMM_01"]
+    assert "RESEARCH" in index.search("purif")
+
+
+def test_search_matches_keys():
+    """Test that log IDs are searchable as well as bodies."""
+    index = SearchIndex.build(LogData.builtin().logs)
+
+    assert index.search("diary") == ["DIARY_05"]
+
+
+def test_search_requires_every_word():
+    """Test that multi-word queries intersect their matches."""
+    index = SearchIndex.build(LogData.builtin().logs)
+
+    assert index.search("reactor cells") == ["COMM_01"]
+    assert index.search("reactor ghoul") == []
+
+
+def test_search_empty_query_returns_all_in_order():
+    """Test that an empty query lists every log in insertion order."""
+    logs = LogData.builtin().logs
+    index = SearchIndex.build(logs)
+
+    assert index.search("") == list(logs)
+    assert index.search("  >> ") == list(logs)
+
+
+def test_incremental_add():
+    """Test that logs added after the build are found, including new tokens."""
+    index = SearchIndex.build(LogData.builtin().logs)
+    index.add("VAULT_101", ">> OVERSEER NOTES\nThe reactor is stable.")
+    index.add_many([("VAULT_111", "Cryogenic pods online."), ("EMPTY", "")])
+
+    assert len(index) == 9
+    assert index.search("overs") == ["VAULT_101"]
+    assert index.search("reactor") == ["COMM_01", "VAULT_101"]
+    assert index.search("cryo") == ["VAULT_111"]
+
+    # Re-adding an indexed key leaves it unchanged
+    index.add("VAULT_101", "quarantine protocol")
+    assert index.search("quarantine") == []
+
+
+def test_add_many_keeps_vocabulary_sorted():
+    """Test that small and large batches of new tokens are merged in order."""
+    index = SearchIndex.build(LogData.builtin().logs)
+    index.add_many([("FEW", "zebra aardvark")])
+    index.add_many((f"LOG_{i}", f"word{i:03d} extra{i}") for i in range(100))
+
+    assert index._vocabulary == sorted(index._postings)
+    assert index.search("aard") == ["FEW"]
+    assert index.search("word05") == [f"LOG_{i}" for i in range(50, 60)]
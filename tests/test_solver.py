@@ -0,0 +1,66 @@
+import random
+
+from wastelandhub.hacking.engine import HackingGame, Puzzle, generate_puzzle
+from wastelandhub.hacking.solver import (
+    best_guess,
+    calibrated_puzzle,
+    expected_guesses,
+    guess_cost,
+    partition_sizes,
+    target_guesses,
+)
+
+
+def naive_partitions(puzzle, guess, candidates):
+    sizes = [0] * (puzzle.word_length + 1)
+    for j in candidates:
+        sizes[sum(a == b for a, b in zip(puzzle.words[guess], puzzle.words[j]))] += 1
+    return sizes
+
+
+def test_partition_sizes_match_naive():
+    """Test bitset partition counts against a direct comparison."""
+    puzzle = generate_puzzle(100, random.Random(2))
+    game = HackingGame(puzzle)
+    game.guess(0 if puzzle.password_index else 1)
+    for guess in range(len(puzzle.words)):
+        assert partition_sizes(puzzle, guess, game.remaining) == naive_partitions(
+            puzzle, guess, game.candidates()
+        )
+
+
+def test_best_guess_minimizes_cost():
+    """Test that the chosen guess has the lowest cost of all words."""
+    puzzle = generate_puzzle(80, random.Random(4))
+    for strategy in ("expected", "worst"):
+        guess = best_guess(puzzle, strategy=strategy)
+        costs = [
+            guess_cost(puzzle, g, puzzle.all_words, strategy)
+            for g in range(len(puzzle.words))
+        ]
+        assert costs[guess] == min(costs)
+
+
+def test_solver_always_wins_in_time():
+    """Test that following the solver finds every password within 4 guesses."""
+    puzzle = generate_puzzle(100, random.Random(9))
+    for secret in range(len(puzzle.words)):
+        game = HackingGame(Puzzle.create(puzzle.words, secret))
+        while not game.over:
+            game.guess(best_guess(game.puzzle, game.remaining))
+        assert game.solved
+
+
+def test_expected_guesses_small_board():
+    """Test expected guesses on a board where guesses give no information."""
+    # Every pair of words has likeness 0, so guesses can only go one by one
+    puzzle = Puzzle.create(["ABCD", "EFGH", "IJKL"], 0)
+    assert expected_guesses(puzzle) == (1 + 2 + 3) / 3
+
+
+def test_calibrated_puzzle_tracks_difficulty():
+    """Test that calibrated boards land closer to the target than random ones."""
+    rng = random.Random(11)
+    for difficulty in (0, 100):
+        puzzle = calibrated_puzzle(difficulty, rng, candidates=20)
+        assert abs(expected_guesses(puzzle) - target_guesses(difficulty)) < 0.3
@@ -0,0 +1,290 @@
+import pytest
+from textual.app import App, ComposeResult
+
+from wastelandhub.data.log_data import LogData
+from wastelandhub.widgets.animation import AnimationClock, get_animation_clock
+from wastelandhub.widgets.render_cache import RenderCache
+from wastelandhub.widgets.typewriter import Typewriter
+
+
+class TypewriterApp(App[None]):
+    """Minimal app hosting a single Typewriter."""
+
+    def compose(self) -> ComposeResult:
+        yield Typewriter(id="typewriter")
+
+
+def rendered_text(typewriter: Typewriter) -> list[str]:
+    """Return the plain text of every rendered line."""
+    return [strip.text.rstrip() for strip in typewriter.lines]
+
+
+@pytest.mark.asyncio
+async def test_incremental_reveal_matches_full_text():
+    """Test that revealing in batches renders the same lines as the full text."""
+    text = LogData.load_default().get_log("COMM_01")
+    app = TypewriterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.start(text, cps=10)
+        typewriter.stop()
+
+        # Reveal a few characters at a time, crossing line boundaries
+        for end in range(0, len(text) + 7, 7):
+            typewriter._reveal(end)
+        typewriter._finish()
+
+        assert rendered_text(typewriter) == text.splitlines()
+
+
+@pytest.mark.asyncio
+async def test_long_line_reveal_renders_only_new_characters(monkeypatch):
+    """Test that typing one huge line renders each character about once."""
+    text = "".join(f"{n:05d}|" for n in range(20_000))  # 120k chars, no newline
+    app = TypewriterApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.start(text, cps=10)
+        typewriter.stop()
+
+        rendered = 0
+        render_unwrapped = typewriter._render_unwrapped
+
+        def counting(chunk: str):
+            nonlocal rendered
+            rendered += len(chunk)
+            return render_unwrapped(chunk)
+
+        monkeypatch.setattr(typewriter, "_render_unwrapped", counting)
+        for end in range(0, len(text) + 100, 100):
+            typewriter._reveal(end)
+        assert rendered == len(text)
+        assert typewriter.lines == []  # Still being typed
+        assert typewriter.virtual_size.width == len(text)
+
+        await pilot.pause()  # Lay out the horizontal scrollbar
+        width = typewriter.scrollable_content_region.width
+        typewriter.scroll_to(x=len(text) - width, animate=False, immediate=True)
+        assert typewriter.render_line(0).text == text[-width:]
+
+        typewriter._finish()
+        assert rendered_text(typewriter) == [text]
+
+
+@pytest.mark.asyncio
+async def test_skip_to_end_keeps_revealed_lines():
+    """Test that skip_to_end only renders text that is not yet on screen."""
+    text = LogData.load_default().get_log("DOOR_CTRL")
+    app = TypewriterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.start(text, cps=10)
+        typewriter.stop()
+
+        typewriter._reveal(text.index("\n") + 5)
+        first_line = typewriter.lines[0]
+
+        typewriter.skip_to_end()
+
+        assert typewriter.lines[0] is first_line
+        assert rendered_text(typewriter) == text.splitlines()
+        assert not typewriter.is_typing
+
+
+@pytest.mark.asyncio
+async def test_fast_cps_reveals_several_chars_per_frame():
+    """Test that cps above the frame rate is batched into frame-sized ticks."""
+    text = "x" * 500
+    app = TypewriterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.start(text, cps=1000)
+
+        assert typewriter._animation is not None
+        assert typewriter._animation.interval == pytest.approx(
+            1.0 / AnimationClock.FRAME_RATE
+        )
+
+        await pilot.pause(0.1)
+        assert typewriter._current_index > 1
+
+
+@pytest.mark.asyncio
+async def test_typing_runs_off_the_app_clock_which_idles_when_done():
+    """Test that the shared animation clock schedules nothing once typing ends."""
+    app = TypewriterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        clock = get_animation_clock(app)
+        assert len(clock) == 0 and clock._timer is None
+
+        typewriter.start("x" * 30, cps=300)
+        assert len(clock) == 1 and clock._timer is not None
+
+        await pilot.pause(0.3)
+        assert typewriter._current_index == 30
+        assert not typewriter.is_typing
+        assert len(clock) == 0 and clock._timer is None
+        assert clock.frames > 0
+
+
+@pytest.mark.asyncio
+async def test_reopening_a_log_types_it_again_from_cached_render():
+    """Test that a cached log is typed again, replaying the cached strips."""
+    text = LogData.load_default().get_log("SECURITY")
+    app = TypewriterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.render_cache = RenderCache()
+        typewriter.start(text, cps=10, key="SECURITY")
+        typewriter.skip_to_end()
+        lines = list(typewriter.lines)
+        assert len(typewriter.render_cache) == 1
+
+        typewriter.start("other text", cps=10, key="OTHER")
+        typewriter.start(text, cps=10, key="SECURITY")
+        assert typewriter.is_typing
+        assert typewriter.lines == []
+
+        # Completed lines are the very same strips: nothing was rendered again
+        typewriter._reveal(text.index("\n", text.index("\n") + 1) + 3)
+        assert typewriter.lines[0] is lines[0] and typewriter.lines[1] is lines[1]
+
+        typewriter.skip_to_end()
+        assert not typewriter.is_typing
+        assert all(a is b for a, b in zip(typewriter.lines, lines, strict=True))
+
+        # A changed text under the same key is a different cache entry
+        typewriter.start(text + "\nAddendum.", cps=10, key="SECURITY")
+        assert typewriter._replay is None
+
+
+@pytest.mark.asyncio
+async def test_resize_rerenders_from_cache_per_width():
+    """Test that a wrapped log is re-rendered on resize and cached per width."""
+
+    class WrappingTypewriterApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Typewriter(wrap=True, min_width=20)
+
+    text = "reactor " * 20 + "\nshort line"
+    app = WrappingTypewriterApp()
+    async with app.run_test(size=(120, 24)) as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.render_cache = cache = RenderCache()
+        typewriter.start(text, cps=10, key="WIDE")
+        typewriter.skip_to_end()
+        wide_lines = list(typewriter.lines)
+
+        await pilot.resize_terminal(60, 24)
+        await pilot.pause()
+        assert len(cache) == 2
+        assert len(typewriter.lines) > len(wide_lines)
+
+        await pilot.resize_terminal(120, 24)
+        await pilot.pause()
+        assert cache.hits >= 1
+        assert all(a is b for a, b in zip(typewriter.lines, wide_lines, strict=True))
+
+
+@pytest.mark.asyncio
+async def test_newest_characters_glow_while_typing():
+    """Test that only the line being typed glows, and only until typing ends."""
+    app = TypewriterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.start("FIRST LINE\nSECOND", cps=1)
+        typewriter._reveal(len("FIRST LINE\nSEC"))
+
+        def bold_cells(y: int) -> str:
+            return "".join(
+                segment.text
+                for segment in typewriter.render_line(y)
+                if segment.style and segment.style.bold
+            )
+
+        assert bold_cells(0) == ""
+        assert bold_cells(1) == "EC"
+
+        typewriter.skip_to_end()
+        assert bold_cells(1) == ""
+
+
+@pytest.mark.asyncio
+async def test_scanlines_dim_every_other_screen_row():
+    """Test that scanlines are off by default and dim alternate screen rows."""
+    app = TypewriterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.start("ROW 0\nROW 1\nROW 2", cps=10)
+        typewriter.skip_to_end()
+        plain = [typewriter.render_line(y) for y in range(3)]
+
+        typewriter.scanlines = True
+        top = typewriter.content_region.y
+        for y, strip in enumerate(plain):
+            dimmed = typewriter.render_line(y)
+            assert dimmed.text == strip.text
+            assert (dimmed == strip) == ((top + y) % 2 == 0)
+
+
+@pytest.mark.asyncio
+async def test_huge_log_types_first_screenful_then_pages():
+    """Test that a huge log is typed one screenful deep and rendered on demand."""
+    text = "".join(f"DIAGNOSTIC {n:06d} nominal\n" for n in range(20_000))
+    app = TypewriterApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.PAGED_THRESHOLD = 1000
+        typewriter.render_cache = RenderCache()
+        typewriter.start(text, cps=10, key="DUMP")
+        height = typewriter.scrollable_content_region.height
+
+        assert typewriter._full_text.count("\n") == height - 1
+        typewriter.skip_to_end()
+        assert typewriter.lines == []
+        assert typewriter.render_line(0).text.startswith("DIAGNOSTIC 000000")
+
+        # The rest of the log is indexed in the background
+        await pilot.pause(0.2)
+        assert typewriter.virtual_size.height == 20_000
+
+        for y in range(0, 20_000, height):
+            typewriter.scroll_to(y=y, animate=False, immediate=True)
+            top = typewriter.scroll_offset.y
+            assert typewriter.render_line(0).text.startswith(f"DIAGNOSTIC {top:06d}")
+        assert len(typewriter._page_strips) <= height * (2 * typewriter.PAGE_BUFFER + 3)
+        assert len(typewriter.render_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_wrapping_typewriter_does_not_page():
+    """Test that a huge log still wraps, since paged lines are never wrapped."""
+
+    class WrappingTypewriterApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Typewriter(wrap=True, min_width=20)
+
+    text = "reactor " * 50 + "\n" + "coolant " * 50
+    app = WrappingTypewriterApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        await pilot.pause()
+        typewriter = app.query_one(Typewriter)
+        typewriter.PAGED_THRESHOLD = 100
+        typewriter.render_cache = RenderCache()
+        typewriter.start(text, cps=10)
+        typewriter.skip_to_end()
+
+        assert typewriter._pages is None
+        assert len(typewriter.lines) > 2
+        assert all(len(line.text.rstrip()) <= 80 for line in typewriter.lines)